@@ -63,9 +63,9 @@ def extract_events_example(filename):
             record = evio_file.get_record(record_idx)
 
             # Get event offsets and lengths
-            event_infos = record.get_event_offsets()
+            event_offsets, event_lengths = record.get_event_offsets()
 
-            for i, (evt_offset, evt_len) in enumerate(event_infos):
+            for i, (evt_offset, evt_len) in enumerate(zip(event_offsets.tolist(), event_lengths.tolist())):
                 if evt_len > 88:
                     # Get the last word from the event data
                     last_word_offset = evt_offset + evt_len - 4
@@ -1,33 +1,26 @@
 import argparse
 import numpy as np
 from pyevio import EvioFile
-from pyevio.decoders.fadc250_triggered import FaDecoder, FadcDataStruct
+from pyevio.decoders.fadc250_triggered import MAXRAW, decode_fadc_words
+from pyevio.dtypes import to_native
 import matplotlib.pyplot as plt
 import os
 
-def decode_fadc_bank(bank, decoder, verbose=False):
+def decode_fadc_banks(banks):
     """
-    Decode a single FADC bank.
+    Decode the FADC banks of one event at once.
 
     Args:
-        bank: Bank object to decode
-        decoder: FaDecoder instance to use
-        verbose: Enable verbose output
+        banks: Bank objects to decode
 
     Returns:
-        decoder: Updated decoder with processed data
+        dict: Structured arrays from decode_fadc_words, with the index of every
+        item's bank in banks
     """
-    # Get the raw data from the bank
-    payload = bank.get_data()
-
-    # Convert payload to words
-    words = np.frombuffer(payload, dtype=np.dtype(f'{bank.endian}u4'))
-
-    # Process each word with the decoder
-    for word in words:
-        decoder.faDataDecode(int(word), verbose=verbose)
-
-    return decoder
+    # Words of all banks back to back, with the start of every bank
+    words = [to_native(np.frombuffer(bank.get_data(), dtype=np.dtype(f'{bank.endian}u4'))) for bank in banks]
+    offsets = np.cumsum([0] + [len(bank_words) for bank_words in words])
+    return decode_fadc_words(np.concatenate(words) if words else np.zeros(0, dtype=np.uint32), offsets)
 
 def process_event(event, event_index, verbose=False):
     """
@@ -65,7 +58,7 @@ def process_event(event, event_index, verbose=False):
 
         # Initialize data structures
         FADC_NCHAN = 16
-        MAX_SAMPLES = 4096
+        MAX_SAMPLES = MAXRAW
 
         # Data structures to hold results
         event_data = {
@@ -83,43 +76,47 @@ def process_event(event, event_index, verbose=False):
             'has_data': False
         }
 
-        # Process all FADC banks
-        for bank in children[1:]:
-            # Create a new decoder for each bank
-            decoder = FaDecoder()
-
-            # Decode the bank
-            decoder = decode_fadc_bank(bank, decoder, verbose)
-
-            # Check if we have raw data
-            for chan in range(FADC_NCHAN):
-                if decoder.fadc_nhit[chan] > 0:
-                    # Update event data with info from this channel
-                    event_data['info']['slot_id'] = decoder.fadc_data.slot_id_hd
-                    event_data['info']['evt_num'] = decoder.fadc_data.evt_num_1
-                    event_data['info']['time'] = decoder.fadc_trigtime
-
-                    if chan not in event_data['info']['channels']:
-                        event_data['info']['channels'].append(chan)
-
-                    event_data['info']['widths'][chan] = decoder.fadc_data.width
-                    event_data['info']['integrals'][chan] = decoder.fadc_int[chan]
-                    event_data['info']['overs'][chan] = bool(decoder.fadc_data.over)
-
-                    # Copy the raw data to our waveform array
-                    if hasattr(decoder, 'frawdata'):
-                        # Determine the number of valid samples
-                        valid_samples = 0
-                        for i, sample in enumerate(decoder.frawdata[chan]):
-                            if sample > 0:  # Assuming 0 means no data
-                                valid_samples = i + 1
-                                # Update peak if this sample is larger
-                                if sample > event_data['info']['peaks'][chan]:
-                                    event_data['info']['peaks'][chan] = sample
-
-                        # Copy data to waveform array
-                        event_data['waveforms'][chan, :valid_samples] = decoder.frawdata[chan][:valid_samples]
-                        event_data['has_data'] = True
+        # Decode all FADC banks at once; later banks overwrite the channels of earlier ones
+        decoded = decode_fadc_banks(children[1:])
+        for bank in range(len(children) - 1):
+            rows = {name: items[items['bank'] == bank] for name, items in decoded.items()}
+            windows, integrals, raw = rows['windows'], rows['pulse_integrals'], rows['raw_samples']
+
+            # Channels with hits: window raw data or pulse integrals
+            hit_chans = np.union1d(windows['chan'], integrals['chan'])
+            if len(hit_chans) == 0:
+                continue
+
+            info = event_data['info']
+            if len(rows['block_headers']):
+                info['slot_id'] = rows['block_headers']['slot'][-1]
+            if len(rows['event_headers']):
+                info['evt_num'] = rows['event_headers']['evt_num'][-1]
+            if len(rows['trigger_times']):
+                info['time'] = rows['trigger_times']['time'][-1]
+
+            for chan in hit_chans.tolist():
+                if chan not in info['channels']:
+                    info['channels'].append(chan)
+
+                chan_windows = windows['width'][windows['chan'] == chan]
+                if len(chan_windows):
+                    info['widths'][chan] = chan_windows[-1]
+                chan_integrals = integrals['integral'][integrals['chan'] == chan]
+                info['integrals'][chan] = chan_integrals[0] if len(chan_integrals) else 0
+                chan_sums = rows['window_sums']['over'][rows['window_sums']['chan'] == chan]
+                info['overs'][chan] = bool(chan_sums[-1]) if len(chan_sums) else False
+
+                # Raw samples at their positions in the channel buffer, later ones overwriting earlier ones
+                chan_raw = raw[raw['chan'] == chan]
+                buffer = np.zeros(MAXRAW, dtype=np.int64)
+                buffer[chan_raw['sample']] = chan_raw['adc']
+                non_zero = np.flatnonzero(buffer > 0)  # Assuming 0 means no data
+                if len(non_zero):
+                    valid_samples = non_zero[-1] + 1
+                    info['peaks'][chan] = max(info['peaks'][chan], buffer.max())
+                    event_data['waveforms'][chan, :valid_samples] = buffer[:valid_samples]
+                    event_data['has_data'] = True
 
         if event_data['has_data']:
             return event_data
@@ -26,7 +26,8 @@ def direct_events_loading2(filename, start_event=0, end_event=100000, event_size
 
         # Get event offsets directly
         t0 = time.time()
-        event_infos = record.get_event_offsets(start_event, end_event)
+        event_offsets, event_lengths = record.get_event_offsets(start_event, end_event)
+        event_infos = list(zip(event_offsets.tolist(), event_lengths.tolist()))
         t1 = time.time()
         print(f"Got {len(event_infos)} event offsets in {(t1-t0)*1000:.2f} ms")
 
@@ -89,7 +90,8 @@ def direct_events_loading(filename, start_event=0, end_event=100, event_size_byt
 
         # Get event offsets directly
         t0 = time.time()
-        event_info = record.get_event_offsets(start_event, end_event)
+        event_offsets, event_lengths = record.get_event_offsets(start_event, end_event)
+        event_info = list(zip(event_offsets.tolist(), event_lengths.tolist()))
         t1 = time.time()
         print(f"Got {len(event_info)} event offsets in {(t1-t0)*1000:.2f} ms")
 
@@ -4,10 +4,16 @@ pyevio - A Python library for reading and introspecting EVIO v6 files.
 
 # Export core classes
 from pyevio.evio_file import EvioFile
+from pyevio.file_index import FileIndex
 from pyevio.file_header import FileHeader
 from pyevio.record_header import RecordHeader
-from pyevio.bank import Bank
-from pyevio.roc_time_slice_bank import RocTimeSliceBank, StreamInfoBank, PayloadBank
+from pyevio.bank import Bank, Segment, TagSegment
+from pyevio.bank_table import BankTable
+from pyevio.composite import CompositeFormat, compile_format
+from pyevio.event_batch import EventBatch
+from pyevio.selection import Selection
+from pyevio.roc_time_slice_bank import RocTimeSliceBank, StreamInfoBank, PayloadBank, PayloadLayout
+from pyevio.frame_builder import Frame, FrameBuilder
 
 # Export utility functions
 from pyevio.utils import make_hex_dump
@@ -4,11 +4,16 @@ from typing import List, Tuple, Optional, Dict, Any, Union
 import numpy as np
 from datetime import datetime
 
-from pyevio.utils import make_hex_dump
+from pyevio.composite import parse_composite
+from pyevio.dtypes import evio_dtype, to_native
+from pyevio.utils import make_hex_dump, buffer_view, buffer_bytes
 
 
 class BankHeader:
     """Base class for bank headers."""
+
+    __slots__ = ('length', 'tag', 'pad', 'data_type', 'num', 'offset', 'type_name', 'error')
+
     def __init__(self):
         self.length = None
         self.tag = None
@@ -18,6 +23,9 @@ class BankHeader:
         self.offset = None
         self.type_name = "Unknown"
 
+        # Structured description of the first inconsistency found while walking the children
+        self.error: Optional[Dict[str, Any]] = None
+
 
 class Bank(BankHeader):
     """
@@ -27,9 +35,15 @@ class Bank(BankHeader):
     - Word 1: length
     - Word 2: tag (16 bits) | pad (2 bits) | type (6 bits) | num (8 bits)
 
-    Banks can contain data or other banks, depending on the data_type.
+    The length is the number of words following the length word, so a bank
+    spans length + 1 words. Banks can contain data or other banks, depending
+    on the data_type.
     """
 
+    # Subclasses for special bank types (e.g. RocTimeSliceBank) still get a __dict__
+    __slots__ = ('mm', 'endian', 'header_size', 'data_offset', 'data_length', 'size', 'end_offset',
+                 '_children', '_children_recover')
+
     # Data type constants
     TYPE_UNKNOWN32 = 0x0
     TYPE_UINT32 = 0x1
@@ -50,21 +64,6 @@ class Bank(BankHeader):
     TYPE_BANK2 = 0x10
     TYPE_SEGMENT2 = 0x20
 
-    # Mapping from data types to numpy dtypes
-    _NUMPY_DTYPES = {
-        TYPE_UNKNOWN32: np.uint32,
-        TYPE_UINT32: np.uint32,
-        TYPE_FLOAT32: np.float32,
-        TYPE_INT16: np.int16,
-        TYPE_UINT16: np.uint16,
-        TYPE_INT8: np.int8,
-        TYPE_UINT8: np.uint8,
-        TYPE_FLOAT64: np.float64,
-        TYPE_INT64: np.int64,
-        TYPE_UINT64: np.uint64,
-        TYPE_INT32: np.int32
-    }
-
     def __init__(self, mm: mmap.mmap, offset: int, endian: str = '<'):
         """
         Initialize a Bank object.
@@ -82,17 +81,18 @@ class Bank(BankHeader):
         # Parse bank header
         self._parse_header()
 
-        # Calculate data offset and size
+        # Calculate data offset and size (the bank spans its length + 1 words)
         self.header_size = 8  # 2 words * 4 bytes
         self.data_offset = self.offset + self.header_size
-        self.data_length = (self.length * 4) - self.header_size
-        self.size = self.length * 4
+        self.size = (self.length + 1) * 4
+        self.data_length = self.size - self.header_size
 
         # End offset for this bank
         self.end_offset = self.offset + self.size
 
         # Child banks (will be parsed on demand)
         self._children = None
+        self._children_recover = False
 
     def _parse_header(self):
         """Parse the bank header from the buffer."""
@@ -138,12 +138,22 @@ class Bank(BankHeader):
         Returns:
             True if this bank contains other banks, False otherwise
         """
-        return self.data_type in (self.TYPE_BANK, self.TYPE_BANK2, self.TYPE_SEGMENT, self.TYPE_SEGMENT2)
+        return self.data_type in CHILD_TYPES
 
-    def get_children(self) -> List['Bank']:
+    def get_children(self, recover: bool = False) -> List['Bank']:
         """
         Get child banks if this is a container bank.
 
+        Child lengths are validated against the EVIO rule that a bank spans its
+        length + 1 words, and the walk stops at the first inconsistency, which is
+        then described in the error attribute of this bank. With recover=True a
+        child whose length looks wrong is instead skipped one word at a time until
+        a plausible bank is found again. Valid children are walked the same way
+        in both modes.
+
+        Args:
+            recover: Resynchronize past inconsistent children instead of stopping
+
         Returns:
             List of Bank objects
         """
@@ -151,103 +161,179 @@ class Bank(BankHeader):
         if not self.is_container():
             return []
 
-        # Return cached children if already parsed
-        if self._children is not None:
+        # Return cached children if already parsed in the same mode
+        if self._children is not None and self._children_recover == recover:
             return self._children
 
-        # Initialize empty children list
-        self._children = []
+        self.error = None
+        self._children_recover = recover
+
+        # Segments and tagsegments have one-word headers and are walked separately
+        child_class = CHILD_TYPES[self.data_type]
+        if child_class is not Bank:
+            self._children = self._get_segment_children(child_class)
+        elif recover:
+            self._children = self._get_children_recover()
+        else:
+            self._children = self._get_children_strict()
+        return self._children
+
+    def _set_error(self, offset: int, length: int, message: str):
+        """Record the first inconsistency found while walking the children."""
+        self.error = {
+            "offset": offset,
+            "length": length,
+            "parent_offset": self.offset,
+            "message": message
+        }
 
-        # Start from the beginning of the data section
+    def _get_children_strict(self) -> List['Bank']:
+        """
+        Walk the child banks, stopping at the first one whose length is inconsistent.
+
+        Returns:
+            List of child Bank objects found before the inconsistency
+        """
+        children = []
         current_offset = self.data_offset
+        # A bank spans its length + 1 words, as in BankTable
         end_offset = self.end_offset
 
         while current_offset < end_offset:
-            # We need at least 4 bytes to read a length
-            if current_offset + 4 > end_offset:
+            if current_offset + 8 > end_offset:
+                self._set_error(current_offset, 0, "Trailing data shorter than a bank header")
+                break
+
+            bank_length = struct.unpack(self.endian + 'I', self.mm[current_offset:current_offset+4])[0]
+            if bank_length < 1:
+                self._set_error(current_offset, bank_length, "Bank length shorter than its header")
+                break
+            if current_offset + (bank_length + 1) * 4 > end_offset:
+                self._set_error(current_offset, bank_length, "Bank overruns its parent")
                 break
 
-            try:
-                # Read bank length
-                bank_length = struct.unpack(self.endian + 'I',
-                                            self.mm[current_offset:current_offset+4])[0]
-
-                # Basic sanity check: bank shouldn't exceed parent boundary
-                if current_offset + (bank_length * 4) > end_offset:
-                    # If we're near the end (just a word or two left), this might be data padding
-                    # Skip to the next word and continue
-                    current_offset += 4
-                    continue
-
-                # Even a length of 1 is valid for data banks (just the length word itself)
-                # In this case the bank has no additional data beyond the length word
-
-                # Check if we have enough space for this bank
-                if bank_length == 0:
-                    # Zero-length banks are invalid - skip this word
-                    current_offset += 4
-                    continue
-
-                if current_offset + (bank_length * 4) > end_offset:
-                    # Bank goes beyond parent boundary - skip this word
-                    current_offset += 4
-                    continue
-
-                # Try to create bank object
-                try:
-                    child = Bank.from_buffer(self.mm, current_offset, self.endian)
-
-                    # Add to children
-                    self._children.append(child)
-
-                    # Move to next bank by adding this bank's length
-                    current_offset += bank_length * 4
-
-                except Exception as e:
-                    # Error creating bank - skip ahead
-                    if self._children and hasattr(self, 'verbose') and self.verbose:
-                        print(f"Error parsing bank at 0x{current_offset:X}: {str(e)}")
-                    current_offset += 4
-                    continue
-
-            except Exception as e:
-                # Error reading/processing data - skip ahead
+            children.append(Bank(self.mm, current_offset, self.endian))
+            current_offset += (bank_length + 1) * 4
+
+        return children
+
+    def _get_children_recover(self) -> List['Bank']:
+        """
+        Walk the child banks, skipping a word and retrying whenever a length looks wrong.
+
+        Returns:
+            List of child Bank objects
+        """
+        children = []
+        current_offset = self.data_offset
+        end_offset = self.end_offset
+
+        # A child needs a full 2-word header and must fit its length + 1 words in the parent
+        while current_offset + 8 <= end_offset:
+            bank_length = struct.unpack(self.endian + 'I', self.mm[current_offset:current_offset+4])[0]
+            if bank_length < 1 or current_offset + (bank_length + 1) * 4 > end_offset:
                 current_offset += 4
+                continue
 
-        return self._children
+            children.append(Bank(self.mm, current_offset, self.endian))
+            current_offset += (bank_length + 1) * 4
+
+        return children
+
+    def _get_segment_children(self, child_class) -> List['Segment']:
+        """
+        Walk the one-word-header children (segments or tagsegments) of this container.
+
+        A segment occupies its length + 1 words, so children follow each other
+        directly. Walking stops at the first child that does not fit.
+
+        Args:
+            child_class: Segment or TagSegment
 
-    def get_data(self) -> bytes:
+        Returns:
+            List of child objects
+        """
+        children = []
+        current_offset = self.data_offset
+        end_offset = self.end_offset
+
+        while current_offset + 4 <= end_offset:
+            word = struct.unpack(self.endian + 'I', self.mm[current_offset:current_offset+4])[0]
+            child_size = ((word & 0xFFFF) + 1) * 4
+            if current_offset + child_size > end_offset:
+                self._set_error(current_offset, word & 0xFFFF, "Segment overruns its parent")
+                break
+
+            children.append(child_class(self.mm, current_offset, self.endian))
+            current_offset += child_size
+
+        return children
+
+    def get_data(self, copy: bool = False) -> Union[memoryview, bytes]:
         """
         Get the raw data for this bank.
 
+        Args:
+            copy: Return a bytes copy instead of a read-only view of the file
+
         Returns:
-            Bytes object containing the raw bank data
+            memoryview (or bytes if copy is True) containing the raw bank data
         """
-        return self.mm[self.data_offset:self.data_offset + self.data_length + 4]
+        return buffer_bytes(self.mm, self.data_offset, self.end_offset, copy)
 
-    def to_numpy(self) -> Optional[np.ndarray]:
+    def to_numpy(self, copy: bool = False, native: bool = False) -> Optional[np.ndarray]:
         """
         Convert bank data to a NumPy array if possible.
 
+        Args:
+            copy: Return an independent, writable copy instead of a read-only view of the file
+            native: Return the data in native byte order. Data in the file's byte
+                order is only swapped (copied) when this is set
+
         Returns:
             NumPy array containing the data, or None if not convertible
         """
         if self.is_container():
             return None
 
-        dtype = self._NUMPY_DTYPES.get(self.data_type)
+        if self.data_type == self.TYPE_COMPOSITE:
+            composite_format, data = self.get_composite(copy)
+            if not composite_format.is_fixed:
+                return None
+            return to_native(data) if native else data
+
+        dtype = evio_dtype(self.data_type, self.endian)
         if dtype is None:
             return None
 
-        # Calculate the number of elements
-        element_size = np.dtype(dtype).itemsize
-        num_elements = self.data_length // element_size
+        # Create NumPy array over the buffer
+        data = buffer_view(self.mm, self.data_offset, self.data_length // dtype.itemsize, dtype, copy)
+        return to_native(data) if native else data
+
+    def get_composite(self, copy: bool = False):
+        """
+        Decode composite (type 0xF) data.
+
+        The format string is compiled once per distinct format and shared by all banks using it.
+
+        Args:
+            copy: Return an independent copy instead of a read-only view (fixed formats only)
+
+        Returns:
+            Tuple of (CompositeFormat, data) where data is a structured NumPy array
+            for fixed-stride formats, otherwise a flat list of values
+
+        Raises:
+            ValueError: If this is not a composite bank or the composite data is malformed
+        """
+        if self.data_type != self.TYPE_COMPOSITE:
+            raise ValueError(f"Bank type 0x{self.data_type:02X} is not composite")
 
-        # Create NumPy array from buffer
-        return np.frombuffer(
-            self.mm[self.data_offset:self.data_offset + (num_elements * element_size)],
-            dtype=dtype
-        )
+        composite_data = self.get_data()
+        composite_format, data_offset, data_length = parse_composite(
+            composite_data, 0, len(composite_data), self.endian)
+        return composite_format, composite_format.decode(composite_data, data_offset, data_length,
+                                                         self.endian, copy)
 
     def to_string(self) -> Optional[str]:
         """
@@ -285,14 +371,14 @@ class Bank(BankHeader):
             String containing formatted hexdump
         """
         display_len = min(max_bytes, self.data_length)
-        data = self.mm[self.data_offset:self.data_offset + display_len + 4]
+        data = self.mm[self.data_offset:self.data_offset + display_len]
         return make_hex_dump(data, title=title or f"Bank Data at offset 0x{self.data_offset:X}")
 
     def __str__(self) -> str:
         """Return string representation of the bank header."""
         return f"""Bank (0x{self.tag:04x}, {self.type_name}):
   Offset:    0x{self.offset:08x}
-  Length:    {self.length} words ({self.length * 4} bytes)
+  Length:    {self.length} words ({self.size} bytes)
   Tag:       0x{self.tag:04x}
   Pad:       {self.pad}
   Data Type: 0x{self.data_type:02x}
@@ -301,3 +387,114 @@ class Bank(BankHeader):
     def __repr__(self) -> str:
         """Return a string representation for debugging."""
         return f"Bank(offset=0x{self.offset:X}, tag=0x{self.tag:04X}, type=0x{self.data_type:02X})"
+
+
+class Segment(Bank):
+    """
+    Represents a Segment with a one-word header.
+
+    Structure:
+    - Word 1: tag (8 bits) | pad (2 bits) | type (6 bits) | length (16 bits)
+
+    The length is the number of words following the header. Segments have no num.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, mm: mmap.mmap, offset: int, endian: str = '<'):
+        """
+        Initialize a Segment object.
+
+        Args:
+            mm: Memory-mapped file containing the segment
+            offset: Byte offset in the file where the segment starts
+            endian: Endianness ('<' for little endian, '>' for big endian)
+        """
+        BankHeader.__init__(self)
+        self.mm = mm
+        self.offset = offset
+        self.endian = endian
+
+        # Parse segment header
+        self._parse_header()
+
+        # Calculate data offset and size
+        self.header_size = 4
+        self.data_offset = self.offset + self.header_size
+        self.data_length = self.length * 4
+        self.size = self.header_size + self.data_length
+
+        # End offset for this segment
+        self.end_offset = self.offset + self.size
+
+        # Child segments or banks (will be parsed on demand)
+        self._children = None
+        self._children_recover = False
+
+    def _parse_header(self):
+        """Parse the one-word segment header from the buffer."""
+        word = struct.unpack(self.endian + 'I', self.mm[self.offset:self.offset+4])[0]
+        self.tag = (word >> 24) & 0xFF
+        self.pad = (word >> 22) & 0x3
+        self.data_type = (word >> 16) & 0x3F
+        self.length = word & 0xFFFF
+        self.num = 0
+        self.type_name = "Segment"
+
+    def get_data(self, copy: bool = False) -> Union[memoryview, bytes]:
+        """
+        Get the raw data for this segment.
+
+        Args:
+            copy: Return a bytes copy instead of a read-only view of the file
+
+        Returns:
+            memoryview (or bytes if copy is True) containing the raw segment data
+        """
+        return buffer_bytes(self.mm, self.data_offset, self.end_offset, copy)
+
+    def __str__(self) -> str:
+        """Return string representation of the segment header."""
+        return f"""{self.type_name} (0x{self.tag:02x}):
+  Offset:    0x{self.offset:08x}
+  Length:    {self.length} words ({self.size} bytes)
+  Tag:       0x{self.tag:02x}
+  Pad:       {self.pad}
+  Data Type: 0x{self.data_type:02x}"""
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return f"{type(self).__name__}(offset=0x{self.offset:X}, tag=0x{self.tag:02X}, type=0x{self.data_type:02X})"
+
+
+class TagSegment(Segment):
+    """
+    Represents a TagSegment with a one-word header.
+
+    Structure:
+    - Word 1: tag (12 bits) | type (4 bits) | length (16 bits)
+
+    TagSegments have no pad or num.
+    """
+
+    __slots__ = ()
+
+    def _parse_header(self):
+        """Parse the one-word tagsegment header from the buffer."""
+        word = struct.unpack(self.endian + 'I', self.mm[self.offset:self.offset+4])[0]
+        self.tag = (word >> 20) & 0xFFF
+        self.pad = 0
+        self.data_type = (word >> 16) & 0xF
+        self.length = word & 0xFFFF
+        self.num = 0
+        self.type_name = "TagSegment"
+
+
+# Structure of the children of each container data type
+CHILD_TYPES = {
+    Bank.TYPE_BANK: Bank,
+    Bank.TYPE_BANK2: Bank,
+    Bank.TYPE_SEGMENT: Segment,
+    Bank.TYPE_SEGMENT2: Segment,
+    Bank.TYPE_TAGSEGMENT: TagSegment,
+}
@@ -0,0 +1,317 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from pyevio.bank import Bank, Segment, TagSegment
+from pyevio.dtypes import evio_dtype
+from pyevio.selection import parse_tag_path
+from pyevio.utils import buffer_view
+
+
+class BankTable:
+    """
+    Flat, array-backed bank tree of one or more events.
+
+    The tree is walked once and stored as parallel NumPy arrays (structure of
+    arrays), one entry per bank, segment or tagsegment in depth-first order:
+
+    - offset: byte offset of the header in the buffer
+    - length: length field (number of words following the length word or header)
+    - tag, data_type, num, pad: header fields (num and pad are 0 where the header has none)
+    - kind: KIND_BANK, KIND_SEGMENT or KIND_TAGSEGMENT
+    - depth: nesting level (0 for the top-level bank of an event)
+    - parent: index of the parent in the table, -1 for top-level banks
+
+    Bank, Segment and TagSegment objects are only created when the table is
+    indexed. Lengths follow the EVIO convention: a structure occupies
+    length + 1 words.
+    """
+
+    # Structure kinds
+    KIND_BANK = 0
+    KIND_SEGMENT = 1
+    KIND_TAGSEGMENT = 2
+
+    # Kind of the children of each container data type
+    CHILD_KINDS = {
+        Bank.TYPE_BANK: KIND_BANK,
+        Bank.TYPE_BANK2: KIND_BANK,
+        Bank.TYPE_SEGMENT: KIND_SEGMENT,
+        Bank.TYPE_SEGMENT2: KIND_SEGMENT,
+        Bank.TYPE_TAGSEGMENT: KIND_TAGSEGMENT,
+    }
+
+    # Data types whose payload is a sequence of structures
+    CONTAINER_TYPES = tuple(CHILD_KINDS)
+
+    # Python class and header size in bytes of each kind
+    _KIND_CLASSES = (Bank, Segment, TagSegment)
+    _HEADER_SIZES = np.array([8, 4, 4], dtype=np.int64)
+
+    def __init__(self, mm, endian: str, offset: np.ndarray, length: np.ndarray, tag: np.ndarray,
+                 data_type: np.ndarray, num: np.ndarray, pad: np.ndarray, kind: np.ndarray,
+                 depth: np.ndarray, parent: np.ndarray):
+        """
+        Initialize a BankTable from its arrays.
+
+        Args:
+            mm: Buffer (memory map) containing the banks
+            endian: Endianness ('<' for little endian, '>' for big endian)
+            offset: Byte offset of every structure
+            length: Length field of every structure
+            tag: Tag of every structure
+            data_type: Data type of every structure
+            num: Num of every structure
+            pad: Padding of every structure
+            kind: Kind (bank, segment or tagsegment) of every structure
+            depth: Nesting depth of every structure
+            parent: Parent table index of every structure (-1 for top-level banks)
+        """
+        self.mm = mm
+        self.endian = endian
+        self.offset = offset
+        self.length = length
+        self.tag = tag
+        self.data_type = data_type
+        self.num = num
+        self.pad = pad
+        self.kind = kind
+        self.depth = depth
+        self.parent = parent
+
+        # Bank objects created on demand
+        self._banks: Dict[int, Bank] = {}
+
+    @classmethod
+    def parse(cls, mm, offset: int, length: int, endian: str = '<', max_depth: int = 64) -> 'BankTable':
+        """
+        Parse all banks of one event.
+
+        Args:
+            mm: Buffer (memory map) containing the event
+            offset: Byte offset of the event
+            length: Length of the event in bytes
+            endian: Endianness ('<' for little endian, '>' for big endian)
+            max_depth: Maximum nesting depth to descend into
+
+        Returns:
+            BankTable object
+        """
+        return cls.parse_events(mm, [offset], [length], endian, max_depth)
+
+    @classmethod
+    def parse_events(cls, mm, offsets, lengths, endian: str = '<', max_depth: int = 64) -> 'BankTable':
+        """
+        Parse all banks of several events into one table.
+
+        Args:
+            mm: Buffer (memory map) containing the events
+            offsets: Byte offsets of the events
+            lengths: Lengths of the events in bytes
+            endian: Endianness ('<' for little endian, '>' for big endian)
+            max_depth: Maximum nesting depth to descend into
+
+        Returns:
+            BankTable object with the top-level bank of every event at depth 0
+        """
+        # Byte offset, length, tag, type, num, pad, kind, depth and parent of every structure
+        columns = tuple([] for _ in range(9))
+        word_dtype = evio_dtype(Bank.TYPE_UINT32, endian)
+
+        # Every event is walked in its own view, reading only the header words
+        for event_offset, event_length in zip(np.asarray(offsets, dtype=np.int64).tolist(),
+                                              np.asarray(lengths, dtype=np.int64).tolist()):
+            words = buffer_view(mm, event_offset, event_length // 4, word_dtype)
+            cls._walk(words, event_offset, 0, len(words), cls.KIND_BANK, 0, -1, max_depth, columns)
+
+        offset, length, tag, data_type, num, pad, kind, depth, parent = (
+            np.array(c, dtype=np.int64) for c in columns)
+
+        return cls(
+            mm, endian,
+            offset=offset,
+            length=length.astype(np.uint32),
+            tag=tag.astype(np.uint16),
+            data_type=data_type.astype(np.uint8),
+            num=num.astype(np.uint8),
+            pad=pad.astype(np.uint8),
+            kind=kind.astype(np.uint8),
+            depth=depth.astype(np.int16),
+            parent=parent.astype(np.int32)
+        )
+
+    @classmethod
+    def _walk(cls, words: np.ndarray, base: int, first: int, end: int, kind: int, depth: int, parent: int,
+              max_depth: int, columns: tuple):
+        """
+        Append the structures of one kind found in words[first:end] and, recursively, their children.
+
+        Only the header words are read from the view, whose first word is at byte
+        offset base in the buffer. Walking stops at the first structure that does
+        not fit in its parent.
+        """
+        offsets, lengths, tags, data_types, nums, pads, kinds, depths, parents = columns
+        header_words = 2 if kind == cls.KIND_BANK else 1
+        position = first
+
+        while position + header_words <= end:
+            word = words.item(position)
+            if kind == cls.KIND_BANK:
+                length = word
+                info = words.item(position + 1)
+                tag, pad, data_type, num = info >> 16, (info >> 14) & 0x3, (info >> 8) & 0x3F, info & 0xFF
+            elif kind == cls.KIND_SEGMENT:
+                length = word & 0xFFFF
+                tag, pad, data_type, num = word >> 24, (word >> 22) & 0x3, (word >> 16) & 0x3F, 0
+            else:
+                length = word & 0xFFFF
+                tag, pad, data_type, num = word >> 20, 0, (word >> 16) & 0xF, 0
+
+            next_position = position + length + 1
+            if length + 1 < header_words or next_position > end:
+                break
+
+            index = len(offsets)
+            offsets.append(base + position * 4)
+            lengths.append(length)
+            tags.append(tag)
+            data_types.append(data_type)
+            nums.append(num)
+            pads.append(pad)
+            kinds.append(kind)
+            depths.append(depth)
+            parents.append(parent)
+
+            child_kind = cls.CHILD_KINDS.get(data_type)
+            if child_kind is not None and depth < max_depth:
+                cls._walk(words, base, position + header_words, next_position, child_kind,
+                          depth + 1, index, max_depth, columns)
+
+            position = next_position
+
+    def __len__(self) -> int:
+        return len(self.offset)
+
+    def __getitem__(self, index: int) -> Bank:
+        """
+        Get the Bank (or Segment, TagSegment) object for a table entry, creating it on first access.
+
+        Args:
+            index: Table index
+
+        Returns:
+            Bank, Segment or TagSegment object
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Bank index {index} out of range (0-{len(self)-1})")
+
+        bank = self._banks.get(index)
+        if bank is None:
+            bank_class = self._KIND_CLASSES[self.kind[index]]
+            bank = bank_class(self.mm, int(self.offset[index]), self.endian)
+            self._banks[index] = bank
+        return bank
+
+    @property
+    def data_offset(self) -> np.ndarray:
+        """Byte offset of the payload of every structure."""
+        return self.offset + self._HEADER_SIZES[self.kind]
+
+    @property
+    def data_length(self) -> np.ndarray:
+        """Payload length of every structure in bytes."""
+        return (self.length.astype(np.int64) + 1) * 4 - self._HEADER_SIZES[self.kind]
+
+    def to_numpy(self, index: int, copy: bool = False) -> Optional[np.ndarray]:
+        """
+        Get the payload of a leaf bank as a NumPy array without creating a Bank object.
+
+        Args:
+            index: Table index
+            copy: Return an independent, writable copy instead of a read-only view
+
+        Returns:
+            NumPy array in the file's byte order, or None for non-numeric data types
+        """
+        dtype = evio_dtype(int(self.data_type[index]), self.endian)
+        if dtype is None:
+            return None
+        header_size = int(self._HEADER_SIZES[self.kind[index]])
+        data_length = (int(self.length[index]) + 1) * 4 - header_size
+        return buffer_view(self.mm, int(self.offset[index]) + header_size,
+                           data_length // dtype.itemsize, dtype, copy)
+
+    def roots(self) -> np.ndarray:
+        """Get the table indices of the top-level banks."""
+        return np.flatnonzero(self.parent == -1)
+
+    def children(self, index: int) -> np.ndarray:
+        """
+        Get the table indices of the direct children of a bank.
+
+        Args:
+            index: Table index of the parent bank
+
+        Returns:
+            Array of table indices
+        """
+        return np.flatnonzero(self.parent == index)
+
+    def find(self, tag: int, data_type: Optional[int] = None) -> np.ndarray:
+        """
+        Get the table indices of all banks with a tag (and optionally a data type).
+
+        Args:
+            tag: Bank tag
+            data_type: Optional data type
+
+        Returns:
+            Array of table indices
+        """
+        mask = self.tag == tag
+        if data_type is not None:
+            mask &= self.data_type == data_type
+        return np.flatnonzero(mask)
+
+    def select(self, path) -> np.ndarray:
+        """
+        Get the table indices of all banks matching a tag path.
+
+        Args:
+            path: Tag-path expression (e.g. "0xFF50|0xFF60/0xFF21/*") or its parsed levels
+
+        Returns:
+            Array of table indices of the matched banks, at depth len(levels) - 1
+        """
+        levels = parse_tag_path(path) if isinstance(path, str) else path
+
+        matched = np.zeros(len(self), dtype=bool)
+        for depth, tags in enumerate(levels):
+            level = self.depth == depth
+            if tags is not None:
+                level &= np.isin(self.tag, tags)
+            if depth > 0:
+                # Only descend from banks matched at the previous level
+                candidates = np.flatnonzero(level)
+                level[candidates] = matched[self.parent[candidates]]
+            matched = level
+        return np.flatnonzero(matched)
+
+    def root_of(self, indices) -> np.ndarray:
+        """
+        Get the position among the top-level banks (the event number in the table) of table entries.
+
+        Args:
+            indices: Table indices
+
+        Returns:
+            Array with the 0-based root position of every index
+        """
+        # Entries are in depth-first order, so an entry belongs to the last root before it
+        return np.cumsum(self.depth == 0)[np.asarray(indices, dtype=np.int64)] - 1
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"BankTable(banks={len(self)}, roots={len(self.roots())})"
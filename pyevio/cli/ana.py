@@ -9,50 +9,32 @@ import struct
 from datetime import datetime
 import numpy as np
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 
 from pyevio.evio_file import EvioFile
-from pyevio.cli.record import analyze_event_tags  # Reuse the function from record.py
+from pyevio.cli.record import analyze_event_tags, histogram_to_analysis  # Reuse the functions from record.py
 
 
-def filter_valid_events(event_infos, record):
+def filter_valid_events(offsets, lengths, record):
     """
     Filter out invalid or suspicious events.
 
     Args:
-        event_infos: List of (offset, length) tuples for events
+        offsets: Array of event offsets in bytes
+        lengths: Array of event lengths in bytes
         record: Record object containing the events
 
     Returns:
-        Filtered list of (offset, length) tuples
+        Tuple of filtered (offsets, lengths) arrays
     """
-    valid_events = []
+    # Skip suspiciously large events (>1MB - likely not a legitimate event),
+    # events extending past the record and events with tag 0x0000
+    keep = ((lengths <= record.MAX_VALID_EVENT_SIZE)
+            & (offsets + lengths <= record.data_end)
+            & (record.get_event_tags(offsets, lengths) != 0))
 
-    for offset, length in event_infos:
-        # Skip suspiciously large events (>1MB - likely not a legitimate event)
-        if length > 1024 * 1024:
-            continue
-
-        try:
-            # Check if we can read a valid event tag
-            if offset + 8 <= len(record.mm):
-                second_word = int.from_bytes(
-                    record.mm[offset + 4:offset + 8],
-                    byteorder='little' if record.endian == '<' else 'big'
-                )
-                tag = second_word >> 16
-
-                # Skip events with tag 0x0000 (likely not valid events)
-                if tag == 0:
-                    continue
-
-                # This event passed validation
-                valid_events.append((offset, length))
-        except Exception:
-            # Skip any events that cause errors
-            continue
-
-    return valid_events
+    return offsets[keep], lengths[keep]
 
 
 def analyze_event_tags_safe(record, detailed=False):
@@ -66,97 +48,8 @@ def analyze_event_tags_safe(record, detailed=False):
     Returns:
         Analysis dictionary
     """
-    # Get event offsets and lengths
-    event_infos = record.get_event_offsets()
-
-    # Filter out invalid events
-    event_infos = filter_valid_events(event_infos, record)
-
-    # Now proceed with regular analysis
-    if not event_infos:
-        return {"tags": {}, "total_events": 0, "total_size": 0}
-
-    # Extract offsets and lengths
-    offsets = np.array([offset for offset, _ in event_infos], dtype=np.int64)
-    lengths = np.array([length for _, length in event_infos], dtype=np.int64)
-
-    # Initialize array for signatures
-    signatures = np.zeros(len(offsets), dtype=np.uint32)
-
-    # Extract signatures (tags)
-    for i in range(len(offsets)):
-        # Extract the second word (bytes 4-8)
-        second_word = int.from_bytes(
-            record.mm[offsets[i] + 4:offsets[i] + 8],
-            byteorder='little' if record.endian == '<' else 'big'
-        )
-        signatures[i] = second_word >> 16
-
-    # Get unique signatures and count occurrences
-    unique_signatures, counts = np.unique(signatures, return_counts=True)
-
-    # Analyze sizes by tag
-    tag_stats = {}
-    for sig in unique_signatures:
-        mask = signatures == sig
-        sig_lengths = lengths[mask]
-
-        # Check if all events of this tag are the same size
-        is_uniform = np.all(sig_lengths == sig_lengths[0])
-
-        # Create size statistics
-        stat_dict = {
-            "count": int(np.sum(mask)),
-            "uniform_size": is_uniform,
-            "min_size": int(np.min(sig_lengths)),
-            "max_size": int(np.max(sig_lengths)),
-            "avg_size": float(np.mean(sig_lengths)),
-            "total_size": int(np.sum(sig_lengths))
-        }
-
-        # Add detailed size distribution if requested and sizes are not uniform
-        if detailed and not is_uniform:
-            # Convert to regular list and use Counter for distribution
-            size_counter = Counter(sig_lengths.tolist())
-
-            # Sort by size for better presentation
-            sorted_sizes = sorted(size_counter.items())
-
-            # Store the distribution
-            stat_dict["size_distribution"] = sorted_sizes
-
-            # Calculate some additional statistics
-            stat_dict["mode_size"] = int(Counter(sig_lengths).most_common(1)[0][0])
-            stat_dict["median_size"] = int(np.median(sig_lengths))
-            stat_dict["std_size"] = float(np.std(sig_lengths))
-
-            # Create histogram bins for a prettier visualization
-            if len(sorted_sizes) > 10:
-                # If we have many different sizes, create range-based bins
-                min_size = stat_dict["min_size"]
-                max_size = stat_dict["max_size"]
-                bin_count = min(10, max_size - min_size + 1)
-
-                bins = np.linspace(min_size, max_size, bin_count + 1, dtype=int)
-                hist, _ = np.histogram(sig_lengths, bins=bins)
-
-                # Create bin labels
-                bin_labels = [f"{bins[i]}-{bins[i+1]-1}" for i in range(len(bins)-1)]
-                if bin_labels[-1].endswith("-0"):
-                    bin_labels[-1] = bin_labels[-1].split("-")[0]
-
-                stat_dict["histogram"] = list(zip(bin_labels, hist))
-
-        tag_stats[f"0x{sig:04X}"] = stat_dict
-
-    # Compute total stats
-    result = {
-        "tags": tag_stats,
-        "total_events": len(signatures),
-        "total_size": int(np.sum(lengths))
-    }
-
-    return result
+    tags, sizes, counts = record.tag_census(valid_only=True)
+    return histogram_to_analysis(tags, sizes, counts, detailed)
 
 
 def merge_tag_analyses(analyses):
@@ -247,6 +140,48 @@ def merge_tag_analyses(analyses):
     return result
 
 
+def analyze_record_range(filename, start_record, end_record):
+    """
+    Build (record, tag, size) histograms for a range of records.
+
+    Runs in a worker process with its own EvioFile and memory map, and returns
+    compact NumPy arrays instead of per-record dictionaries.
+
+    Args:
+        filename: Path to the EVIO file
+        start_record: First record index
+        end_record: Last record index (exclusive)
+
+    Returns:
+        Dictionary with "records", "tags", "sizes" and "counts" arrays and the
+        time spent loading and analyzing records
+    """
+    parts = []
+    load_time = 0
+    analysis_time = 0
+
+    with EvioFile(filename) as evio_file:
+        for record_idx in range(start_record, end_record):
+            record_start = time.time()
+            record = evio_file.get_record(record_idx)
+            analysis_start = time.time()
+            tags, sizes, counts = record.tag_census(valid_only=True)
+            analysis_end = time.time()
+
+            load_time += analysis_start - record_start
+            analysis_time += analysis_end - analysis_start
+            parts.append((np.full(len(tags), record_idx, dtype=np.int64), tags, sizes, counts))
+
+    if parts:
+        records, tags, sizes, counts = (np.concatenate(column) for column in zip(*parts))
+    else:
+        records, tags, sizes, counts = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint16),
+                                        np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+    return {"records": records, "tags": tags, "sizes": sizes, "counts": counts,
+            "load_time": load_time, "analysis_time": analysis_time}
+
+
 def display_performance_metrics(console, analysis_duration, total_record_load_time,
                                 total_analysis_time, processed_events, file_size):
     """
@@ -514,13 +449,67 @@ def display_file_analysis(console, combined_analysis):
                 console.print(f"  Mean Size: {tag_data['avg_size']:.2f} bytes")
 
 
+def analyze_parallel(console, filename, evio_file, records_to_process, jobs, per_record):
+    """
+    Analyze records on a process pool and display the results.
+
+    The record range is split into chunks; every worker returns compact
+    (record, tag, size) histograms that are reduced here.
+
+    Args:
+        console: Rich console for output
+        filename: Path to the EVIO file
+        evio_file: Open EvioFile object (used for file size only)
+        records_to_process: Number of records to analyze, starting from the first
+        jobs: Number of worker processes
+        per_record: Whether to show per-record analysis
+    """
+    # A few chunks per worker keeps the pool busy when record sizes vary
+    chunk_count = min(records_to_process, jobs * 4)
+    bounds = np.linspace(0, records_to_process, chunk_count + 1, dtype=int)
+
+    results = []
+    analysis_start_time = time.time()
+    with Progress() as progress:
+        task = progress.add_task(f"[cyan]Analyzing records with {jobs} processes...", total=records_to_process)
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(analyze_record_range, filename, int(start), int(end)): int(end - start)
+                       for start, end in zip(bounds[:-1], bounds[1:]) if end > start}
+            for future in as_completed(futures):
+                results.append(future.result())
+                progress.update(task, advance=futures[future])
+
+    analysis_duration = time.time() - analysis_start_time
+
+    records, tags, sizes, counts = (np.concatenate([r[key] for r in results]) if results else np.zeros(0, dtype=np.int64)
+                                    for key in ("records", "tags", "sizes", "counts"))
+
+    display_performance_metrics(
+        console,
+        analysis_duration,
+        sum(r["load_time"] for r in results),
+        sum(r["analysis_time"] for r in results),
+        int(np.sum(counts)),
+        evio_file.file_size
+    )
+
+    if per_record:
+        for record_idx in range(records_to_process):
+            mask = records == record_idx
+            display_record_analysis(console, record_idx, histogram_to_analysis(tags[mask], sizes[mask], counts[mask]))
+
+    display_file_analysis(console, histogram_to_analysis(tags, sizes, counts))
+
+
 @click.command(name="ana")
 @click.argument("filename", type=click.Path(exists=True))
 @click.option("--per-record", "-r", is_flag=True, help="Show per-record analysis")
 @click.option("--limit", "-l", type=int, default=0, help="Limit analysis to first N records (0 for all)")
+@click.option("--jobs", "-j", type=int, default=1, help="Number of worker processes to split records across")
 @click.option('--verbose', '-v', is_flag=True, help="Enable verbose output")
 @click.pass_context
-def ana_command(ctx, filename, per_record, limit, verbose):
+def ana_command(ctx, filename, per_record, limit, jobs, verbose):
     """Analyze event tags and sizes across the entire file with performance metrics."""
     verbose = verbose or ctx.obj.get('VERBOSE', False)
     console = Console()
@@ -552,6 +541,10 @@ def ana_command(ctx, filename, per_record, limit, verbose):
         else:
             console.print(f"[bold]Analyzing all {records_to_process} records...[/bold]")
 
+        if jobs > 1:
+            analyze_parallel(console, filename, evio_file, records_to_process, jobs, per_record)
+            return
+
         # Setup progress bar for longer processes
         with Progress() as progress:
             task = progress.add_task("[cyan]Analyzing records...", total=records_to_process)
@@ -43,15 +43,15 @@ def display_bank_header(console, bank, title=None):
     console.print(f"Length: {bank.length} words ({bank.data_length} bytes of data)")
 
 
-def get_bank_type_name(bank):
-    """Determine a human-readable bank type name."""
+def get_bank_type_name(tag, data_type):
+    """Determine a human-readable bank type name from a bank's tag and data type."""
     bank_type = "Unknown"
-    if bank.data_type == 0x10:
+    if data_type == 0x10:
         bank_type = "Bank of banks"
-    elif bank.data_type == 0x20:
+    elif data_type == 0x20:
         bank_type = "Segment"
-    elif (bank.tag & 0xFF00) == 0xFF00:
-        tag_type = bank.tag & 0x00FF
+    elif (tag & 0xFF00) == 0xFF00:
+        tag_type = tag & 0x00FF
         if (tag_type & 0x10) == 0x10:
             bank_type = "ROC Raw Data Record"
         elif tag_type == 0x30:
@@ -63,84 +63,88 @@ def get_bank_type_name(bank):
     return bank_type
 
 
-def display_child_banks(console, parent_bank, evio_file, verbose, hexdump, level=0, max_level=2):
-    """Recursively display information about child banks."""
-    if not parent_bank.is_container() or level > max_level:
+def display_child_banks(console, table, parent, evio_file, verbose, hexdump, level=0, max_level=2):
+    """
+    Display information about the child banks of a bank, descending into containers.
+
+    Children are read from the event's flat bank table; Bank objects are only
+    created for the children shown in detail.
+
+    Args:
+        console: Rich console for output
+        table: BankTable of the event
+        parent: Table index of the parent bank
+        evio_file: EvioFile object for accessing raw data
+        verbose: Show details of every child
+        hexdump: Whether to show hex dumps
+        level: Current nesting level
+        max_level: Deepest nesting level to display
+    """
+    if table.data_type[parent] not in table.CONTAINER_TYPES or level > max_level:
         return
 
-    try:
-        children = parent_bank.get_children()
-        if not children:
-            console.print(f"[bold]No child banks found[/bold]")
-            return
-
-        console.print(f"[bold]Contains {len(children)} child banks:[/bold]")
-
-        # Create a table for child banks
-        child_table = Table(box=box.SIMPLE)
-        child_table.add_column("#", style="cyan")
-        child_table.add_column("Offset", style="green")
-        child_table.add_column("Tag", style="yellow")
-        child_table.add_column("Data Type", style="magenta")
-        child_table.add_column("Length", style="blue")
-        child_table.add_column("Type", style="white")
-
-        for i, child in enumerate(children[:min(20, len(children))]):
+    children = table.children(parent).tolist()
+    if not children:
+        console.print(f"[bold]No child banks found[/bold]")
+        return
+
+    console.print(f"[bold]Contains {len(children)} child banks:[/bold]")
+
+    # Create a table for child banks
+    child_table = Table(box=box.SIMPLE)
+    child_table.add_column("#", style="cyan")
+    child_table.add_column("Offset", style="green")
+    child_table.add_column("Tag", style="yellow")
+    child_table.add_column("Data Type", style="magenta")
+    child_table.add_column("Length", style="blue")
+    child_table.add_column("Type", style="white")
+
+    for i, child in enumerate(children[:20]):
+        offset, tag, data_type = int(table.offset[child]), int(table.tag[child]), int(table.data_type[child])
+        child_table.add_row(
+            str(i),
+            f"0x{offset:X}[{offset//4}]",
+            f"0x{tag:04X}",
+            f"0x{data_type:02X}",
+            f"{table.length[child]} words",
+            get_bank_type_name(tag, data_type)
+        )
+
+    if len(children) > 20:
+        child_table.add_row("...", "...", "...", "...", f"{len(children) - 20} more banks", "...")
+
+    console.print(child_table)
+
+    # Display detailed info for each child if requested
+    if verbose or hexdump:
+        for i, child in enumerate(children[:10]):
             try:
-                bank_type = get_bank_type_name(child)
-
-                child_table.add_row(
-                    str(i),
-                    f"0x{child.offset:X}[{child.offset//4}]",
-                    f"0x{child.tag:04X}",
-                    f"0x{child.data_type:02X}",
-                    f"{child.length} words",
-                    bank_type
-                )
+                offset, length = int(table.offset[child]), int(table.length[child])
+                is_container = table.data_type[child] in table.CONTAINER_TYPES
+                console.print(f"\n[bold]Child Bank #{i} (Tag 0x{table.tag[child]:04X}, "
+                              f"Type 0x{table.data_type[child]:02X}):[/bold]")
+
+                # Use print_offset_hex for displaying hex data
+                if hexdump:
+                    print_offset_hex(table.mm, offset, min(16, length),
+                                     f"Child #{i} at offset 0x{offset:X}[{offset//4}]")
+
+                # Show length details for better debugging; a bank spans length + 1 words
+                console.print(f"[dim]Length: {length} words, Data Length: {table.data_length[child]} bytes[/dim]")
+                console.print(f"[dim]Offset Range: 0x{offset:X} - 0x{offset + (length + 1) * 4:X}[/dim]")
+
+                # Check if this is a data bank (length 1 or 2)
+                if length <= 2 and not is_container:
+                    # This is likely a data bank
+                    display_data_bank(console, table[child], evio_file, hexdump)
+                # Recurse for container banks
+                elif is_container and level < max_level:
+                    display_child_banks(console, table, child, evio_file, verbose, hexdump, level + 1, max_level)
             except Exception as e:
-                child_table.add_row(
-                    str(i),
-                    f"0x{child.offset:X}[{child.offset//4}]",
-                    "ERROR",
-                    "ERROR",
-                    f"Parse Error: {str(e)}",
-                    "Invalid Bank"
-                )
-
-        if len(children) > 20:
-            child_table.add_row("...", "...", "...", "...", f"{len(children) - 20} more banks", "...")
-
-        console.print(child_table)
-
-        # Display detailed info for each child if requested
-        if verbose or hexdump:
-            for i, child in enumerate(children[:min(10, len(children))]):
-                try:
-                    console.print(f"\n[bold]Child Bank #{i} (Tag 0x{child.tag:04X}, Type 0x{child.data_type:02X}):[/bold]")
-
-                    # Use print_offset_hex for displaying hex data
-                    if hexdump:
-                        print_offset_hex(evio_file.mm, child.offset, min(16, child.length),
-                                         f"Child #{i} at offset 0x{child.offset:X}[{child.offset//4}]")
-
-                    # Show length details for better debugging
-                    console.print(f"[dim]Length: {child.length} words, Data Length: {child.data_length} bytes[/dim]")
-                    console.print(f"[dim]Offset Range: 0x{child.offset:X} - 0x{child.offset + (child.length * 4):X}[/dim]")
-
-                    # Check if this is a data bank (length 1 or 2)
-                    if child.length <= 2 and not child.is_container():
-                        # This is likely a data bank
-                        display_data_bank(console, child, evio_file, hexdump)
-                    # Recurse for container banks
-                    elif child.is_container() and level < max_level:
-                        display_child_banks(console, child, evio_file, verbose, hexdump, level + 1, max_level)
-                except Exception as e:
-                    console.print(f"[red]Error analyzing child {i}: {str(e)}[/red]")
-                    if verbose:
-                        import traceback
-                        console.print(f"[dim]{traceback.format_exc()}[/dim]")
-    except Exception as e:
-        console.print(f"[red]Error accessing child banks: {str(e)}[/red]")
+                console.print(f"[red]Error analyzing child {i}: {str(e)}[/red]")
+                if verbose:
+                    import traceback
+                    console.print(f"[dim]{traceback.format_exc()}[/dim]")
 
 def display_data_bank(console, bank, evio_file, hexdump=False):
     """
@@ -162,7 +166,7 @@ def display_data_bank(console, bank, evio_file, hexdump=False):
     data_words = []
     for i in range(bank.data_offset, bank.data_offset + bank.data_length, 4):
         if i + 4 <= bank.offset + bank.size:
-            word = struct.unpack(bank.endian + 'I', evio_file.mm[i:i+4])[0]
+            word = struct.unpack(bank.endian + 'I', bank.mm[i:i+4])[0]
             data_words.append(word)
 
     if not data_words:
@@ -186,7 +190,7 @@ def display_data_bank(console, bank, evio_file, hexdump=False):
 
     # Show hexdump if requested
     if hexdump and bank.data_length > 0:
-        print_offset_hex(evio_file.mm, bank.data_offset, min(bank.data_length // 4, 16),
+        print_offset_hex(bank.mm, bank.data_offset, min(bank.data_length // 4, 16),
                          f"Data Bank at 0x{bank.offset:X}[{bank.offset//4}]")
 
 def display_roc_timeslice_info(console, bank, evio_file, payload_filter=None, hexdump=False):
@@ -245,7 +249,7 @@ def display_roc_timeslice_info(console, bank, evio_file, payload_filter=None, he
         console.print(f"Offset: 0x{payload_bank.offset:X}[{payload_bank.offset//4}], Length: {payload_bank.length} words")
         console.print(f"Tag: 0x{payload_bank.tag:04X}, Data Type: 0x{payload_bank.data_type:02X}")
 
-        if payload_info:
+        if payload_info is not None:
             console.print(f"Module ID: {payload_info['module_id']}, Lane ID: {payload_info['lane_id']}, Port: {payload_info['port_num']}")
 
         # Show waveform information if available
@@ -259,12 +263,12 @@ def display_roc_timeslice_info(console, bank, evio_file, payload_filter=None, he
             # Show data preview
             try:
                 data = payload_bank.get_waveform_data()
-                if data:
-                    console.print(f"Data Range: Min={min(data)}, Max={max(data)}, Mean={(sum(data)/len(data)):.2f}")
+                if len(data):
+                    console.print(f"Data Range: Min={data.min()}, Max={data.max()}, Mean={data.mean():.2f}")
 
                     # Show hexdump of waveform data
                     if hexdump:
-                        print_offset_hex(evio_file.mm, payload_bank.data_offset, min(16, payload_bank.data_length//4),
+                        print_offset_hex(payload_bank.mm, payload_bank.data_offset, min(16, payload_bank.data_length//4),
                                          f"Payload {p_idx} Data at 0x{payload_bank.data_offset:X}[{payload_bank.data_offset//4}]")
             except Exception as e:
                 console.print(f"[red]Error analyzing waveform data: {str(e)}[/red]")
@@ -275,13 +279,13 @@ def display_event_info(console, evio_file, record_obj, event_idx, payload_filter
     console.print(f"[bold yellow]Event #{event_idx}[/bold yellow]")
 
     try:
-        event_obj = record_obj.get_record_and_event(event_idx)
+        event_obj = record_obj.get_event(event_idx)
         console.print(f"[bold]Offset: [green]0x{event_obj.offset:X}[{event_obj.offset//4}][/green], Size: [green]{event_obj.length}[/green] bytes[/bold]")
 
         # Show hexdump if requested
         if hexdump:
             console.print()
-            print_offset_hex(evio_file.mm, event_obj.offset, min(30, event_obj.length//4), f"Event #{event_idx} at 0x{event_obj.offset:X}[{event_obj.offset//4}]")
+            print_offset_hex(event_obj.mm, event_obj.offset, min(30, event_obj.length//4), f"Event #{event_idx} at 0x{event_obj.offset:X}[{event_obj.offset//4}]")
 
 
         # Get bank information
@@ -303,8 +307,8 @@ def display_event_info(console, evio_file, record_obj, event_idx, payload_filter
                 # Display ROC Time Slice Bank information
                 display_roc_timeslice_info(console, bank, evio_file, payload_filter, hexdump)
             elif bank.is_container():
-                # Display child banks for container banks
-                display_child_banks(console, bank, evio_file, verbose, hexdump)
+                # Display child banks for container banks from the flat bank table
+                display_child_banks(console, event_obj.get_bank_table(), 0, evio_file, verbose, hexdump)
             else:
                 # For leaf banks, show data preview
                 data = bank.to_numpy()
@@ -316,7 +320,7 @@ def display_event_info(console, evio_file, record_obj, event_idx, payload_filter
 
                 # Show hexdump of bank data if requested
                 if hexdump:
-                    print_offset_hex(evio_file.mm, bank.data_offset, min(16, bank.data_length//4),
+                    print_offset_hex(bank.mm, bank.data_offset, min(16, bank.data_length//4),
                                      f"Bank Data at 0x{bank.data_offset:X}[{bank.data_offset//4}]")
 
         except Exception as e:
@@ -42,15 +42,21 @@ def fetch_events(evio_file, count, start, record, verbose=False):
         total_events = evio_file.get_total_event_count()
         # Adjust start index
         start = max(0, min(start, total_events - 1))
-        # Fetch events
-        for i in range(start, min(start + count, total_events)):
-            try:
-                record, event = evio_file.get_record_and_event(i)
-                events.append((event, i))
-            except Exception as e:
-                if verbose:
-                    print(f"Error fetching event {i}: {e}")
-                break
+        # Fetch all events in one batch so each record is located only once
+        indices = list(range(start, min(start + count, total_events)))
+        try:
+            found = evio_file.get_events_by_global_index(indices)
+            events = [(event, i) for i, (_, event) in zip(indices, found)]
+        except Exception as e:
+            if verbose:
+                print(f"Error fetching events {start}-{start + count - 1}: {e}, retrying one by one")
+            # Fetch the events one by one, skipping only the ones that fail
+            for i in indices:
+                try:
+                    events.append((evio_file.get_event(i), i))
+                except Exception as e:
+                    if verbose:
+                        print(f"Skipping event {i}: {e}")
 
     return events
 
@@ -10,7 +10,7 @@ from PIL import Image
 import matplotlib.pyplot as plt
 from datetime import datetime
 
-from pyevio.display import create_bank_tree
+from pyevio.display import create_bank_tree, create_bank_table_tree
 from pyevio.evio_file import EvioFile
 from pyevio.roc_time_slice_bank import RocTimeSliceBank
 from pyevio.utils import make_hex_dump, print_offset_hex
@@ -38,7 +38,7 @@ def display_event(console, evio_file, record_obj, event_obj, record_idx,
     if hexdump:
         console.print()
         print_offset_hex(
-            evio_file.mm,
+            event_obj.mm,
             event_obj.offset,
             event_obj.length // 4,  # Convert bytes to words
             f"Record #{record_idx} Event rel#{event_obj.index}, Length: {event_obj.length} bytes)"
@@ -48,9 +48,12 @@ def display_event(console, evio_file, record_obj, event_obj, record_idx,
     # Try to get the bank
     try:
         bank = event_obj.get_bank()
-
-        # Create a tree for hierarchical display
-        bank_tree = create_bank_tree(bank, title="Event Structure")
+        if isinstance(bank, RocTimeSliceBank):
+            # Time slice banks get their specialized stream info display
+            bank_tree = create_bank_tree(bank, title="Event Structure")
+        else:
+            # Render from the flat bank table
+            bank_tree = create_bank_table_tree(event_obj.get_bank_table(), title="Event Structure")
         console.print(bank_tree)
 
     except Exception as e:
@@ -83,12 +86,13 @@ def event_command(ctx, filename, event_index, record_index, hexdump, verbose):
             if record_index is None:
                 # Event index is global.
                 record, event = evio_file.get_record_and_event(event_index)
+                record_index = record.index
                 console.print(f"[dim]Global event {event_index} maps to: record# {record.index}, local event index: {event.index}[/dim]")
             else:
                 # Record-specific event indexing
                 record = evio_file.get_record(record_index)
-                event = evio_file.get_event(event_index)
-                record_index = evio_file.get_records().index(record)
+                event = record.get_event(event_index)
+                record_index = record.index
 
             # Display the event information
             display_event(
@@ -0,0 +1,41 @@
+import click
+from rich.console import Console
+import time
+
+from pyevio.evio_file import EvioFile
+from pyevio.file_index import FileIndex
+
+
+@click.command(name="index")
+@click.argument("filename", type=click.Path(exists=True))
+@click.option("--output", "-o", type=click.Path(), help="Index file path (default: FILENAME.evidx)")
+@click.option("--cache-dir", type=click.Path(), help="Directory to keep index files in (or set PYEVIO_INDEX_DIR)")
+@click.option("--force", "-f", is_flag=True, help="Rebuild the index even if a valid one exists")
+@click.option('--verbose', '-v', is_flag=True, help="Enable verbose output")
+@click.pass_context
+def index_command(ctx, filename, output, cache_dir, force, verbose):
+    """
+    Build a sidecar index (.evidx) for fast reopening of FILENAME.
+
+    The index stores record offsets, event counts and per-event offsets,
+    lengths and tags. Open the file with EvioFile(filename, index="auto")
+    to use it; an index kept in a cache directory is found through
+    PYEVIO_INDEX_DIR or EvioFile(..., index_dir=CACHE_DIR).
+    """
+    verbose = verbose or ctx.obj.get('VERBOSE', False)
+    console = Console()
+
+    path = output or FileIndex.default_path(filename, cache_dir)
+
+    start_time = time.time()
+    with EvioFile(filename, verbose, index=None if force else path) as evio_file:
+        if evio_file.file_index is not None:
+            console.print(f"[green]Valid index already exists:[/green] {path}")
+            console.print(f"Records: {len(evio_file.file_index.record_offsets)}, Events: {evio_file.file_index.event_count:,}")
+            return
+
+        file_index = evio_file.build_index(path)
+
+    console.print(f"[bold]Index written:[/bold] {path}")
+    console.print(f"Records: {len(file_index.record_offsets)}, Events: {file_index.event_count:,}")
+    console.print(f"[dim]Built in {(time.time() - start_time) * 1000:.1f} ms[/dim]")
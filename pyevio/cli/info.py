@@ -50,6 +50,7 @@ def info_command(ctx, filename, verbose, hexdump, full):
         else:
             trailer_pos_str = "Not present (0x0)"
         table.add_row("Trailer Position", trailer_pos_str)
+        table.add_row("Record Index", f"from {evio_file.index_source}")
 
         # Print the table
         console.print(table)
@@ -16,106 +16,96 @@ from pyevio.roc_time_slice_bank import RocTimeSliceBank
 from pyevio.utils import make_hex_dump, print_offset_hex
 
 
-def analyze_event_tags(record, start_event=None, end_event=None, detailed=False):
+def histogram_to_analysis(tags, sizes, counts, detailed=True):
     """
-    Analyze event tags (signatures) within a record and their size statistics.
+    Convert a (tag, size) histogram into an analysis dictionary.
 
     Args:
-        record: Record object to analyze
-        start_event: Optional starting event index
-        end_event: Optional ending event index (exclusive)
+        tags: Array of tags
+        sizes: Array of event sizes in bytes
+        counts: Number of events for each (tag, size) entry; entries may repeat
+            (e.g. when combining several records)
         detailed: Whether to include detailed size distribution
 
     Returns:
         Dictionary with statistics about event tags and sizes
     """
-    # Get event offsets and lengths
-    event_infos = record.get_event_offsets(start_event, end_event)
-
-    if not event_infos:
-        return {"tags": {}, "total_events": 0, "total_size": 0}
-
-    # Extract offsets and lengths
-    offsets = np.array([offset for offset, _ in event_infos], dtype=np.int64)
-    lengths = np.array([length for _, length in event_infos], dtype=np.int64)
-
-    # Initialize array for signatures
-    signatures = np.zeros(len(offsets), dtype=np.uint32)
-
-    # Extract signatures (tags)
-    for i in range(len(offsets)):
-        # Extract the second word (bytes 4-8)
-        second_word = int.from_bytes(
-            record.mm[offsets[i] + 4:offsets[i] + 8],
-            byteorder='little' if record.endian == '<' else 'big'
-        )
-        signatures[i] = second_word >> 16
-
-    # Get unique signatures and count occurrences
-    unique_signatures, counts = np.unique(signatures, return_counts=True)
-
-    # Analyze sizes by tag
     tag_stats = {}
-    for sig in unique_signatures:
-        mask = signatures == sig
-        sig_lengths = lengths[mask]
 
-        # Check if all events of this tag are the same size
-        is_uniform = np.all(sig_lengths == sig_lengths[0])
+    for tag in np.unique(tags):
+        mask = tags == tag
+        # Sum repeated sizes and sort them
+        tag_sizes, inverse = np.unique(sizes[mask], return_inverse=True)
+        tag_counts = np.bincount(inverse, weights=counts[mask]).astype(np.int64)
+
+        total_count = int(np.sum(tag_counts))
+        total_size = int(np.sum(tag_sizes * tag_counts))
+        avg_size = total_size / total_count
+        is_uniform = len(tag_sizes) == 1
 
         # Create size statistics
         stat_dict = {
-            "count": int(np.sum(mask)),
+            "count": total_count,
             "uniform_size": is_uniform,
-            "min_size": int(np.min(sig_lengths)),
-            "max_size": int(np.max(sig_lengths)),
-            "avg_size": float(np.mean(sig_lengths)),
-            "total_size": int(np.sum(sig_lengths))
+            "min_size": int(tag_sizes[0]),
+            "max_size": int(tag_sizes[-1]),
+            "avg_size": float(avg_size),
+            "total_size": total_size
         }
 
         # Add detailed size distribution if requested and sizes are not uniform
         if detailed and not is_uniform:
-            # Convert to regular list and use Counter for distribution
-            size_counter = Counter(sig_lengths.tolist())
-
-            # Sort by size for better presentation
-            sorted_sizes = sorted(size_counter.items())
-
-            # Store the distribution
-            stat_dict["size_distribution"] = sorted_sizes
+            stat_dict["size_distribution"] = list(zip(tag_sizes.tolist(), tag_counts.tolist()))
 
-            # Calculate some additional statistics
-            stat_dict["mode_size"] = int(Counter(sig_lengths).most_common(1)[0][0])
-            stat_dict["median_size"] = int(np.median(sig_lengths))
-            stat_dict["std_size"] = float(np.std(sig_lengths))
+            # Statistics of the weighted size distribution
+            cumulative = np.cumsum(tag_counts)
+            middle = np.searchsorted(cumulative, [(total_count - 1) // 2, total_count // 2], side='right')
+            stat_dict["mode_size"] = int(tag_sizes[np.argmax(tag_counts)])
+            stat_dict["median_size"] = int(np.mean(tag_sizes[middle]))
+            stat_dict["std_size"] = float(np.sqrt(np.sum(tag_counts * (tag_sizes - avg_size) ** 2) / total_count))
 
             # Create histogram bins for a prettier visualization
-            if len(sorted_sizes) > 10:
+            if len(tag_sizes) > 10:
                 # If we have many different sizes, create range-based bins
                 min_size = stat_dict["min_size"]
                 max_size = stat_dict["max_size"]
                 bin_count = min(10, max_size - min_size + 1)
 
                 bins = np.linspace(min_size, max_size, bin_count + 1, dtype=int)
-                hist, _ = np.histogram(sig_lengths, bins=bins)
+                hist, _ = np.histogram(tag_sizes, bins=bins, weights=tag_counts)
 
                 # Create bin labels
                 bin_labels = [f"{bins[i]}-{bins[i+1]-1}" for i in range(len(bins)-1)]
                 if bin_labels[-1].endswith("-0"):
                     bin_labels[-1] = bin_labels[-1].split("-")[0]
 
-                stat_dict["histogram"] = list(zip(bin_labels, hist))
+                stat_dict["histogram"] = list(zip(bin_labels, hist.astype(np.int64).tolist()))
 
-        tag_stats[f"0x{sig:04X}"] = stat_dict
+        tag_stats[f"0x{int(tag):04X}"] = stat_dict
 
     # Compute total stats
-    result = {
+    return {
         "tags": tag_stats,
-        "total_events": len(signatures),
-        "total_size": int(np.sum(lengths))
+        "total_events": int(np.sum(counts)),
+        "total_size": int(np.sum(sizes * counts))
     }
 
-    return result
+
+def analyze_event_tags(record, start_event=None, end_event=None, detailed=False):
+    """
+    Analyze event tags (signatures) within a record and their size statistics.
+
+    Args:
+        record: Record object to analyze
+        start_event: Optional starting event index
+        end_event: Optional ending event index (exclusive)
+        detailed: Whether to include detailed size distribution
+
+    Returns:
+        Dictionary with statistics about event tags and sizes
+    """
+    tags, sizes, counts = record.tag_census(start_event, end_event)
+    return histogram_to_analysis(tags, sizes, counts, detailed)
 
 
 @click.command(name="record")
@@ -154,6 +144,11 @@ def record_command(ctx, filename, record, summary, events, tags, analyze, limit,
             table.add_row("Event Count", str(record_obj.event_count))
             table.add_row("Event Type", record_obj.header.event_type)
             table.add_row("Is Last Record", "Yes" if record_obj.header.is_last_record else "No")
+            if record_obj.is_compressed:
+                compression_names = {1: "LZ4", 2: "LZ4 (best)", 3: "gzip"}
+                compression = compression_names.get(record_obj.header.compression_type,
+                                                    str(record_obj.header.compression_type))
+                table.add_row("Compression", f"{compression}, {record_obj.header.compressed_data_length * 4} bytes")
 
             console.print(table)
 
@@ -0,0 +1,360 @@
+import re
+import struct
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from pyevio.utils import buffer_view
+
+
+# NumPy element types of composite format codes
+_COMPOSITE_NUMPY_TYPES = {
+    'i': 'u4',   # 32 bit unsigned int
+    'I': 'i4',   # 32 bit int
+    'F': 'f4',   # 32 bit float
+    'D': 'f8',   # 64 bit double
+    'L': 'i8',   # 64 bit int
+    'l': 'u8',   # 64 bit unsigned int
+    'S': 'i2',   # 16 bit short
+    's': 'u2',   # 16 bit unsigned short
+    'C': 'i1',   # 8 bit char
+    'c': 'u1',   # 8 bit unsigned char
+    'a': 'S1',   # 8 bit ASCII char
+    'A': 'S4',   # 32 bit Hollerith
+}
+
+# Multipliers read from the data: code -> NumPy type of the count
+_MULTIPLIER_TYPES = {
+    'N': 'i4',
+    'n': 'i2',
+    'm': 'i1',
+}
+
+# Composite data is a tagsegment holding the format string followed by a data bank
+TYPE_STRING = 0x3
+
+_TOKEN_PATTERN = re.compile(r"\s*(\d+|[Nnm]|[(),]|[A-Za-z])")
+
+# A program is a tuple of (count, element) where count is an int or a
+# multiplier code and element is a format code or a nested program
+Program = Tuple[Tuple[Union[int, str], Union[str, tuple]], ...]
+
+
+class CompositeFormat:
+    """
+    Compiled composite (type 0xF) data format.
+
+    The format string (e.g. "N(I,2S,F)") is parsed once into a program of
+    (count, element) steps. The format is applied until the data ends: after
+    the first pass, decoding resumes at the last top-level parenthesized group
+    (with its repeat count), or at the beginning if the format has no
+    parentheses. Formats that repeat as a whole and have no data-dependent
+    multipliers have a fixed stride and decode as a packed NumPy structured
+    dtype; the others are interpreted step by step.
+    """
+
+    def __init__(self, format_string: str):
+        """
+        Compile a format string.
+
+        Args:
+            format_string: EVIO composite format string
+
+        Raises:
+            ValueError: If the format string cannot be parsed
+        """
+        self.format_string = format_string
+        self.program = _parse_program(format_string)
+
+        # Steps applied again after the first pass: from the last top-level group on
+        groups = [i for i, (_, element) in enumerate(self.program) if isinstance(element, tuple)]
+        self.repeat_start = groups[-1] if groups else 0
+        self.is_fixed = self.repeat_start == 0 and _is_fixed(self.program)
+
+        # Structured dtypes by byte order
+        self._dtypes: Dict[str, np.dtype] = {}
+
+    def dtype(self, endian: str = '<') -> Optional[np.dtype]:
+        """
+        Get the structured dtype of one repetition of the format.
+
+        Args:
+            endian: Endianness of the data ('<' for little endian, '>' for big endian)
+
+        Returns:
+            Packed structured NumPy dtype, or None if the format has data-dependent
+            multipliers or does not repeat as a whole
+        """
+        if not self.is_fixed:
+            return None
+        if endian not in self._dtypes:
+            self._dtypes[endian] = _program_dtype(self.program, endian)
+        return self._dtypes[endian]
+
+    def decode(self, buffer, offset: int, length: int, endian: str = '<',
+               copy: bool = False) -> Union[np.ndarray, List]:
+        """
+        Decode composite data.
+
+        Args:
+            buffer: Buffer (memory map) containing the data
+            offset: Byte offset of the data
+            length: Length of the data in bytes
+            endian: Endianness of the data ('<' for little endian, '>' for big endian)
+            copy: Return an independent copy instead of a read-only view (fixed formats only)
+
+        Returns:
+            Structured NumPy array with one row per repetition for fixed formats,
+            otherwise a flat list of the decoded values in data order
+
+        Raises:
+            ValueError: If the data ends inside an item
+        """
+        dtype = self.dtype(endian)
+        if dtype is not None:
+            if length % dtype.itemsize:
+                raise ValueError(f"Composite data of {length} bytes is not a whole number of "
+                                 f"{dtype.itemsize} byte rows of {self.format_string!r}")
+            return buffer_view(buffer, offset, length // dtype.itemsize, dtype, copy)
+
+        data = bytes(buffer[offset:offset + length])
+        values = []
+        position = _run_program(self.program, data, 0, endian, values)
+        repeat = self.program[self.repeat_start:]
+        while position < len(data):
+            next_position = _run_program(repeat, data, position, endian, values)
+            if next_position == position:
+                raise ValueError(f"Composite format {self.format_string!r} does not consume data")
+            position = next_position
+        return values
+
+    def decode_many(self, chunks, endian: str = '<') -> Union[np.ndarray, List]:
+        """
+        Decode the data of several composite banks sharing this format.
+
+        Args:
+            chunks: Iterable of (buffer, offset, length) tuples
+            endian: Endianness of the data ('<' for little endian, '>' for big endian)
+
+        Returns:
+            One structured NumPy array with the rows of all banks for fixed
+            formats, otherwise a list with the decoded values of every bank
+        """
+        decoded = [self.decode(buffer, offset, length, endian) for buffer, offset, length in chunks]
+        if not self.is_fixed:
+            return decoded
+        if not decoded:
+            return np.zeros(0, dtype=self.dtype(endian))
+        return np.concatenate(decoded)
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"CompositeFormat({self.format_string!r}, fixed={self.is_fixed})"
+
+
+@lru_cache(maxsize=256)
+def compile_format(format_string: str) -> CompositeFormat:
+    """
+    Get the compiled program of a composite format string.
+
+    Compiled formats are cached, so banks with the same format share one program.
+
+    Args:
+        format_string: EVIO composite format string
+
+    Returns:
+        CompositeFormat object
+    """
+    return CompositeFormat(format_string)
+
+
+def parse_composite(buffer, offset: int, length: int, endian: str = '<') -> Tuple[CompositeFormat, int, int]:
+    """
+    Split composite bank data into its format and data parts.
+
+    The data starts with a tagsegment (type 0x3) holding the format string,
+    followed by a bank holding the data. The pad bits of the data bank give
+    the number of padding bytes at the end of its last word.
+
+    Args:
+        buffer: Buffer (memory map) containing the composite data
+        offset: Byte offset of the composite data
+        length: Length of the composite data in bytes
+        endian: Endianness ('<' for little endian, '>' for big endian)
+
+    Returns:
+        Tuple of (CompositeFormat, data_offset, data_length) with data_length excluding the padding
+
+    Raises:
+        ValueError: If the data is not a format tagsegment followed by a data bank
+    """
+    end = offset + length
+    if length < 12:
+        raise ValueError(f"Composite data too short: {length} bytes")
+
+    word = struct.unpack(endian + 'I', buffer[offset:offset+4])[0]
+    format_type = (word >> 16) & 0xF
+    format_length = word & 0xFFFF
+    if format_type != TYPE_STRING:
+        raise ValueError(f"Composite format tagsegment has type 0x{format_type:X}, expected 0x{TYPE_STRING:X}")
+
+    format_end = offset + 4 + format_length * 4
+    if format_end + 8 > end:
+        raise ValueError("Composite format tagsegment overruns the bank")
+
+    # The format string is null terminated and padded with 0x04
+    raw = bytes(buffer[offset + 4:format_end])
+    format_string = raw.split(b'\0', 1)[0].rstrip(b'\x04').decode('ascii')
+
+    data_length, data_info = struct.unpack(endian + 'II', buffer[format_end:format_end+8])
+    data_offset = format_end + 8
+    data_end = format_end + (data_length + 1) * 4
+    if data_end > end:
+        raise ValueError("Composite data bank overruns the bank")
+
+    padding = (data_info >> 14) & 0x3
+    return compile_format(format_string), data_offset, max(data_end - data_offset - padding, 0)
+
+
+def decode_composite_banks(banks) -> Dict[str, Union[np.ndarray, List]]:
+    """
+    Decode many composite banks, grouped by format string.
+
+    Each format is compiled once and all banks sharing a fixed-stride format
+    are decoded into a single structured array.
+
+    Args:
+        banks: Iterable of composite Bank objects
+
+    Returns:
+        Dictionary mapping each format string to its decoded data (see CompositeFormat.decode_many)
+    """
+    groups: Dict[str, Tuple[CompositeFormat, str, List]] = {}
+    for bank in banks:
+        composite_data = bank.get_data()
+        composite_format, data_offset, data_length = parse_composite(
+            composite_data, 0, len(composite_data), bank.endian)
+        _, endian, chunks = groups.setdefault(composite_format.format_string,
+                                              (composite_format, bank.endian, []))
+        chunks.append((composite_data, data_offset, data_length))
+
+    return {
+        format_string: composite_format.decode_many(chunks, endian)
+        for format_string, (composite_format, endian, chunks) in groups.items()
+    }
+
+
+def _tokenize(format_string: str) -> List[str]:
+    """Split a format string into tokens."""
+    tokens = []
+    position = 0
+    format_string = format_string.strip()
+    while position < len(format_string):
+        match = _TOKEN_PATTERN.match(format_string, position)
+        if match is None:
+            raise ValueError(f"Invalid composite format {format_string!r} at position {position}")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+def _parse_program(format_string: str) -> Program:
+    """Parse a format string into a program."""
+    tokens = _tokenize(format_string)
+    program, position = _parse_items(tokens, 0, format_string)
+    if position != len(tokens):
+        raise ValueError(f"Unbalanced parenthesis in composite format {format_string!r}")
+    if not program:
+        raise ValueError(f"Empty composite format {format_string!r}")
+    return program
+
+
+def _parse_items(tokens: List[str], position: int, format_string: str) -> Tuple[Program, int]:
+    """Parse comma separated items until the end or a closing parenthesis."""
+    items = []
+    while position < len(tokens) and tokens[position] != ')':
+        token = tokens[position]
+        if token == ',':
+            position += 1
+            continue
+
+        # Optional repeat count or multiplier
+        count: Union[int, str] = 1
+        if token.isdigit():
+            count = int(token)
+            position += 1
+        elif token in _MULTIPLIER_TYPES:
+            count = token
+            position += 1
+
+        if position >= len(tokens):
+            raise ValueError(f"Composite format {format_string!r} ends after a count")
+
+        token = tokens[position]
+        if token == '(':
+            group, position = _parse_items(tokens, position + 1, format_string)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise ValueError(f"Unbalanced parenthesis in composite format {format_string!r}")
+            items.append((count, group))
+            position += 1
+        elif token in _COMPOSITE_NUMPY_TYPES:
+            items.append((count, token))
+            position += 1
+        else:
+            raise ValueError(f"Unknown code {token!r} in composite format {format_string!r}")
+
+    return tuple(items), position
+
+
+def _is_fixed(program: Program) -> bool:
+    """Check that a program has no data-dependent multipliers."""
+    for count, element in program:
+        if isinstance(count, str):
+            return False
+        if isinstance(element, tuple) and not _is_fixed(element):
+            return False
+    return True
+
+
+def _program_dtype(program: Program, endian: str) -> np.dtype:
+    """Build the packed structured dtype of a fixed program."""
+    fields = []
+    for i, (count, element) in enumerate(program):
+        if isinstance(element, tuple):
+            field_type = _program_dtype(element, endian)
+        else:
+            field_type = np.dtype(endian + _COMPOSITE_NUMPY_TYPES[element])
+        if count == 1:
+            fields.append((f"f{i}", field_type))
+        else:
+            fields.append((f"f{i}", field_type, (count,)))
+    return np.dtype(fields)
+
+
+def _run_program(program: Program, data: bytes, position: int, endian: str, values: List) -> int:
+    """
+    Decode one pass of a program into values and return the new position.
+
+    Raises:
+        ValueError: If the data ends inside an item
+    """
+    for count, element in program:
+        if isinstance(count, str):
+            count_type = np.dtype(endian + _MULTIPLIER_TYPES[count])
+            if position + count_type.itemsize > len(data):
+                raise ValueError("Composite data ends inside a multiplier")
+            count = int(np.frombuffer(data, count_type, 1, position)[0])
+            position += count_type.itemsize
+
+        if isinstance(element, tuple):
+            for _ in range(count):
+                position = _run_program(element, data, position, endian, values)
+        else:
+            item_type = np.dtype(endian + _COMPOSITE_NUMPY_TYPES[element])
+            end = position + item_type.itemsize * count
+            if end > len(data):
+                raise ValueError("Composite data ends inside an item")
+            values.extend(np.frombuffer(data, item_type, count, position).tolist())
+            position = end
+    return position
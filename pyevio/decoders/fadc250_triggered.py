@@ -426,3 +426,147 @@ class FaDecoder:
 
         # update type_last
         self.type_last = fadc_data.type
+
+
+# Word type of continuation words at the start of a bank (FaDecoder starts with type_last = 15)
+FILLER_TYPE = 15
+
+# Size of a channel's raw sample buffer; FaDecoder drops the samples beyond it
+MAXRAW = 4096
+
+
+def _rows(mask: np.ndarray, word_index: np.ndarray, bank: np.ndarray, **fields) -> np.ndarray:
+    """Collect the selected words and their fields into a structured array."""
+    columns = {"word": word_index[mask], "bank": bank[mask]}
+    columns.update({name: values[mask] for name, values in fields.items()})
+    rows = np.zeros(int(np.count_nonzero(mask)), dtype=[(name, values.dtype) for name, values in columns.items()])
+    for name, values in columns.items():
+        rows[name] = values
+    return rows
+
+
+def decode_fadc_words(words, offsets=None) -> dict:
+    """
+    Decode FADC250 words of one or more banks at once with NumPy.
+
+    Gives the same values as feeding the words one by one to a new FaDecoder
+    per bank: all words are classified at once, the data type of continuation
+    words is forward filled from the last type-defining word of the same bank,
+    and fields are extracted with masks.
+
+    Args:
+        words: Array of 32-bit words (values, in native byte order)
+        offsets: Optional start of every bank in words, plus the end of the last
+            one (CSR form, e.g. from Selection.offsets). Default: a single bank
+
+    Returns:
+        Dictionary of structured arrays, one row per decoded item, each with the
+        index of its word ('word') and of its bank ('bank'):
+        - block_headers: slot, blk_num, n_evts
+        - block_trailers: slot, n_words
+        - event_headers: slot, evt_num
+        - trigger_times: time_1, time_2, time (time_2 << 24 | time_1)
+        - windows: chan, width (window raw data headers)
+        - raw_samples: chan, sample (position in the channel's raw buffer), adc, valid.
+          As in FaDecoder, samples beyond the MAXRAW positions of the buffer are dropped
+        - window_sums: chan, over, adc_sum
+        - pulse_integrals: chan, pulse_num, quality, integral
+        - pulse_times: chan, pulse_num, quality, time
+    """
+    words = np.asarray(words, dtype=np.uint32)
+    count = len(words)
+    word_index = np.arange(count, dtype=np.int64)
+
+    # Bank of every word
+    if offsets is None:
+        offsets = np.array([0, count], dtype=np.int64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    bank_start = np.zeros(count, dtype=bool)
+    bank_start[offsets[:-1][offsets[:-1] < count]] = True
+    bank = np.searchsorted(offsets, word_index, side='right') - 1
+
+    # Classify all words and forward fill the type of continuation words
+    new_type = (words & 0x80000000) != 0
+    header_type = (words >> 27) & 0xF
+    last = np.maximum.accumulate(np.where(new_type | bank_start, word_index, 0)) if count else word_index
+    word_type = np.where(new_type[last], header_type[last], FILLER_TYPE)
+    continuation = ~new_type
+
+    # Fields shared by the channel-based data types
+    chan = ((words & 0x07800000) >> 23).astype(np.uint8)
+    pulse_num = ((words & 0x600000) >> 21).astype(np.uint8)
+    quality = ((words & 0x180000) >> 19).astype(np.uint8)
+
+    result = {}
+    result["block_headers"] = _rows(
+        new_type & (word_type == 0), word_index, bank,
+        slot=((words & 0x7C00000) >> 22).astype(np.uint8),
+        blk_num=((words >> 8) & 0x3FF).astype(np.uint16),
+        n_evts=(words & 0xFF).astype(np.uint8))
+
+    result["block_trailers"] = _rows(
+        word_type == 1, word_index, bank,
+        slot=((words & 0x7C00000) >> 22).astype(np.uint8),
+        n_words=words & 0x3FFFFF)
+
+    result["event_headers"] = _rows(
+        new_type & (word_type == 2), word_index, bank,
+        slot=((words >> 22) & 0x1F).astype(np.uint8),
+        evt_num=words & 0x3FFFFF)
+
+    # Trigger time: the second word combines with the first word of its header
+    time_1 = words[last] & 0xFFFFFF
+    time_2 = words & 0xFFFFFF
+    result["trigger_times"] = _rows(
+        continuation & (word_type == 3), word_index, bank,
+        time_1=time_1, time_2=time_2,
+        time=(time_2.astype(np.uint64) << 24) | time_1.astype(np.uint64))
+
+    # Raw window samples: FaDecoder restarts a channel's buffer only when the channel changes
+    window = new_type & (word_type == 4)
+    result["windows"] = _rows(window, word_index, bank, chan=chan, width=(words & 0xFFF).astype(np.uint16))
+
+    window_positions = np.flatnonzero(window)
+    window_chan = chan[window_positions].astype(np.int16)
+    window_bank = bank[window_positions]
+    restart = np.ones(len(window_positions), dtype=bool)
+    restart[1:] = (window_chan[1:] != window_chan[:-1]) | (window_bank[1:] != window_bank[:-1])
+    window_group = np.cumsum(restart) - 1
+
+    sample_words = np.flatnonzero(continuation & (word_type == 4))
+    sample_group = window_group[np.searchsorted(window_positions, last[sample_words])]
+    group_first = np.searchsorted(sample_group, sample_group, side='left')
+    position = 2 * (np.arange(len(sample_words)) - group_first)
+
+    # FaDecoder only stores a pair of samples while the buffer position is below MAXRAW
+    stored = position < MAXRAW
+    sample_words, position = sample_words[stored], position[stored]
+
+    samples = np.zeros(2 * len(sample_words), dtype=[
+        ("word", np.int64), ("bank", np.int64), ("chan", np.uint8), ("sample", np.int64),
+        ("adc", np.uint16), ("valid", np.bool_)])
+    sample_values = words[sample_words]
+    samples["word"] = np.repeat(sample_words, 2)
+    samples["bank"] = np.repeat(bank[sample_words], 2)
+    samples["chan"] = np.repeat(chan[last[sample_words]], 2)
+    samples["sample"][0::2] = position
+    samples["sample"][1::2] = position + 1
+    samples["adc"][0::2] = (sample_values & 0x1FFF0000) >> 16
+    samples["adc"][1::2] = sample_values & 0x1FFF
+    samples["valid"][0::2] = (sample_values & 0x20000000) == 0
+    samples["valid"][1::2] = (sample_values & 0x2000) == 0
+    result["raw_samples"] = samples
+
+    result["window_sums"] = _rows(
+        word_type == 5, word_index, bank,
+        chan=chan, over=(words & 0x400000) != 0, adc_sum=words & 0x3FFFFF)
+
+    result["pulse_integrals"] = _rows(
+        word_type == 7, word_index, bank,
+        chan=chan, pulse_num=pulse_num, quality=quality, integral=words & 0x7FFFF)
+
+    result["pulse_times"] = _rows(
+        word_type == 8, word_index, bank,
+        chan=chan, pulse_num=pulse_num, quality=quality, time=(words & 0xFFFF).astype(np.uint16))
+
+    return result
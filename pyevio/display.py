@@ -79,7 +79,7 @@ def display_bank_tree(tree, bank, level=0, max_depth=10, expand_all=False):
 
     # If this is a container bank and we're not at max depth, show children
     if bank.is_container() and level < max_depth:
-        children = bank.get_children()
+        children = bank.get_children(recover=True)
 
         if children:
             child_count = len(children)
@@ -125,3 +125,69 @@ def create_bank_tree(bank, title="Bank Structure"):
     tree = Tree(f"[bold]{title}[/bold]")
     display_bank_tree(tree, bank)
     return tree
+
+
+def display_bank_table_tree(tree, table, index, max_depth=10, max_children=10):
+    """
+    Display one bank of a BankTable and its children in a hierarchical tree.
+
+    Reads tags, types, lengths and data previews from the table arrays without
+    creating Bank objects.
+
+    Args:
+        tree: Rich Tree object to add nodes to
+        table: BankTable object
+        index: Table index of the bank to display
+        max_depth: Maximum depth to display
+        max_children: Maximum number of children to display per bank
+    """
+    tag = int(table.tag[index])
+    data_type = int(table.data_type[index])
+    offset = int(table.offset[index])
+    length = int(table.length[index])
+    kind = int(table.kind[index])
+    kind_name = ("Bank", "Segment", "TagSegment")[kind]
+    header_size = 8 if kind == table.KIND_BANK else 4
+
+    bank_node = tree.add(f"{kind_name} 0x{tag:04X} (type 0x{data_type:02X})")
+    bank_node.add(f"Offset: 0x{offset:X}[{offset//4}], Length: {length} words "
+                  f"({(length + 1) * 4 - header_size} bytes)")
+    bank_node.add(f"Tag: 0x{tag:04X}, Type: 0x{data_type:02X}, Num: {int(table.num[index])}")
+
+    children = table.children(index)
+    if data_type in table.CHILD_KINDS:
+        if len(children) == 0:
+            bank_node.add("No child banks")
+        elif table.depth[index] < max_depth:
+            children_node = bank_node.add(f"Child Banks ({len(children)})")
+            for child in children[:max_children].tolist():
+                display_bank_table_tree(children_node, table, child, max_depth, max_children)
+            if len(children) > max_children:
+                children_node.add(f"... {len(children) - max_children} more banks ...")
+        return
+
+    # Add data preview for non-container banks
+    data = table.to_numpy(index)
+    if data is not None and len(data) > 0:
+        preview_count = min(10, len(data))
+        data_preview = ", ".join([f"{x}" for x in data[:preview_count]])
+        if len(data) > preview_count:
+            data_preview += f", ... ({len(data) - preview_count} more values)"
+        bank_node.add(f"Data: [{data_preview}]")
+
+
+def create_bank_table_tree(table, title="Bank Structure"):
+    """
+    Create a rich Tree object showing the banks of a BankTable.
+
+    Args:
+        table: BankTable object
+        title: Title for the tree
+
+    Returns:
+        Rich Tree object displaying the bank structure
+    """
+    tree = Tree(f"[bold]{title}[/bold]")
+    for root in table.roots().tolist():
+        display_bank_table_tree(tree, table, root)
+    return tree
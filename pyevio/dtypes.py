@@ -0,0 +1,58 @@
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+
+# NumPy element types of EVIO bank data types. Container types (banks,
+# segments, tagsegments), strings and composite data have no element type.
+_EVIO_NUMPY_TYPES = {
+    0x0: 'u4',   # unknown 32 bit
+    0x1: 'u4',   # uint32
+    0x2: 'f4',   # float32
+    0x4: 'i2',   # int16
+    0x5: 'u2',   # uint16
+    0x6: 'i1',   # int8
+    0x7: 'u1',   # uint8
+    0x8: 'f8',   # float64
+    0x9: 'i8',   # int64
+    0xa: 'u8',   # uint64
+    0xb: 'i4',   # int32
+}
+
+
+@lru_cache(maxsize=None)
+def evio_dtype(data_type: int, endian: str = '<') -> Optional[np.dtype]:
+    """
+    Get the NumPy dtype for an EVIO data type in the given byte order.
+
+    Args:
+        data_type: EVIO data type code (e.g. 0x1 for uint32)
+        endian: Endianness of the data ('<' for little endian, '>' for big endian)
+
+    Returns:
+        NumPy dtype with explicit byte order, or None for non-numeric types
+    """
+    type_code = _EVIO_NUMPY_TYPES.get(data_type)
+    if type_code is None:
+        return None
+    return np.dtype(endian + type_code)
+
+
+def to_native(array: np.ndarray) -> np.ndarray:
+    """
+    Get an array in native byte order.
+
+    Arrays from the file keep the file's byte order, so no swapped copy is
+    made until a caller needs native order. Arrays already in native order
+    are returned as they are.
+
+    Args:
+        array: NumPy array in any byte order
+
+    Returns:
+        NumPy array in native byte order
+    """
+    if array.dtype.isnative:
+        return array
+    return array.astype(array.dtype.newbyteorder('='))
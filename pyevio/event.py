@@ -1,10 +1,11 @@
 import mmap
 import struct
-from typing import List, Tuple, Optional, Dict, Any
+from collections.abc import Sequence
+from typing import List, Tuple, Optional, Dict, Any, Union
 from datetime import datetime
 from pyevio.bank import Bank  # Import here to avoid circular import
 
-from pyevio.utils import make_hex_dump
+from pyevio.utils import make_hex_dump, buffer_bytes
 
 
 class Event:
@@ -16,6 +17,10 @@ class Event:
     structure efficiently.
     """
 
+    # Records can hold ~100k events, so no per-instance __dict__
+    __slots__ = ('mm', 'offset', 'length', 'endian', 'index', 'end_offset',
+                 '_root_bank', '_bank_table', '_bank_info')
+
     def __init__(self, mm: mmap.mmap, offset: int, length: int, endian: str = '<', index: int = -1):
         """
         Initialize an Event object.
@@ -36,8 +41,9 @@ class Event:
         # End offset for the event
         self.end_offset = offset + length
 
-        # Root bank (will be parsed on demand)
+        # Root bank and flat bank table (will be parsed on demand)
         self._root_bank = None
+        self._bank_table = None
         self._bank_info = None
 
     def get_bank_info(self) -> Dict[str, Any]:
@@ -111,6 +117,22 @@ class Event:
 
         return self._root_bank
 
+    def get_bank_table(self):
+        """
+        Get the flat bank table of this event.
+
+        The event's bank tree is walked once into NumPy arrays; Bank objects
+        are only created when the table is indexed.
+
+        Returns:
+            BankTable object
+        """
+        if self._bank_table is None:
+            from pyevio.bank_table import BankTable  # Import here to avoid circular import
+            self._bank_table = BankTable.parse(self.mm, self.offset, self.length, self.endian)
+
+        return self._bank_table
+
     def is_roc_time_slice_bank(self) -> bool:
         """
         Check if this event contains a ROC Time Slice Bank.
@@ -136,14 +158,17 @@ class Event:
         data = self.mm[self.offset:self.offset + display_len]
         return make_hex_dump(data, title=title or f"Event Data at offset 0x{self.offset:X}")
 
-    def get_data(self) -> bytes:
+    def get_data(self, copy: bool = False) -> Union[memoryview, bytes]:
         """
         Get the raw data for this event.
 
+        Args:
+            copy: Return a bytes copy instead of a read-only view of the file
+
         Returns:
-            Bytes object containing the raw event data
+            memoryview (or bytes if copy is True) containing the raw event data
         """
-        return self.mm[self.offset:self.end_offset]
+        return buffer_bytes(self.mm, self.offset, self.end_offset, copy)
 
     def __str__(self) -> str:
         """Return a string representation of this event."""
@@ -154,4 +179,68 @@ class Event:
 
     def __repr__(self) -> str:
         """Return a string representation for debugging."""
-        return f"Event(offset=0x{self.offset:X}, length={self.length}, index={self.index})"
\ No newline at end of file
+        return f"Event(offset=0x{self.offset:X}, length={self.length}, index={self.index})"
+
+class EventList(Sequence):
+    """
+    Lazy sequence of the events of a record.
+
+    Backed by the record's event offset and length arrays; Event objects are
+    only created when an element is accessed, so holding or iterating the
+    list costs no more than the index itself.
+    """
+
+    __slots__ = ('mm', 'offsets', 'lengths', 'endian', 'start')
+
+    def __init__(self, mm: mmap.mmap, offsets, lengths, endian: str = '<', start: int = 0):
+        """
+        Initialize an EventList.
+
+        Args:
+            mm: Buffer (memory map) containing the events
+            offsets: Array of event offsets in bytes
+            lengths: Array of event lengths in bytes
+            endian: Endianness ('<' for little endian, '>' for big endian)
+            start: Index within the record of the first event in the list
+        """
+        self.mm = mm
+        self.offsets = offsets
+        self.lengths = lengths
+        self.endian = endian
+        self.start = start
+
+    def __len__(self) -> int:
+        """Get the number of events."""
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """
+        Get an event, or a range of events.
+
+        Args:
+            index: Position in the list, or a slice
+
+        Returns:
+            Event object, an EventList for contiguous slices, or a list of Event objects
+        """
+        if isinstance(index, slice):
+            first, stop, step = index.indices(len(self))
+            if step == 1:
+                return EventList(self.mm, self.offsets[first:stop], self.lengths[first:stop],
+                                 self.endian, self.start + first)
+            return [self[i] for i in range(first, stop, step)]
+
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Event index {index} out of range (0-{len(self)-1})")
+        return Event(self.mm, int(self.offsets[index]), int(self.lengths[index]), self.endian, self.start + index)
+
+    def __iter__(self):
+        """Iterate over the events, creating each Event object on the fly."""
+        for i, (offset, length) in enumerate(zip(self.offsets.tolist(), self.lengths.tolist())):
+            yield Event(self.mm, offset, length, self.endian, self.start + i)
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"EventList(events={len(self)}, start={self.start})"
@@ -0,0 +1,59 @@
+import numpy as np
+
+
+class EventBatch:
+    """
+    Columnar batch of consecutive events.
+
+    The words of all events are stored back to back in one flat uint32 array
+    (native byte order), with word_offsets[i]:word_offsets[i+1] delimiting
+    event i. A batch may span record boundaries.
+    """
+
+    def __init__(self, words: np.ndarray, word_offsets: np.ndarray, event_index: np.ndarray,
+                 tags: np.ndarray, lengths: np.ndarray):
+        """
+        Initialize an EventBatch from its arrays.
+
+        Args:
+            words: Flat uint32 array with the words of all events
+            word_offsets: Start of every event in words, plus the end of the last one
+            event_index: Global index of every event
+            tags: Top-level bank tag of every event
+            lengths: Length of every event in bytes
+        """
+        self.words = words
+        self.word_offsets = word_offsets
+        self.event_index = event_index
+        self.tags = tags
+        self.lengths = lengths
+
+    @property
+    def nbytes(self) -> int:
+        """Get the size of the event data in bytes."""
+        return self.words.nbytes
+
+    def __len__(self) -> int:
+        """Get the number of events in the batch."""
+        return len(self.event_index)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        Get the words of one event.
+
+        Args:
+            index: Position of the event in the batch
+
+        Returns:
+            View of the event's words in the flat array
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Batch index {index} out of range (0-{len(self)-1})")
+        return self.words[self.word_offsets[index]:self.word_offsets[index + 1]]
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        first = int(self.event_index[0]) if len(self) else 0
+        return f"EventBatch(events={len(self)}, first={first}, bytes={self.nbytes})"
@@ -1,11 +1,26 @@
 import mmap
 import os
 import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Dict, Any, Iterator
 from datetime import datetime
 
+import numpy as np
+
+from pyevio.bank import Bank
+from pyevio.bank_table import BankTable
+from pyevio.dtypes import evio_dtype
+from pyevio.event_batch import EventBatch
 from pyevio.file_header import FileHeader
+from pyevio.file_index import FileIndex
 from pyevio.record import Record
+from pyevio.record_cache import RecordCache
+from pyevio.record_header import RecordHeader
+from pyevio.roc_time_slice_bank import (TIME_SLICE_DTYPE, PayloadBank, PayloadLayout, decode_payload_infos,
+                                        decode_time_slice_headers)
+from pyevio.selection import Selection, parse_tag_path
+from pyevio.utils import buffer_view
 from pyevio.event import Event
 
 
@@ -17,16 +32,28 @@ class EvioFile:
     the file structure using Records and Events.
     """
 
-    def __init__(self, filename: str, verbose: bool = False):
+    # Default byte budget for decompressed records
+    DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, filename: str, verbose: bool = False, index: Optional[str] = None,
+                 cache_bytes: int = DEFAULT_CACHE_BYTES, index_dir: Optional[str] = None):
         """
         Initialize EvioFile object with a file path.
 
         Args:
             filename: Path to the EVIO file
             verbose: Enable verbose output
+            index: Sidecar index to use: None to not use one, "auto" to look in the
+                index cache directory and next to the file, or a path to an index
+                file. A missing or stale index is ignored.
+            cache_bytes: Memory budget in bytes for decompressed records. Least
+                recently used records are dropped when it is exceeded.
+            index_dir: Index cache directory (default: PYEVIO_INDEX_DIR, see
+                FileIndex.default_path)
         """
         self.verbose = verbose
         self.filename = filename
+        self.index_dir = index_dir
         self.file = open(filename, 'rb')
         self.file_size = os.path.getsize(filename)
 
@@ -47,20 +74,44 @@ class EvioFile:
         if self.header.user_header_length > 0:
             self.first_record_offset += self.header.user_header_length
 
-        # Record objects (will be created on demand)
+        # Record objects (will be created on demand). Compressed records hold
+        # their decompressed payload, so they go into a bounded LRU cache instead
         self._records = {}
-
-        # Scan record offsets
-        self._record_offsets = self._scan_record_offsets()
-
-        # Total event count cache
+        self.record_cache = RecordCache(cache_bytes)
+
+        # Record offsets and per-record event counts. Taken from a sidecar index,
+        # the file header index array or the trailer index when present,
+        # otherwise from a scan
+        self._record_event_counts = None
+        self.index_source = None
+        self.file_index = self._open_file_index(index) if index else None
+
+        if self.file_index is not None:
+            self.index_source = "sidecar"
+            self._record_offsets = self.file_index.record_offsets.tolist()
+            self._record_event_counts = self.file_index.record_event_counts
+        else:
+            self._record_offsets = self._load_record_index()
+
+        # Total event count and cumulative event count caches
         self._total_event_count = None
+        self._record_event_starts = None
+
+        # Time-slice table, taken from the sidecar index when it holds one
+        self._time_slice_table = None
+        if self.file_index is not None:
+            self._time_slice_table = self.file_index.time_slices
 
     def __del__(self):
         """Cleanup resources when object is destroyed"""
         try:
             if hasattr(self, 'mm') and self.mm and not getattr(self.mm, 'closed', True):
-                self.mm.close()
+                try:
+                    self.mm.close()
+                except BufferError:
+                    # Zero-copy views of the file are still in use. The mapping
+                    # is released once the last of them is garbage collected
+                    pass
             if hasattr(self, 'file') and self.file and not self.file.closed:
                 self.file.close()
         except (ValueError, AttributeError):
@@ -75,6 +126,161 @@ class EvioFile:
         """Cleanup when exiting context"""
         self.__del__()
 
+    def _open_file_index(self, index: str) -> Optional[FileIndex]:
+        """
+        Load a sidecar index if it exists and matches this file.
+
+        Args:
+            index: "auto" for the index cache directory and the default location
+                next to the file (see FileIndex.search_paths), or a path to an index file
+
+        Returns:
+            FileIndex object, or None if no valid index is available
+        """
+        paths = FileIndex.search_paths(self.filename, self.index_dir) if index == "auto" else [index]
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+
+            try:
+                file_index = FileIndex.load(path)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error loading index {path}: {e}")
+                continue
+
+            if not file_index.is_valid_for(self):
+                if self.verbose:
+                    print(f"Index {path} does not match {self.filename}, ignoring it")
+                continue
+
+            return file_index
+
+        return None
+
+    def build_index(self, path: Optional[str] = None, time_slices: bool = False) -> FileIndex:
+        """
+        Build a sidecar index for this file and save it.
+
+        Args:
+            path: Path to the index file (default: FileIndex.default_path in the index cache directory)
+            time_slices: Also store the time-slice table (see time_slice_table)
+
+        Returns:
+            FileIndex object
+        """
+        file_index = FileIndex.build(self, time_slices=time_slices)
+        file_index.save(path or FileIndex.default_path(self.filename, self.index_dir))
+        self.file_index = file_index
+        return file_index
+
+    def _load_record_index(self) -> List[int]:
+        """
+        Determine record offsets without walking every record if possible.
+
+        The file header index array is tried first, then the trailer index.
+        The linear scan is only used when neither is available or valid.
+
+        Returns:
+            List of record offsets in bytes
+        """
+        for source, reader in (("file header", self._read_file_header_index),
+                               ("trailer", self._read_trailer_index)):
+            index = reader()
+            if index is None:
+                continue
+
+            offsets = self._offsets_from_index(*index)
+            if offsets is not None:
+                self.index_source = source
+                return offsets
+
+            if self.verbose:
+                print(f"Record index from {source} is inconsistent with the file, ignoring it")
+
+        self.index_source = "scan"
+        return self._scan_record_offsets()
+
+    def _read_index_pairs(self, offset: int, length: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Read an index array of (record length in bytes, event count) pairs.
+
+        Args:
+            offset: Byte offset of the index array
+            length: Length of the index array in bytes
+
+        Returns:
+            Tuple of (record lengths, event counts) arrays, or None if the array is unusable
+        """
+        pair_count = length // 8
+        if pair_count == 0 or offset + pair_count * 8 > self.file_size:
+            return None
+
+        pairs = np.frombuffer(self.mm[offset:offset + pair_count * 8],
+                              dtype=evio_dtype(Bank.TYPE_UINT32, self.header.endian)).reshape(pair_count, 2)
+        return pairs[:, 0].astype(np.int64), pairs[:, 1].astype(np.int64)
+
+    def _read_file_header_index(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Read the optional index array that follows the file header."""
+        if self.header.index_array_length <= 0:
+            return None
+        return self._read_index_pairs(self.header.header_length * 4, self.header.index_array_length)
+
+    def _read_trailer_index(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Read the index array stored in the trailer record, if the file has one."""
+        position = self.header.trailer_position
+        if not self.header.has_trailer or position <= 0 or position + RecordHeader.HEADER_SIZE > self.file_size:
+            return None
+
+        try:
+            trailer = RecordHeader.parse(self.mm, position)
+        except (ValueError, struct.error) as e:
+            if self.verbose:
+                print(f"Error reading trailer at offset 0x{position:X}: {e}")
+            return None
+
+        if not trailer.is_trailer:
+            return None
+
+        return self._read_index_pairs(position + trailer.header_length * 4, trailer.index_array_length)
+
+    def _offsets_from_index(self, lengths: np.ndarray, counts: np.ndarray) -> Optional[List[int]]:
+        """
+        Compute record offsets from record lengths and validate them against the file.
+
+        Args:
+            lengths: Record lengths in bytes
+            counts: Event counts per record
+
+        Returns:
+            List of record offsets in bytes, or None if the index does not fit the file
+        """
+        if np.any(lengths <= 0):
+            return None
+
+        ends = self.first_record_offset + np.cumsum(lengths)
+        offsets = ends - lengths
+        data_end = int(ends[-1])
+
+        # The trailer, when present, must directly follow the indexed records
+        trailer_position = self.header.trailer_position if self.header.has_trailer else 0
+        if trailer_position > 0:
+            if data_end != trailer_position:
+                return None
+        elif data_end > self.file_size:
+            return None
+
+        record_offsets = offsets.tolist()
+        event_counts = counts
+
+        # Keep the trailer as the last record, the same way the linear scan sees it
+        if trailer_position > 0 and trailer_position + RecordHeader.HEADER_SIZE <= self.file_size:
+            record_offsets.append(trailer_position)
+            event_counts = np.append(event_counts, 0)
+
+        self._record_event_counts = event_counts
+        return record_offsets
+
     def _scan_record_offsets(self) -> List[int]:
         """
         Scan the file to find all record offsets.
@@ -83,21 +289,23 @@ class EvioFile:
             List of record offsets in bytes
         """
         record_offsets = []
+        event_counts = []
         offset = self.first_record_offset
 
         while offset < self.file_size:
             try:
+                # Only the record header is needed to learn the record size
+                header = RecordHeader.parse(self.mm, offset)
+
                 # Store this record's position
                 record_offsets.append(offset)
-
-                # Create a temporary Record object to get its size
-                record = Record(self.mm, offset, self.header.endian)
+                event_counts.append(header.event_count)
 
                 # Move to next record
-                offset += record.size
+                offset += header.record_length * 4
 
                 # Stop if this was the last record
-                if record.header.is_last_record:
+                if header.is_last_record:
                     break
 
             except Exception as e:
@@ -105,6 +313,7 @@ class EvioFile:
                     print(f"Error scanning record at offset 0x{offset:X}: {e}")
                 raise
 
+        self._record_event_counts = np.array(event_counts, dtype=np.int64)
         return record_offsets
 
     @property
@@ -128,12 +337,42 @@ class EvioFile:
         if index < 0 or index >= len(self._record_offsets):
             raise IndexError(f"Record index {index} out of range (0-{len(self._record_offsets)-1})")
 
-        # Check if record is already cached
-        if index not in self._records:
-            offset = self._record_offsets[index]
-            self._records[index] = Record(self.mm, offset, self.header.endian, index=index)
+        record = self._get_cached_record(index)
+        if record is None:
+            record = self._store_record(self._create_record(index))
+
+        return record
+
+    def _get_cached_record(self, index: int, count_miss: bool = True) -> Optional[Record]:
+        """Get an already created record, or None (counted as a cache miss unless count_miss is False)."""
+        record = self._records.get(index)
+        if record is None:
+            record = self.record_cache.get(index, count_miss)
+        return record
+
+    def _create_record(self, index: int) -> Record:
+        """
+        Create (and for compressed records, decompress) a record without caching it.
+
+        Only reads the memory map, so it is safe to call from worker threads.
+        """
+        record = Record(self.mm, self._record_offsets[index], self.header.endian, index=index)
+
+        # Event positions are already known from the sidecar index
+        if self.file_index is not None:
+            offsets, lengths = self.file_index.get_record_events(index)
+            record._event_offsets = offsets
+            record._event_lengths = lengths.astype(np.int64)
+
+        return record
 
-        return self._records[index]
+    def _store_record(self, record: Record) -> Record:
+        """Cache a newly created record and return it."""
+        if record.is_compressed:
+            self.record_cache.put(record.index, record, record.memory_size)
+        else:
+            self._records[record.index] = record
+        return record
 
     def get_records(self) -> List[Record]:
         """
@@ -144,15 +383,52 @@ class EvioFile:
         """
         return [self.get_record(i) for i in range(len(self._record_offsets))]
 
-    def iter_records(self) -> Iterator[Record]:
+    def iter_records(self, prefetch: int = 0, workers: Optional[int] = None) -> Iterator[Record]:
         """
         Iterate through all records in the file.
 
+        With prefetch > 0 the next records are read and decompressed on a
+        thread pool while the caller processes the current one. LZ4 and zlib
+        release the GIL, so decompression of compressed files scales with
+        the number of workers. At most prefetch records, including the
+        current one, are held by the read-ahead window.
+
+        Args:
+            prefetch: Number of records in the read-ahead window (0 reads records on demand)
+            workers: Number of worker threads (default: min(prefetch, CPU count))
+
         Yields:
             Record objects
         """
-        for i in range(len(self._record_offsets)):
-            yield self.get_record(i)
+        if prefetch <= 0:
+            for i in range(len(self._record_offsets)):
+                yield self.get_record(i)
+            return
+
+        workers = workers or min(prefetch, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            next_index = 0
+
+            try:
+                for i in range(len(self._record_offsets)):
+                    # Keep at most `prefetch` records in the window, the current one included
+                    while next_index < len(self._record_offsets) and next_index < i + prefetch:
+                        # Only checks for a cached record, so a miss is not counted
+                        record = self._get_cached_record(next_index, count_miss=False)
+                        pending.append(record if record is not None
+                                       else executor.submit(self._create_record, next_index))
+                        next_index += 1
+
+                    record = pending.popleft()
+                    if not isinstance(record, Record):
+                        record = self._store_record(record.result())
+                    yield record
+            finally:
+                # Don't wait for read-ahead the caller no longer needs
+                for future in pending:
+                    if not isinstance(future, Record):
+                        future.cancel()
 
     def get_total_event_count(self) -> int:
         """
@@ -162,9 +438,7 @@ class EvioFile:
             Total event count
         """
         if self._total_event_count is None:
-            self._total_event_count = 0
-            for record in self.iter_records():
-                self._total_event_count += record.event_count
+            self._total_event_count = int(np.sum(self._record_event_counts))
 
         return self._total_event_count
 
@@ -184,25 +458,74 @@ class EvioFile:
         if global_index < 0:
             raise IndexError(f"Global event index {global_index} cannot be negative")
 
-        # Scan through records to find the record containing this event
-        current_index = 0
+        event_starts = self._get_record_event_starts()
+        total_events = int(event_starts[-1])
+        if global_index >= total_events:
+            raise IndexError(f"Global event index {global_index} out of range (0-{total_events-1})")
+
+        # Last record starting at or before this event
+        record_idx = int(np.searchsorted(event_starts, global_index, side='right')) - 1
+        record = self.get_record(record_idx)
+        event = record.get_event(global_index - int(event_starts[record_idx]))
+        return record, event
+
+    def get_events_by_global_index(self, indices) -> List[Tuple[Record, Event]]:
+        """
+        Get many events by global index at once.
+
+        Requested indices are grouped by record, so each record is located
+        and scanned only once.
+
+        Args:
+            indices: Sequence or array of global event indices (0-based)
+
+        Returns:
+            List of (Record, Event) tuples in the order of the requested indices
+
+        Raises:
+            IndexError: If any index is out of range
+        """
+        indices = np.asarray(indices, dtype=np.int64).ravel()
+        if len(indices) == 0:
+            return []
 
-        for record_idx in range(len(self._record_offsets)):
+        event_starts = self._get_record_event_starts()
+        total_events = int(event_starts[-1])
+        bad = (indices < 0) | (indices >= total_events)
+        if np.any(bad):
+            raise IndexError(f"Global event index {int(indices[bad][0])} out of range (0-{total_events-1})")
+
+        record_indices = np.searchsorted(event_starts, indices, side='right') - 1
+        local_indices = indices - event_starts[record_indices]
+
+        # Positions of the requested indices grouped by record in one sort
+        order = np.argsort(record_indices, kind='stable')
+        records, bounds = np.unique(record_indices[order], return_index=True)
+
+        result = [None] * len(indices)
+        for record_idx, positions in zip(records.tolist(), np.split(order, bounds[1:])):
             record = self.get_record(record_idx)
-            event_count = record.event_count
+            events = record.get_events()
+            for position, local_index in zip(positions.tolist(), local_indices[positions].tolist()):
+                result[position] = (record, events[local_index])
+
+        return result
 
-            # Check if this event is in the current record
-            if current_index + event_count > global_index:
-                # Found the record containing this event
-                local_event_index = global_index - current_index
-                event = record.get_event(local_event_index)
-                return record, event
+    def _get_record_event_starts(self) -> np.ndarray:
+        """
+        Get the cumulative event count array.
 
-            # Move to next record
-            current_index += event_count
+        Element i is the global index of the first event of record i; the last
+        element is the total event count.
 
-        # If we get here, the global_index is out of range
-        raise IndexError(f"Global event index {global_index} out of range (0-{current_index-1})")
+        Returns:
+            int64 array of length record_count + 1
+        """
+        if self._record_event_starts is None:
+            starts = np.zeros(len(self._record_offsets) + 1, dtype=np.int64)
+            np.cumsum(self._record_event_counts, out=starts[1:])
+            self._record_event_starts = starts
+        return self._record_event_starts
 
     def get_event(self, global_index: int) -> Event:
         """Gets event by the global index, automatically finds record, where it is located
@@ -213,9 +536,355 @@ class EvioFile:
 
         Returns: found events
         """
-        _, _, event, _ = self.get_record_and_event(global_index)
+        _, event = self.get_record_and_event(global_index)
         return event
 
+    def iter_event_arrays(self, batch_events: int = 65536, batch_bytes: Optional[int] = None,
+                          prefetch: int = 0) -> Iterator[EventBatch]:
+        """
+        Iterate through all events in columnar batches.
+
+        Consecutive events are collected across record boundaries until the
+        batch holds batch_events events or, if given, batch_bytes bytes of event
+        data (a batch always holds at least one event). The events of a record
+        are contiguous, so each record contributes one block copy per batch.
+
+        Args:
+            batch_events: Maximum number of events per batch
+            batch_bytes: Optional maximum size of the event data per batch in bytes
+            prefetch: Number of records to read ahead (see iter_records)
+
+        Yields:
+            EventBatch objects in file order
+        """
+        if batch_events <= 0:
+            raise ValueError(f"batch_events must be positive, got {batch_events}")
+
+        word_dtype = evio_dtype(Bank.TYPE_UINT32, self.header.endian)
+        pieces = []
+        batch_count = 0
+        batch_size = 0
+        event_start = 0
+
+        for record in self.iter_records(prefetch=prefetch):
+            offsets, lengths = record.get_event_offsets()
+            tags = record.get_event_tags(offsets, lengths)
+            position = 0
+
+            while position < len(offsets):
+                take = min(batch_events - batch_count, len(offsets) - position)
+                if batch_bytes is not None:
+                    sizes = np.cumsum(lengths[position:position + take])
+                    fitting = int(np.searchsorted(sizes, batch_bytes - batch_size, side='right'))
+                    take = max(fitting, 1 if batch_count == 0 else 0)
+
+                if take > 0:
+                    end = position + take
+                    first_byte = int(offsets[position])
+                    last_byte = int(offsets[end - 1] + lengths[end - 1])
+                    pieces.append((
+                        buffer_view(record.mm, first_byte, (last_byte - first_byte) // 4, word_dtype),
+                        (offsets[position:end] - first_byte) // 4,
+                        event_start + np.arange(position, end, dtype=np.int64),
+                        tags[position:end],
+                        lengths[position:end]
+                    ))
+                    batch_count += take
+                    batch_size += last_byte - first_byte
+                    position = end
+
+                if batch_count >= batch_events or (batch_bytes is not None and position < len(offsets)):
+                    yield self._make_event_batch(pieces)
+                    pieces = []
+                    batch_count = 0
+                    batch_size = 0
+
+            event_start += len(offsets)
+
+        if pieces:
+            yield self._make_event_batch(pieces)
+
+    @staticmethod
+    def _make_event_batch(pieces) -> EventBatch:
+        """Concatenate (words, word_offsets, event_index, tags, lengths) pieces into a batch."""
+        words, word_offsets, event_index, tags, lengths = zip(*pieces)
+
+        # Shift each piece's word offsets by the words before it
+        bases = np.cumsum([0] + [len(w) for w in words])
+        offsets = np.empty(sum(len(o) for o in word_offsets) + 1, dtype=np.int64)
+        np.concatenate([o + base for o, base in zip(word_offsets, bases[:-1].tolist())], out=offsets[:-1])
+        offsets[-1] = bases[-1]
+
+        return EventBatch(
+            # Converted to native byte order in the same pass as the copy
+            words=np.concatenate(words, dtype=np.uint32),
+            word_offsets=offsets,
+            event_index=np.concatenate(event_index),
+            tags=np.concatenate(tags),
+            lengths=np.concatenate(lengths)
+        )
+
+    def select(self, path: str, dtype=None, prefetch: int = 0) -> Selection:
+        """
+        Extract the payload of every bank matching a tag path from all events.
+
+        Only headers are walked. Events whose top-level tag does not match the
+        first level of the path are skipped without being walked, and banks are
+        not descended into below the depth of the path.
+
+        Args:
+            path: Tag-path expression, e.g. "0xFF50|0xFF60/0xFF21/*" (see parse_tag_path)
+            dtype: NumPy dtype of the data (in file byte order). By default it is taken
+                from the data type of the matched banks, which must then all agree
+            prefetch: Number of records to read ahead (see iter_records)
+
+        Returns:
+            Selection with the data of all matched banks in file order
+
+        Raises:
+            ValueError: If the path is invalid, or dtype is not given and the matched
+                banks have different or non-numeric data types
+        """
+        levels = parse_tag_path(path)
+        top_tags = levels[0]
+        infer_dtype = dtype is None
+        data_type = None
+        if not infer_dtype:
+            dtype = np.dtype(dtype).newbyteorder(self.header.endian)
+
+        chunks = []
+        counts = []
+        event_indices = []
+        tags = []
+        event_start = 0
+
+        for record in self.iter_records(prefetch=prefetch):
+            offsets, lengths = record.get_event_offsets()
+            record_start = event_start
+            event_start += len(offsets)
+            if len(offsets) == 0:
+                continue
+
+            # Predicate pushdown on the top-level tag
+            events = np.arange(len(offsets))
+            if top_tags is not None:
+                events = np.flatnonzero(np.isin(record.get_event_tags(offsets, lengths), top_tags))
+                if len(events) == 0:
+                    continue
+
+            table = BankTable.parse_events(record.mm, offsets[events], lengths[events], record.endian,
+                                           max_depth=len(levels) - 1)
+            matches = table.select(levels)
+            if len(matches) == 0:
+                continue
+
+            if infer_dtype:
+                # The matched banks of every record must share one data type
+                data_types = np.unique(table.data_type[matches])
+                if data_type is not None:
+                    data_types = np.union1d(data_types, [data_type])
+                if len(data_types) != 1:
+                    raise ValueError(f"Matched banks have data types {data_types.tolist()}, pass a dtype")
+                if data_type is None:
+                    data_type = int(data_types[0])
+                    dtype = evio_dtype(data_type, record.endian)
+                    if dtype is None:
+                        raise ValueError(f"Matched banks have non-numeric data type {data_type:#x}, pass a dtype")
+
+            # Payload sizes without the padding of 8 and 16 bit data
+            data_counts = (table.data_length[matches] - table.pad[matches]) // dtype.itemsize
+            flat, _ = record.gather_events(table.data_offset[matches], data_counts * dtype.itemsize, dtype)
+            chunks.append(flat)
+
+            counts.append(data_counts)
+            event_indices.append(record_start + events[table.root_of(matches)])
+            tags.append(table.tag[matches])
+
+        offsets = np.zeros(sum(len(c) for c in counts) + 1, dtype=np.int64)
+        if counts:
+            np.cumsum(np.concatenate(counts), out=offsets[1:])
+        if dtype is None:
+            dtype = evio_dtype(Bank.TYPE_UINT32, self.header.endian)
+
+        return Selection(
+            data=np.concatenate(chunks) if chunks else np.zeros(0, dtype=dtype),
+            offsets=offsets,
+            event_index=np.concatenate(event_indices) if event_indices else np.zeros(0, dtype=np.int64),
+            tags=np.concatenate(tags) if tags else np.zeros(0, dtype=np.uint16)
+        )
+
+    def time_slice_table(self, prefetch: int = 0) -> np.ndarray:
+        """
+        Get the frame numbers, timestamps and payload layout of all ROC Time Slice Bank events.
+
+        Only the fixed-position TSS and AIS words of every event are read, with
+        one vectorized gather per record; no RocTimeSliceBank or PayloadBank
+        objects are created. The table is computed once and is taken from the
+        sidecar index when it was built with time_slices=True.
+
+        Args:
+            prefetch: Number of records to read ahead (see iter_records)
+
+        Returns:
+            Structured array with TIME_SLICE_DTYPE (event, frame_number, timestamp,
+            stream_status, payload_count, payload_offset), one row per time-slice event
+        """
+        if self._time_slice_table is None:
+            tables = []
+            event_start = 0
+            for record in self.iter_records(prefetch=prefetch):
+                offsets, lengths = record.get_event_offsets()
+                words = buffer_view(record.mm, record.data_start, (record.data_end - record.data_start) // 4,
+                                    record.word_dtype)
+                first = (offsets - record.data_start) // 4
+                headers = decode_time_slice_headers(words, first, np.minimum(first + lengths // 4, len(words)))
+                headers['event'] += event_start
+                tables.append(headers)
+                event_start += len(offsets)
+
+            self._time_slice_table = np.concatenate(tables) if tables else np.zeros(0, dtype=TIME_SLICE_DTYPE)
+        return self._time_slice_table
+
+    def extract_waveforms(self, module_id: int, channel: int, events=None, layout: Optional[PayloadLayout] = None,
+                          port_num: Optional[int] = None, return_index: bool = False, prefetch: int = 0):
+        """
+        Extract the waveform of one channel from many ROC Time Slice Bank events.
+
+        Events are selected from the time-slice table; the stream info headers,
+        payload infos and payload length words of all selected events of a
+        record are read with NumPy gathers, and the samples of every record
+        are copied with one fancy-index gather. No bank objects are created.
+
+        Args:
+            module_id: Module id of the payloads (from the AIS payload infos)
+            channel: Channel number within the payload
+            events: Optional global event indices to restrict the extraction to
+            layout: Waveform layout of the payloads (default: guessed from the first matching payload)
+            port_num: Optional port number to further select the payloads
+            return_index: Also return the global event index of every waveform
+            prefetch: Number of records to read ahead while building the time-slice table
+                (see iter_records)
+
+        Returns:
+            (n_waveforms, samples) uint16 array in native byte order with one row
+            per matching payload in file order, and with return_index the array of
+            their global event indices
+
+        Raises:
+            ValueError: If the channel is out of range or a payload is too short for the layout
+        """
+        table = self.time_slice_table(prefetch=prefetch)
+        if events is not None:
+            table = table[np.isin(table['event'], np.asarray(events, dtype=np.int64))]
+
+        # The table is in file order, so the rows of every record are contiguous
+        event_starts = self._get_record_event_starts()
+        record_indices = np.searchsorted(event_starts, table['event'], side='right') - 1
+        bounds = np.flatnonzero(np.diff(record_indices)) + 1
+
+        chunks = []
+        event_indices = []
+        for rows in np.split(np.arange(len(table)), bounds):
+            if len(rows) == 0:
+                continue
+            record_idx = int(record_indices[rows[0]])
+            record = self.get_record(record_idx)
+            offsets, lengths = record.get_event_offsets()
+            local_events = table['event'][rows] - event_starts[record_idx]
+            words = buffer_view(record.mm, record.data_start, (record.data_end - record.data_start) // 4,
+                                record.word_dtype)
+            first = (offsets[local_events] - record.data_start) // 4
+            headers = decode_time_slice_headers(words, first,
+                                                np.minimum(first + lengths[local_events] // 4, len(words)))
+            global_events = table['event'][rows][headers['event']]
+            starts, payload_events = self._find_time_slice_payloads(
+                record, words, first[headers['event']], headers, module_id, port_num)
+            if len(starts) == 0:
+                continue
+            payload_events = global_events[payload_events]
+
+            if layout is None:
+                layout = PayloadBank(record.mm, record.data_start + int(starts[0]) * 4, record.endian).layout
+            if channel < 0 or channel >= layout.channels:
+                raise ValueError(f"Channel {channel} out of range (0-{layout.channels-1})")
+
+            # Data sizes from the payload length words and the pad bits of the payload headers
+            data_bytes = words[starts].astype(np.int64) * 4 - 4 - ((words[starts + 1] >> 14) & 0x3)
+            short = np.flatnonzero(data_bytes // 2 < layout.size)
+            if len(short):
+                raise ValueError(f"Payload in event {int(payload_events[short[0]])} too short for {layout}")
+
+            samples = words.view(evio_dtype(Bank.TYPE_UINT16, record.endian))
+            index = (starts[:, None] + 2) * 2 + layout.sample_index()[channel]
+            # Converted to native byte order in the same pass as the copy
+            chunks.append(samples[index].astype(np.uint16))
+            event_indices.append(payload_events)
+
+        samples_per_channel = layout.samples if layout is not None else 0
+        waveforms = (np.concatenate(chunks) if chunks
+                     else np.zeros((0, samples_per_channel), dtype=np.uint16))
+        if return_index:
+            return waveforms, (np.concatenate(event_indices) if event_indices else np.zeros(0, dtype=np.int64))
+        return waveforms
+
+    @staticmethod
+    def _find_time_slice_payloads(record: Record, words: np.ndarray, first: np.ndarray, headers: np.ndarray,
+                                  module_id: int, port_num: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locate the matching payload banks of many time-slice events of one record.
+
+        The payloads of an event follow each other, so the k-th payload of all
+        events is found in one step from the length words of the (k-1)-th ones.
+        An event's walk stops at a zero length or at a payload overrunning the
+        event, as in RocTimeSliceBank.
+
+        Args:
+            record: Record holding the events
+            words: 32-bit words of the record's data section
+            first: Word index of every event in words
+            headers: Stream info headers of the events (see decode_time_slice_headers)
+            module_id: Module id of the payloads
+            port_num: Optional port number of the payloads
+
+        Returns:
+            Tuple of (header word index in the data section, position in first)
+            of every matching payload, in file order
+        """
+        payload_offset = headers['payload_offset'].astype(np.int64)
+        payload_count = headers['payload_count'].astype(np.int64)
+        shorts = words.view(evio_dtype(Bank.TYPE_UINT16, record.endian))
+        max_count = int(payload_count.max()) if len(payload_count) else 0
+        slots = np.arange(max_count)
+
+        # Payload infos are the shorts just after the AIS header, which follows the TSS
+        info_start = (first + 6 + (words[first + 4] & 0xFFFF).astype(np.int64)) * 2
+        has_info = slots[None, :] < payload_count[:, None]
+        raw = shorts[np.where(has_info, info_start[:, None] + slots[None, :], 0)]
+        infos = decode_payload_infos(raw.ravel()).reshape(raw.shape)
+
+        # Walk the payload length words of all events in step; banks span length + 1 words
+        event_end = np.minimum(first + 1 + words[first].astype(np.int64), len(words))
+        headers = np.zeros((len(first), max_count), dtype=np.int64)
+        found = np.zeros((len(first), max_count), dtype=bool)
+        current = first + payload_offset // 4
+        active = np.ones(len(first), dtype=bool)
+        for slot in range(max_count):
+            active &= (slot < payload_count) & (current < event_end)
+            length = np.zeros(len(first), dtype=np.int64)
+            length[active] = words[current[active]]
+            active &= (length > 0) & (current + length + 1 <= event_end)
+            headers[:, slot] = current
+            found[:, slot] = active
+            current = current + length + 1
+
+        match = found & (infos['module_id'] == module_id)
+        if port_num is not None:
+            match &= infos['port_num'] == port_num
+
+        # Row-major order of (event, slot) is file order
+        positions, _ = np.nonzero(match)
+        return headers[match], positions
+
     def iter_events(self) -> Iterator[Tuple[Record, Event]]:
         """
         Iterate through all events in the file.
@@ -0,0 +1,254 @@
+import hashlib
+import os
+import zlib
+from typing import List, Optional
+
+import numpy as np
+
+
+class FileIndex:
+    """
+    Persistent sidecar index (.evidx) of an EVIO file.
+
+    Holds record offsets, per-record event counts and per-event
+    (offset, length, top-level tag) arrays, so that a file can be reopened
+    without walking its records and events again. The time-slice table of a
+    streaming file can be stored along with them. The index is stored as a
+    NumPy .npz archive and is validated against the file size, modification
+    time and a checksum of the file header before use.
+    """
+
+    # Sidecar file suffix
+    SUFFIX = ".evidx"
+
+    # Bump when the stored layout changes
+    FORMAT_VERSION = 1
+
+    # Environment variable with a directory to keep index files in
+    CACHE_DIR_ENV = "PYEVIO_INDEX_DIR"
+
+    def __init__(self, record_offsets: np.ndarray, record_event_counts: np.ndarray,
+                 event_offsets: np.ndarray, event_lengths: np.ndarray, event_tags: np.ndarray,
+                 file_size: int = 0, mtime_ns: int = 0, header_checksum: int = 0,
+                 time_slices: Optional[np.ndarray] = None):
+        """
+        Initialize a FileIndex from its arrays.
+
+        Args:
+            record_offsets: Byte offset of every record
+            record_event_counts: Number of events in every record
+            event_offsets: Byte offset of every event in the file, or in the
+                decompressed buffer for compressed records
+            event_lengths: Length of every event in bytes
+            event_tags: Top-level bank tag of every event
+            file_size: Size of the indexed file in bytes
+            mtime_ns: Modification time of the indexed file in nanoseconds
+            header_checksum: CRC32 of the indexed file header
+            time_slices: Optional time-slice table (see EvioFile.time_slice_table)
+        """
+        self.record_offsets = np.asarray(record_offsets, dtype=np.int64)
+        self.record_event_counts = np.asarray(record_event_counts, dtype=np.int64)
+        self.event_offsets = np.asarray(event_offsets, dtype=np.int64)
+        self.event_lengths = np.asarray(event_lengths, dtype=np.uint32)
+        self.event_tags = np.asarray(event_tags, dtype=np.uint16)
+        self.file_size = file_size
+        self.mtime_ns = mtime_ns
+        self.header_checksum = header_checksum
+        self.time_slices = time_slices
+
+        # First global event index of every record
+        self.record_event_starts = np.concatenate(([0], np.cumsum(self.record_event_counts)[:-1])).astype(np.int64)
+
+    @property
+    def event_count(self) -> int:
+        """Get the total number of indexed events."""
+        return len(self.event_offsets)
+
+    @staticmethod
+    def default_path(filename: str, cache_dir: Optional[str] = None) -> str:
+        """
+        Get the index file path for a data file.
+
+        The index is kept next to the data file unless a cache directory is given
+        directly or through the PYEVIO_INDEX_DIR environment variable.
+
+        Args:
+            filename: Path to the EVIO file
+            cache_dir: Optional directory to keep index files in
+
+        Returns:
+            Path to the index file
+        """
+        cache_dir = cache_dir or os.environ.get(FileIndex.CACHE_DIR_ENV)
+        if not cache_dir:
+            return filename + FileIndex.SUFFIX
+
+        # Different files with the same name must not share an index
+        path_hash = hashlib.sha1(os.path.abspath(filename).encode()).hexdigest()[:12]
+        return os.path.join(cache_dir, f"{os.path.basename(filename)}.{path_hash}{FileIndex.SUFFIX}")
+
+    @staticmethod
+    def search_paths(filename: str, cache_dir: Optional[str] = None) -> List[str]:
+        """
+        Get the paths where an index for a data file may have been saved.
+
+        Args:
+            filename: Path to the EVIO file
+            cache_dir: Optional directory to keep index files in
+
+        Returns:
+            List of index file paths: the cache directory one (given directly or
+            through PYEVIO_INDEX_DIR) first, then the one next to the data file
+        """
+        paths = [FileIndex.default_path(filename, cache_dir)]
+        if paths[0] != filename + FileIndex.SUFFIX:
+            paths.append(filename + FileIndex.SUFFIX)
+        return paths
+
+    @staticmethod
+    def file_signature(evio_file) -> tuple:
+        """
+        Get the (file size, mtime in ns, header checksum) signature of an open file.
+
+        Args:
+            evio_file: EvioFile object
+
+        Returns:
+            Tuple of (file_size, mtime_ns, header_checksum)
+        """
+        header_size = evio_file.header.header_length * 4
+        checksum = zlib.crc32(evio_file.mm[0:header_size])
+        return evio_file.file_size, os.stat(evio_file.filename).st_mtime_ns, checksum
+
+    @classmethod
+    def build(cls, evio_file, time_slices: bool = False) -> 'FileIndex':
+        """
+        Build an index by scanning all records and events of a file.
+
+        Args:
+            evio_file: EvioFile object
+            time_slices: Also build the time-slice table of the file
+
+        Returns:
+            FileIndex object
+        """
+        offsets = []
+        lengths = []
+        tags = []
+        counts = []
+
+        for record in evio_file.iter_records():
+            record_offsets, record_lengths = record.get_event_offsets()
+            counts.append(len(record_offsets))
+            if len(record_offsets) == 0:
+                continue
+
+            record_tags = record.get_event_tags(record_offsets, record_lengths)
+
+            offsets.append(record_offsets)
+            lengths.append(record_lengths)
+            tags.append(record_tags)
+
+        file_size, mtime_ns, checksum = cls.file_signature(evio_file)
+
+        return cls(
+            record_offsets=np.array(evio_file._record_offsets, dtype=np.int64),
+            record_event_counts=np.array(counts, dtype=np.int64),
+            event_offsets=np.concatenate(offsets) if offsets else np.zeros(0, dtype=np.int64),
+            event_lengths=np.concatenate(lengths) if lengths else np.zeros(0, dtype=np.uint32),
+            event_tags=np.concatenate(tags) if tags else np.zeros(0, dtype=np.uint16),
+            file_size=file_size,
+            mtime_ns=mtime_ns,
+            header_checksum=checksum,
+            time_slices=evio_file.time_slice_table() if time_slices else None
+        )
+
+    def save(self, path: str):
+        """
+        Save the index to a file.
+
+        The index is written to a temporary file first and then moved in place,
+        so concurrent readers never see a partially written index.
+
+        Args:
+            path: Path to the index file
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # The time-slice table is optional; older readers ignore it
+        extra = {} if self.time_slices is None else {"time_slices": self.time_slices}
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f,
+                     meta=np.array([self.FORMAT_VERSION, self.file_size, self.mtime_ns, self.header_checksum],
+                                   dtype=np.int64),
+                     record_offsets=self.record_offsets,
+                     record_event_counts=self.record_event_counts,
+                     event_offsets=self.event_offsets,
+                     event_lengths=self.event_lengths,
+                     event_tags=self.event_tags,
+                     **extra)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'FileIndex':
+        """
+        Load an index from a file without validating it.
+
+        Args:
+            path: Path to the index file
+
+        Returns:
+            FileIndex object
+
+        Raises:
+            ValueError: If the index file has an unsupported format version
+        """
+        with np.load(path) as data:
+            version, file_size, mtime_ns, checksum = (int(v) for v in data["meta"])
+            if version != cls.FORMAT_VERSION:
+                raise ValueError(f"Unsupported index format version: {version}, expected {cls.FORMAT_VERSION}")
+
+            return cls(
+                record_offsets=data["record_offsets"],
+                record_event_counts=data["record_event_counts"],
+                event_offsets=data["event_offsets"],
+                event_lengths=data["event_lengths"],
+                event_tags=data["event_tags"],
+                file_size=file_size,
+                mtime_ns=mtime_ns,
+                header_checksum=checksum,
+                time_slices=data["time_slices"] if "time_slices" in data else None
+            )
+
+    def is_valid_for(self, evio_file) -> bool:
+        """
+        Check that this index was built for the given file in its current state.
+
+        Args:
+            evio_file: EvioFile object
+
+        Returns:
+            True if the file size, modification time and header checksum match
+        """
+        return (self.file_size, self.mtime_ns, self.header_checksum) == self.file_signature(evio_file)
+
+    def get_record_events(self, record_index: int):
+        """
+        Get the event offsets and lengths of one record.
+
+        Args:
+            record_index: Record index (0-based)
+
+        Returns:
+            Tuple of (offsets, lengths) arrays
+        """
+        start = self.record_event_starts[record_index]
+        end = start + self.record_event_counts[record_index]
+        return self.event_offsets[start:end], self.event_lengths[start:end]
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"FileIndex(records={len(self.record_offsets)}, events={self.event_count})"
@@ -0,0 +1,256 @@
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from pyevio.roc_time_slice_bank import PayloadLayout, RocTimeSliceBank, decode_time_slice_headers
+from pyevio.utils import buffer_view
+
+
+class Frame:
+    """
+    Time-slice banks of all ROCs for one frame number.
+
+    Banks are keyed by ROC id (the tag of the ROC Time Slice Bank). ROCs that
+    were expected but did not arrive before the frame was closed are listed
+    in missing.
+    """
+
+    def __init__(self, frame_number: int, banks: Dict[int, RocTimeSliceBank], event_index: Dict[int, int],
+                 missing: List[int]):
+        """
+        Initialize a Frame.
+
+        Args:
+            frame_number: TSS frame number
+            banks: ROC Time Slice Bank of every ROC that arrived
+            event_index: Global event index of every ROC's bank
+            missing: Sorted ids of the expected ROCs that did not arrive
+        """
+        self.frame_number = frame_number
+        self.banks = banks
+        self.event_index = event_index
+        self.missing = missing
+
+    @property
+    def complete(self) -> bool:
+        """Check that all expected ROCs arrived."""
+        return not self.missing
+
+    @property
+    def timestamp(self) -> int:
+        """Get the earliest timestamp of the frame's banks."""
+        return min(bank.sib.timestamp for bank in self.banks.values())
+
+    def payloads(self) -> Dict[int, List[np.ndarray]]:
+        """
+        Get the payload data of every ROC.
+
+        Returns:
+            Dictionary mapping each ROC id to its payload data (see RocTimeSliceBank.get_all_data_numpy)
+        """
+        return {roc_id: bank.get_all_data_numpy() for roc_id, bank in self.banks.items()}
+
+    def __len__(self) -> int:
+        """Get the number of ROCs in the frame."""
+        return len(self.banks)
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"Frame(frame_number={self.frame_number}, rocs={sorted(self.banks)}, missing={self.missing})"
+
+
+class FrameBuilder:
+    """
+    Groups ROC Time Slice Banks from several ROCs by frame number.
+
+    Banks are bucketed in a hash table of open frames keyed by frame number.
+    A frame is emitted as soon as all expected ROCs have arrived. Frames that
+    stay open too long are closed incomplete: when the frame number has fallen
+    more than timeout frames behind the newest one seen, or when more than
+    window frames are open (the lowest frame number is closed first). Memory
+    is therefore bounded by the window size, whatever the size of the input.
+
+    Banks arriving for a frame that was already closed are counted as late
+    and dropped.
+    """
+
+    def __init__(self, rocs: Optional[Iterable[int]] = None, window: int = 64, timeout: Optional[int] = None,
+                 emit_incomplete: bool = True):
+        """
+        Initialize a FrameBuilder.
+
+        Args:
+            rocs: Ids of the ROCs expected in every frame. If not given, frames are
+                only closed by the timeout, the window or a flush, and every ROC
+                seen by then is expected
+            window: Maximum number of open frames
+            timeout: Close frames that are more than this many frame numbers older
+                than the newest frame seen (default: no timeout, only the window applies)
+            emit_incomplete: Emit frames with missing ROCs when they are closed
+                instead of dropping them
+
+        Raises:
+            ValueError: If window is not positive or timeout is negative
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        if timeout is not None and timeout < 0:
+            raise ValueError(f"timeout must not be negative, got {timeout}")
+
+        self.rocs = set(rocs) if rocs is not None else set()
+        self.learn_rocs = rocs is None
+        self.window = window
+        self.timeout = timeout
+        self.emit_incomplete = emit_incomplete
+
+        # Open frames: frame number -> (banks, event indices), in arrival order
+        self._open: "OrderedDict[int, tuple]" = OrderedDict()
+        self._newest = None
+
+        # Recently closed frame numbers, and the highest frame number closed
+        # by the timeout or the window, to recognize late banks
+        self._closed = deque(maxlen=window)
+        self._closed_set = set()
+        self._watermark = None
+
+        # Statistics
+        self.complete_count = 0
+        self.incomplete_count = 0
+        self.late: Dict[int, int] = {}
+        self.missing: Dict[int, int] = {}
+        self.duplicates = 0
+
+    def add(self, roc_id: int, frame_number: int, bank: RocTimeSliceBank, event_index: int = -1) -> List[Frame]:
+        """
+        Add the time-slice bank of one ROC.
+
+        Args:
+            roc_id: ROC id
+            frame_number: TSS frame number of the bank
+            bank: ROC Time Slice Bank
+            event_index: Global event index of the bank
+
+        Returns:
+            List of frames closed by this bank (possibly empty)
+        """
+        if frame_number not in self._open and self._is_closed(frame_number):
+            self.late[roc_id] = self.late.get(roc_id, 0) + 1
+            return []
+
+        if self.learn_rocs:
+            self.rocs.add(roc_id)
+
+        banks, event_indices = self._open.setdefault(frame_number, ({}, {}))
+        if roc_id in banks:
+            self.duplicates += 1
+            return []
+        banks[roc_id] = bank
+        event_indices[roc_id] = event_index
+
+        if self._newest is None or frame_number > self._newest:
+            self._newest = frame_number
+
+        closed = []
+        if not self.learn_rocs and self.rocs.issubset(banks):
+            closed.append(self._close(frame_number))
+
+        # Frames that timed out
+        if self.timeout is not None:
+            for number in [n for n in self._open if n < self._newest - self.timeout]:
+                closed.append(self._close(number, evicted=True))
+
+        # Keep the number of open frames within the window
+        while len(self._open) > self.window:
+            closed.append(self._close(min(self._open), evicted=True))
+
+        return [frame for frame in closed if frame is not None]
+
+    def flush(self) -> List[Frame]:
+        """
+        Close all open frames, e.g. at the end of the input.
+
+        Returns:
+            List of the closed frames in frame number order
+        """
+        closed = [self._close(number, evicted=True) for number in sorted(self._open)]
+        return [frame for frame in closed if frame is not None]
+
+    def iter_frames(self, evio_file, prefetch: int = 0,
+                    layouts: Union[PayloadLayout, Dict[int, PayloadLayout], None] = None) -> Iterator[Frame]:
+        """
+        Build frames from all ROC Time Slice Bank events of a file.
+
+        Time-slice events are found from their header words without parsing
+        other events, and the file is read record by record.
+
+        Args:
+            evio_file: EvioFile object
+            prefetch: Number of records to read ahead (see EvioFile.iter_records)
+            layouts: Payload waveform layouts (see RocTimeSliceBank)
+
+        Yields:
+            Frames in the order they are closed
+        """
+        event_start = 0
+        for record in evio_file.iter_records(prefetch=prefetch):
+            offsets, lengths = record.get_event_offsets()
+            words = buffer_view(record.mm, record.data_start, (record.data_end - record.data_start) // 4,
+                                record.word_dtype)
+            first = (offsets - record.data_start) // 4
+            headers = decode_time_slice_headers(words, first, np.minimum(first + lengths // 4, len(words)))
+            roc_ids = record.get_event_tags(offsets[headers['event']], lengths[headers['event']])
+
+            for event, frame_number, roc_id in zip(headers['event'].tolist(), headers['frame_number'].tolist(),
+                                                   roc_ids.tolist()):
+                bank = RocTimeSliceBank(record.mm, int(offsets[event]), record.endian, layouts)
+                yield from self.add(roc_id, frame_number, bank, event_start + event)
+
+            event_start += len(offsets)
+
+        yield from self.flush()
+
+    def _is_closed(self, frame_number: int) -> bool:
+        """Check if a frame was already closed."""
+        if frame_number in self._closed_set:
+            return True
+        return self._watermark is not None and frame_number <= self._watermark
+
+    def _close(self, frame_number: int, evicted: bool = False) -> Optional[Frame]:
+        """
+        Close an open frame and update the statistics.
+
+        Args:
+            frame_number: Frame number of the open frame
+            evicted: The frame is closed by the timeout, the window or a flush
+
+        Returns:
+            The Frame, or None if it is incomplete and incomplete frames are dropped
+        """
+        banks, event_indices = self._open.pop(frame_number)
+
+        if len(self._closed) == self._closed.maxlen:
+            self._closed_set.discard(self._closed[0])
+        self._closed.append(frame_number)
+        self._closed_set.add(frame_number)
+        if evicted and (self._watermark is None or frame_number > self._watermark):
+            self._watermark = frame_number
+
+        missing = sorted(self.rocs.difference(banks))
+        for roc_id in missing:
+            self.missing[roc_id] = self.missing.get(roc_id, 0) + 1
+
+        if missing:
+            self.incomplete_count += 1
+            if not self.emit_incomplete:
+                return None
+        else:
+            self.complete_count += 1
+
+        return Frame(frame_number, banks, event_indices, missing)
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return (f"FrameBuilder(rocs={sorted(self.rocs)}, open={len(self._open)}, "
+                f"complete={self.complete_count}, incomplete={self.incomplete_count}, "
+                f"late={sum(self.late.values())})")
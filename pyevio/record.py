@@ -1,12 +1,59 @@
 import mmap
 import struct
+import zlib
 from typing import List, Tuple, Optional, Dict, Any
 from datetime import datetime
 from typing import Optional, List, Tuple, Dict, Any
 from pyevio.record_header import RecordHeader
-from pyevio.utils import make_hex_dump
+from pyevio.bank import Bank
+from pyevio.dtypes import evio_dtype
+from pyevio.utils import make_hex_dump, buffer_view, gather_ranges
 import numpy as np
 
+try:
+    import lz4.block
+except ImportError:  # pragma: no cover - lz4 is a declared dependency
+    lz4 = None
+
+
+# Record compression types (word 9, bits 28-31)
+COMPRESSION_NONE = 0
+COMPRESSION_LZ4 = 1
+COMPRESSION_LZ4_BEST = 2
+COMPRESSION_GZIP = 3
+
+
+def decompress_payload(data: bytes, compression_type: int, uncompressed_length: int) -> bytes:
+    """
+    Decompress a record payload.
+
+    Args:
+        data: Compressed bytes, without padding
+        compression_type: Compression type from the record header
+        uncompressed_length: Expected (maximum) size of the decompressed payload in bytes
+
+    Returns:
+        Decompressed payload bytes
+
+    Raises:
+        ValueError: If the compression type is not supported or the data is corrupt
+    """
+    if compression_type in (COMPRESSION_LZ4, COMPRESSION_LZ4_BEST):
+        if lz4 is None:
+            raise ValueError("LZ4 compressed record found but the lz4 package is not installed")
+        try:
+            return lz4.block.decompress(data, uncompressed_size=uncompressed_length)
+        except lz4.block.LZ4BlockError as e:
+            raise ValueError(f"Corrupt LZ4 record payload: {e}")
+
+    if compression_type == COMPRESSION_GZIP:
+        try:
+            return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(data)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt gzip record payload: {e}")
+
+    raise ValueError(f"Unsupported record compression type: {compression_type}")
+
 
 class Record:
     """
@@ -32,19 +79,60 @@ class Record:
 
         # Parse the record header
         self.header = RecordHeader.parse(mm, offset)
-
-        # Calculate key positions in the record
         self.header_size = self.header.header_length * 4
-        self.index_array_start = self.offset + self.header_size
-        self.index_array_end = self.index_array_start + self.header.index_array_length
-        self.data_start = self.index_array_end + self.header.user_header_length
-        self.data_end = self.offset + (self.header.record_length * 4)
         self.size = self.header.record_length * 4
         self.index = index
 
+        # Start of the record within self.mm. A compressed record is
+        # decompressed into its own buffer, so positions of its index array
+        # and events are relative to that buffer instead of the file
+        self.buffer_offset = offset
+        self.is_compressed = self.header.is_compressed
+        if self.is_compressed:
+            self.mm = self._decompress()
+            self.buffer_offset = 0
+
+        # Calculate key positions in the record
+        self.index_array_start = self.buffer_offset + self.header_size
+        self.index_array_end = self.index_array_start + self.header.index_array_length
+        self.data_start = (self.index_array_end + self.header.user_header_length
+                           + self.header.user_header_padding)
+        if self.is_compressed:
+            self.data_end = len(self.mm)
+        else:
+            self.data_end = self.offset + self.size
+
+        # 32-bit words in the record's byte order
+        self.word_dtype = evio_dtype(Bank.TYPE_UINT32, endian)
+
         # Cache for events (will be populated on demand)
         self._events = None
         self._event_count = None
+        self._event_offsets = None
+        self._event_lengths = None
+
+    def _decompress(self) -> bytes:
+        """
+        Decompress the record payload into a buffer laid out like an uncompressed record.
+
+        Returns:
+            Bytes with the record header followed by the decompressed index array,
+            user header and events
+        """
+        header = self.header
+        payload_start = self.offset + self.header_size
+        compressed_size = header.compressed_data_length * 4 - header.compressed_data_padding
+        uncompressed_length = (header.index_array_length + header.user_header_length + header.user_header_padding
+                               + header.uncompressed_data_length + header.data_padding)
+
+        payload = decompress_payload(self.mm[payload_start:payload_start + compressed_size],
+                                     header.compression_type, uncompressed_length)
+        return self.mm[self.offset:payload_start] + payload
+
+    @property
+    def memory_size(self) -> int:
+        """Get the number of bytes this record holds in memory beyond the memory map."""
+        return len(self.mm) if self.is_compressed else 0
 
     @property
     def event_count(self) -> int:
@@ -53,31 +141,68 @@ class Record:
             self._event_count = self.header.event_count
         return self._event_count
 
-    def scan_events(self) -> List[Tuple[int, int]]:
+    def scan_events(self) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Scan and parse all events in this record.
+        Scan the event index of this record.
+
+        Event lengths are read from the index array in one pass and event
+        offsets are their cumulative sum from the start of the data section.
 
         Returns:
-            List of tuples (offset, length) for all events in the record
+            Tuple of (offsets, lengths) int64 arrays, in bytes, for all events in the record
         """
-        event_info = []
+        if self._event_offsets is not None:
+            return self._event_offsets, self._event_lengths
 
-        if self.header.index_array_length > 0:
-            # Parse events from index array
-            event_count = self.header.index_array_length // 4
-            current_offset = self.data_start
+        # A trailer's index array holds record lengths, not event lengths
+        event_count = 0 if self.header.is_trailer else self.header.index_array_length // 4
 
-            for i in range(event_count):
-                length_offset = self.index_array_start + (i * 4)
-                event_length = struct.unpack(self.endian + 'I', self.mm[length_offset:length_offset+4])[0]
+        if event_count > 0:
+            lengths = buffer_view(self.mm, self.index_array_start, event_count,
+                                  self.word_dtype).astype(np.int64)
 
-                # Store event offset and length
-                event_info.append((current_offset, event_length))
+            # Each event starts where the previous one ends
+            offsets = np.empty(event_count, dtype=np.int64)
+            offsets[0] = self.data_start
+            np.cumsum(lengths[:-1], out=offsets[1:])
+            offsets[1:] += self.data_start
+        else:
+            offsets = np.zeros(0, dtype=np.int64)
+            lengths = np.zeros(0, dtype=np.int64)
 
-                # Update cumulative offset for next event
-                current_offset += event_length
+        self._event_offsets = offsets
+        self._event_lengths = lengths
+        return offsets, lengths
 
-        return event_info
+    def _clip_event_range(self, start_event: Optional[int], end_event: Optional[int], count: int) -> Tuple[int, int]:
+        """Clip an optional [start_event, end_event) range to [0, count)."""
+        if start_event is None:
+            start_event = 0
+        else:
+            start_event = max(0, min(start_event, count))
+
+        if end_event is None:
+            end_event = count
+        else:
+            end_event = max(start_event, min(end_event, count))
+
+        return start_event, end_event
+
+    @property
+    def events(self):
+        """
+        Get a lazy sequence view of all events in this record.
+
+        Event objects are created only when the view is indexed or iterated.
+
+        Returns:
+            EventList backed by the record's event offset and length arrays
+        """
+        if self._events is None:
+            from pyevio.event import EventList  # Import here to avoid circular import
+            offsets, lengths = self.scan_events()
+            self._events = EventList(self.mm, offsets, lengths, self.endian)
+        return self._events
 
     def get_events(self, start_event: Optional[int] = None, end_event: Optional[int] = None):
         """
@@ -88,31 +213,15 @@ class Record:
             end_event: Ending event index, exclusive (default: all events)
 
         Returns:
-            List of Event objects
+            EventList view of the Event objects in the range
         """
-        # Scan events only if needed
-        if self._events is None:
-            from pyevio.event import Event  # Import here to avoid circular import
-            event_info = self.scan_events()
-            self._events = [
-                Event(self.mm, offset, length, self.endian, i)
-                for i, (offset, length) in enumerate(event_info)
-            ]
+        events = self.events
 
         # Apply range filter
-        if start_event is None:
-            start_event = 0
-        else:
-            start_event = max(0, min(start_event, len(self._events)))
+        start_event, end_event = self._clip_event_range(start_event, end_event, len(events))
+        return events[start_event:end_event]
 
-        if end_event is None:
-            end_event = len(self._events)
-        else:
-            end_event = max(start_event, min(end_event, len(self._events)))
-
-        return self._events[start_event:end_event]
-
-    def get_event_offsets(self, start_event: Optional[int] = None, end_event: Optional[int] = None) -> List[Tuple[int, int]]:
+    def get_event_offsets(self, start_event: Optional[int] = None, end_event: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get offsets and lengths of events in the specified range without creating Event objects.
 
@@ -121,29 +230,171 @@ class Record:
             end_event: Ending event index, exclusive (default: all events)
 
         Returns:
-            List of tuples (offset, length) for each event
+            Tuple of (offsets, lengths) int64 arrays, in bytes
         """
-        event_info = self.scan_events()
+        offsets, lengths = self.scan_events()
 
         # Apply range filter
-        if start_event is None:
-            start_event = 0
-        else:
-            start_event = max(0, min(start_event, len(event_info)))
+        start_event, end_event = self._clip_event_range(start_event, end_event, len(offsets))
+        return offsets[start_event:end_event], lengths[start_event:end_event]
 
-        if end_event is None:
-            end_event = len(event_info)
-        else:
-            end_event = max(start_event, min(end_event, len(event_info)))
+    def get_bank_table(self, start_event: Optional[int] = None, end_event: Optional[int] = None):
+        """
+        Parse the bank trees of events in the specified range into one flat table.
+
+        Args:
+            start_event: Starting event index (default: 0)
+            end_event: Ending event index, exclusive (default: all events)
+
+        Returns:
+            BankTable object with the top-level bank of every event at depth 0
+        """
+        from pyevio.bank_table import BankTable  # Import here to avoid circular import
 
-        return event_info[start_event:end_event]
+        offsets, lengths = self.get_event_offsets(start_event, end_event)
+        return BankTable.parse_events(self.mm, offsets, lengths, self.endian)
+
+    # Events longer than this are treated as corrupt by tag_census(valid_only=True)
+    MAX_VALID_EVENT_SIZE = 1024 * 1024
+
+    def get_event_tags(self, offsets: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """
+        Get the top-level bank tag of many events at once.
+
+        Reads the second header word of every event with a single fancy-indexed
+        gather over the record's data region.
+
+        Args:
+            offsets: Array of event offsets in bytes
+            lengths: Array of event lengths in bytes
+
+        Returns:
+            uint16 array of tags, 0 for events without a complete header inside the record
+        """
+        words = buffer_view(self.mm, self.data_start, (self.data_end - self.data_start) // 4,
+                            self.word_dtype)
+        word_index = (np.asarray(offsets, dtype=np.int64) - self.data_start) // 4 + 1
+        valid = (np.asarray(lengths) >= 8) & (word_index > 0) & (word_index < len(words))
+
+        tags = np.zeros(len(word_index), dtype=np.uint16)
+        tags[valid] = words[word_index[valid]] >> 16
+        return tags
+
+    def tag_census(self, start_event: Optional[int] = None, end_event: Optional[int] = None,
+                   valid_only: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Count events by (tag, size).
+
+        Args:
+            start_event: Starting event index (default: 0)
+            end_event: Ending event index, exclusive (default: all events)
+            valid_only: Skip events with tag 0, events larger than 1 MB and
+                events extending past the record
+
+        Returns:
+            Tuple of (tags, sizes, counts) arrays with one entry per distinct
+            (tag, size in bytes) pair, sorted by tag and size
+        """
+        offsets, lengths = self.get_event_offsets(start_event, end_event)
+        tags = self.get_event_tags(offsets, lengths)
+
+        if valid_only:
+            keep = (tags != 0) & (lengths <= self.MAX_VALID_EVENT_SIZE) & (offsets + lengths <= self.data_end)
+            tags, lengths = tags[keep], lengths[keep]
+
+        # One 64-bit key per event: tag in the upper half, size in the lower half
+        keys, counts = np.unique((tags.astype(np.uint64) << np.uint64(32)) | lengths.astype(np.uint64),
+                                 return_counts=True)
+        return ((keys >> np.uint64(32)).astype(np.uint16),
+                (keys & np.uint64(0xFFFFFFFF)).astype(np.int64),
+                counts.astype(np.int64))
+
+    def get_uniform_runs(self, offsets: np.ndarray, lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split events into runs that are back to back in the buffer and have the same length.
+
+        The events of such a run form one regular block of memory, so the run can
+        be viewed as a 2D array without copying.
+
+        Args:
+            offsets: Array of event offsets in bytes
+            lengths: Array of event lengths in bytes
+
+        Returns:
+            Tuple of (starts, ends) arrays with the first and one-past-last
+            position in offsets of every run
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if len(offsets) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        # A run breaks where an event does not start at the end of the previous one or changes size
+        breaks = np.flatnonzero((offsets[1:] != offsets[:-1] + lengths[:-1]) | (lengths[1:] != lengths[:-1])) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [len(offsets)]))
+        return starts, ends
+
+    def _run_views(self, offsets: np.ndarray, lengths: np.ndarray, dtype: np.dtype) -> List[np.ndarray]:
+        """
+        View every uniform run of events as a 2D (events, items) array.
+
+        Args:
+            offsets: Array of event offsets in bytes
+            lengths: Array of event lengths in bytes
+            dtype: NumPy dtype of the items, in the record's byte order
+
+        Returns:
+            List of zero-copy 2D views, one per run
+        """
+        views = []
+        starts, ends = self.get_uniform_runs(offsets, lengths)
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            row_items = int(lengths[start]) // dtype.itemsize
+            view = buffer_view(self.mm, int(offsets[start]), (end - start) * row_items, dtype)
+            views.append(view.reshape(end - start, row_items))
+        return views
+
+    def gather_events(self, offsets, lengths, dtype=np.uint32) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copy the data of many events into one flat array.
+
+        All selected items are copied with a single fancy-index operation over
+        one view of the record's data section, without a Python loop over events.
+        Ranges that are not aligned to the item size within the data section
+        (e.g. 8-byte data after an odd number of words) are gathered as bytes
+        and viewed as dtype.
+
+        Args:
+            offsets: Array of event offsets in bytes (any ranges inside the data section work)
+            lengths: Array of event lengths in bytes
+            dtype: NumPy data type of the items (read in the record's byte order)
+
+        Returns:
+            Tuple of (flat, event_offsets) in CSR form: event i is
+            flat[event_offsets[i]:event_offsets[i+1]], in the file's byte order
+        """
+        file_dtype = np.dtype(dtype).newbyteorder(self.endian)
+        itemsize = file_dtype.itemsize
+        starts = np.asarray(offsets, dtype=np.int64) - self.data_start
+        counts = np.asarray(lengths, dtype=np.int64) // itemsize
+
+        if np.all(starts % itemsize == 0):
+            items = buffer_view(self.mm, self.data_start, (self.data_end - self.data_start) // itemsize, file_dtype)
+            return gather_ranges(items, starts // itemsize, counts)
+
+        data = buffer_view(self.mm, self.data_start, self.data_end - self.data_start, np.uint8)
+        flat, byte_offsets = gather_ranges(data, starts, counts * itemsize)
+        return flat.view(file_dtype), byte_offsets // itemsize
 
     def events_to_numpy_direct(self, start_event: Optional[int] = None, end_event: Optional[int] = None,
                                signature: Optional[int] = None, event_size_words: Optional[int] = None) -> np.ndarray:
         """
         Convert events directly to a NumPy array without creating Event objects.
 
-        This optimized method loads events directly from memory into a structured NumPy array.
+        Events of the same size that are back to back in the record are viewed
+        as 2D blocks without copying; if all selected events form one such run,
+        the result is a zero-copy view in the record's byte order.
 
         Args:
             start_event: Starting event index (default: 0)
@@ -155,61 +406,37 @@ class Record:
             2D NumPy array where rows are events and columns are 32-bit words
         """
         # Get event offsets and lengths
-        event_info = self.get_event_offsets(start_event, end_event)
-
-        if not event_info:
-            return np.array([], dtype=np.uint32)
+        offsets, lengths = self.get_event_offsets(start_event, end_event)
 
         if signature is not None:
-            # Filter events by signature
-            filtered_info = []
-            signature_mask = signature & 0xFFFF  # Use only top 16 bits
-
-            for offset, length in event_info:
-                if length >= 8:  # Need at least 2 words
-                    # Get the second word
-                    second_word = struct.unpack(self.endian + 'I', self.mm[offset + 4:offset + 8])[0]
-                    if (second_word >> 16) == signature_mask:
-                        filtered_info.append((offset, length))
+            # Filter events by signature (tag in the upper 16 bits of the second word)
+            mask = self.get_event_tags(offsets, lengths) == (signature & 0xFFFF)
+            offsets = offsets[mask]
+            lengths = lengths[mask]
 
-            event_info = filtered_info
-
-        if not event_info:
+        if len(offsets) == 0:
             return np.array([], dtype=np.uint32)
 
-        if event_size_words is not None:
-            # All events have the same size, we can create a regular 2D array
-            num_events = len(event_info)
-            result = np.zeros((num_events, event_size_words), dtype=np.uint32)
+        uniform = bool(np.all(lengths == lengths[0]))
+        if event_size_words is not None and not (uniform and lengths[0] == event_size_words * 4):
+            # Rows of a fixed number of words regardless of the event lengths, rows
+            # running past the end of the data section are zero-filled
+            result = np.zeros((len(offsets), event_size_words), dtype=np.uint32)
+            for i, offset in enumerate(offsets.tolist()):
+                count = min(event_size_words, (self.data_end - offset) // 4)
+                result[i, :count] = buffer_view(self.mm, offset, count, self.word_dtype)
+            return result
 
-            for i, (offset, _) in enumerate(event_info):
-                # Read event data directly into result array with correct endianness
-                event_data = np.frombuffer(
-                    self.mm[offset:offset + (event_size_words * 4)],
-                    dtype=np.dtype(np.uint32).newbyteorder('>' if self.endian == '>' else '<')
-                )
-                result[i, :len(event_data)] = event_data
+        if uniform:
+            views = self._run_views(offsets, lengths, self.word_dtype)
+            return views[0] if len(views) == 1 else np.concatenate(views)
 
-            return result
-        else:
-            # Variable-sized events, create a list of arrays
-            event_arrays = []
-
-            for offset, length in event_info:
-                word_count = length // 4
-                event_data = np.frombuffer(
-                    self.mm[offset:offset + length],
-                    dtype=np.uint32
-                )
-                event_arrays.append(event_data)
-
-            # Try to determine if all events are the same size after filtering
-            if all(len(arr) == len(event_arrays[0]) for arr in event_arrays):
-                # Convert to regular 2D array
-                return np.vstack(event_arrays)
-            else:
-                # Return as object array of different sized arrays
-                return np.array(event_arrays, dtype=object)
+        # Variable-sized events, gather them once and split into an object array of rows
+        flat, event_offsets = self.gather_events(offsets, lengths)
+        event_arrays = np.empty(len(offsets), dtype=object)
+        for i, row in enumerate(np.split(flat, event_offsets[1:-1])):
+            event_arrays[i] = row
+        return event_arrays
 
     def get_event(self, index: int):
         """
@@ -224,7 +451,7 @@ class Record:
         Raises:
             IndexError: If index is out of range
         """
-        events = self.get_events()
+        events = self.events
 
         if index < 0 or index >= len(events):
             raise IndexError(f"Event index {index} out of range (0-{len(events)-1})")
@@ -233,7 +460,8 @@ class Record:
 
     import numpy as np
 
-    def events_to_numpy(self, signature: int = 0xFF60, start_event: Optional[int] = None, end_event: Optional[int] = None, dtype=np.uint32) -> np.ndarray:
+    def events_to_numpy(self, signature: int = 0xFF60, start_event: Optional[int] = None, end_event: Optional[int] = None,
+                        dtype=np.uint32, runs: bool = False):
         """
         Convert events with a specific signature to a NumPy array.
 
@@ -246,68 +474,36 @@ class Record:
             start_event: Starting event index (default: 0)
             end_event: Ending event index, exclusive (default: all events)
             dtype: NumPy data type for the resulting array (default: np.uint32)
+            runs: Return one 2D (events, items) view per run of back to back,
+                equally sized events instead of a single flat array
 
         Returns:
-            NumPy array containing all event data matching the signature
+            NumPy array containing all event data matching the signature, in the
+            file's byte order. It is a zero-copy view when the matching events
+            form a single run. With runs=True, a list of zero-copy 2D views
         """
-        # Get all events or subset based on start/end parameters
-        events = self.get_events(start_event, end_event)
-
-        if not events:
-            return np.array([], dtype=dtype)
-
-        # Extract offsets and lengths for all events
-        offsets = np.array([event.offset for event in events], dtype=np.int64)
-        lengths = np.array([event.length for event in events], dtype=np.int64)
+        # Get offsets and lengths of all events or subset based on start/end parameters
+        offsets, lengths = self.get_event_offsets(start_event, end_event)
 
-        # Filter out events that are too small
-        valid_indices = lengths >= 8
-        offsets = offsets[valid_indices]
-        lengths = lengths[valid_indices]
+        # Select events with a header and a matching signature
+        mask = (lengths >= 8) & (self.get_event_tags(offsets, lengths) == (signature & 0xFFFF))
 
-        if len(offsets) == 0:
-            return np.array([], dtype=dtype)
-
-        # Check which events match the signature
-        signatures = np.zeros(len(offsets), dtype=np.uint32)
-
-        for i in range(len(offsets)):
-            # Extract the second word (bytes 4-8)
-            second_word = int.from_bytes(
-                self.mm[offsets[i] + 4:offsets[i] + 8],
-                byteorder='little' if self.endian == '<' else 'big'
-            )
-            signatures[i] = second_word >> 16
+        # Back to back events of the same size are one block each: view them
+        # in place (in the file's byte order)
+        file_dtype = np.dtype(dtype).newbyteorder(self.endian)
+        if runs:
+            return self._run_views(offsets[mask], lengths[mask], file_dtype)
 
-        # Create a mask for events that match our signature
-        mask = signatures == (signature & 0xFFFF)
-        matching_offsets = offsets[mask]
-        matching_lengths = lengths[mask]
-
-        if len(matching_offsets) == 0:
+        starts, _ = self.get_uniform_runs(offsets[mask], lengths[mask])
+        if len(starts) == 0:
             return np.array([], dtype=dtype)
+        if len(starts) == 1:
+            return self._run_views(offsets[mask], lengths[mask], file_dtype)[0].reshape(-1)
 
-        # Calculate the total size and preallocate array
-        total_words = np.sum(matching_lengths) // 4
-        result = np.zeros(total_words, dtype=dtype)
-
-        # Copy each matching event's data into the result array
-        current_idx = 0
-        for i in range(len(matching_offsets)):
-            offset = matching_offsets[i]
-            length = matching_lengths[i]
-            words = length // 4
-
-            # Use np.frombuffer for efficient memory-to-array conversion
-            event_data = np.frombuffer(
-                self.mm[offset:offset + length],
-                dtype=dtype
-            )
-
-            result[current_idx:current_idx + words] = event_data
-            current_idx += words
+        # Mixed events are gathered in one pass
+        flat, _ = self.gather_events(offsets[mask], lengths[mask], dtype)
+        return flat
 
-        return result
     def get_hex_dump(self, word_count: int = 14, title: Optional[str] = None) -> str:
         """
         Generate a hex dump of the record header.
@@ -319,7 +515,7 @@ class Record:
         Returns:
             String containing formatted hexdump
         """
-        data = self.mm[self.offset:self.offset + min(word_count * 4, self.size)]
+        data = self.mm[self.buffer_offset:self.buffer_offset + min(word_count * 4, self.size)]
         return make_hex_dump(data, title=title or f"Record Header at offset 0x{self.offset:X}")
 
     def __str__(self) -> str:
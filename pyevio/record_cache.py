@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class RecordCache:
+    """
+    Least-recently-used cache with a byte budget.
+
+    Used by EvioFile to keep decompressed records, so random access does not
+    decompress the same record twice while sequential scans stay within a
+    fixed amount of memory.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total size of cached items in bytes. 0 disables caching.
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def get(self, key: Hashable, count_miss: bool = True) -> Optional[Any]:
+        """
+        Get an item and mark it as most recently used.
+
+        Args:
+            key: Item key
+            count_miss: Count a missing item in the misses statistic (off for
+                lookups that only check whether an item is already cached)
+
+        Returns:
+            Cached item, or None if it is not in the cache
+        """
+        entry = self._items.get(key)
+        if entry is None:
+            if count_miss:
+                self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int):
+        """
+        Add an item, evicting least recently used items to stay within the budget.
+
+        Items larger than the whole budget are not cached.
+
+        Args:
+            key: Item key
+            value: Item to cache
+            size: Size of the item in bytes
+        """
+        if key in self._items:
+            self.current_bytes -= self._items.pop(key)[1]
+
+        if size > self.max_bytes:
+            return
+
+        while self._items and self.current_bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self._items.popitem(last=False)
+            self.current_bytes -= evicted_size
+
+        self._items[key] = (value, size)
+        self.current_bytes += size
+
+    def clear(self):
+        """Remove all items from the cache."""
+        self._items.clear()
+        self.current_bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"RecordCache(items={len(self._items)}, bytes={self.current_bytes}/{self.max_bytes})"
@@ -4,6 +4,16 @@ from pyevio.buffer_reader import BufferReader
 class RecordHeader:
     """Parses and represents an EVIO v6 record header."""
 
+    # Many headers can be alive at once, so no per-instance __dict__
+    __slots__ = (
+        'record_length', 'record_number', 'header_length', 'endian', 'event_count',
+        'index_array_length', 'version', 'bit_info', 'user_header_length', 'magic_number',
+        'uncompressed_data_length', 'compression_type', 'compressed_data_length',
+        'user_register1', 'user_register2', 'has_dictionary', 'is_last_record',
+        'has_first_event', 'header_type', 'is_trailer', 'user_header_padding',
+        'data_padding', 'compressed_data_padding', 'event_type'
+    )
+
     # EVIO record header magic number
     MAGIC_NUMBER = 0xc0da0100
 
@@ -34,6 +44,11 @@ class RecordHeader:
         self.has_dictionary = False
         self.is_last_record = False
         self.has_first_event = False
+        self.header_type = -1
+        self.is_trailer = False
+        self.user_header_padding = 0
+        self.data_padding = 0
+        self.compressed_data_padding = 0
         self.event_type = f"NeverInitialized"
 
     @staticmethod
@@ -111,4 +126,18 @@ class RecordHeader:
 
         header.has_first_event = bool((header.bit_info >> 6) & 1)  # Bit 14
 
-        return header
\ No newline at end of file
+        # Padding of user header, data and compressed data in bytes (bits 20-25)
+        header.user_header_padding = (header.bit_info >> 12) & 0x3
+        header.data_padding = (header.bit_info >> 14) & 0x3
+        header.compressed_data_padding = (header.bit_info >> 16) & 0x3
+
+        # Header type (bits 28-31): 3 = Evio file trailer, 7 = HIPO file trailer
+        header.header_type = (header.bit_info >> 20) & 0xF
+        header.is_trailer = header.header_type in (3, 7)
+
+        return header
+
+    @property
+    def is_compressed(self) -> bool:
+        """Check whether the record payload is compressed."""
+        return self.compression_type != 0
\ No newline at end of file
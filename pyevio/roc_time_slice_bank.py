@@ -1,10 +1,14 @@
 import mmap
 import struct
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Union
+
+import numpy as np
 
 from pyevio.bank import Bank
+from pyevio.dtypes import evio_dtype, to_native
 from pyevio.buffer_reader import BufferReader
+from pyevio.utils import buffer_bytes, buffer_view
 
 
 class StreamInfoBank(Bank):
@@ -25,7 +29,8 @@ class StreamInfoBank(Bank):
         if self.tag != 0xFF30:
             raise ValueError(f"Invalid Stream Info Bank tag: 0x{self.tag:04X}, expected 0xFF30")
 
-        # Parse Stream Status
+        # Parse Stream Status (carried in the num field)
+        self.stream_status = self.num
         self.error_flag = bool((self.stream_status >> 7) & 0x1)
         self.total_streams = ((self.stream_status >> 4) & 0x7)
         self.stream_mask = self.stream_status & 0xF
@@ -41,8 +46,9 @@ class StreamInfoBank(Bank):
         # TSS starts after the SIB header (2 words)
         tss_offset = self.offset + 8
 
-        # TSS Header (first word)
-        tss_header = struct.unpack(self.endian + 'I', self.mm[tss_offset:tss_offset+4])[0]
+        # TSS header, frame number and the two timestamp words (low word first)
+        tss_header, self.frame_number, timestamp_low, timestamp_high = struct.unpack(
+            self.endian + 'IIII', self.mm[tss_offset:tss_offset+16])
         self.tss_tag = (tss_header >> 24) & 0xFF  # Should be 0x31
         self.tss_type = (tss_header >> 16) & 0xFF  # Should be 0x01
         self.tss_length = tss_header & 0xFFFF
@@ -51,22 +57,10 @@ class StreamInfoBank(Bank):
         if self.tss_tag != 0x31:
             raise ValueError(f"Invalid Time Slice Segment tag: 0x{self.tss_tag:02X}, expected 0x31")
 
-        # Frame Number (second word)
-        self.frame_number = struct.unpack(self.endian + 'I', self.mm[tss_offset+4:tss_offset+8])[0]
-
-        # Timestamp (two words: 64 bits total)
-        timestamp_low = struct.unpack(self.endian + 'I', self.mm[tss_offset+8:tss_offset+12])[0]
-        timestamp_high = struct.unpack(self.endian + 'I', self.mm[tss_offset+12:tss_offset+16])[0]
+        self.timestamp = (timestamp_high << 32) | timestamp_low
 
-        if self.endian == '<':
-            # Little endian: low word first, then high word
-            self.timestamp = (timestamp_high << 32) | timestamp_low
-        else:
-            # Big endian: high word first, then low word
-            self.timestamp = (timestamp_high << 32) | timestamp_low
-
-        # Store TSS end offset for later use
-        self.tss_end_offset = tss_offset + (self.tss_length * 4)
+        # Store TSS end offset for later use (the segment length excludes its header word)
+        self.tss_end_offset = tss_offset + 4 + (self.tss_length * 4)
 
     def _parse_aggregation_info_segment(self):
         """Parse the Aggregation Info Segment (AIS)."""
@@ -87,182 +81,308 @@ class StreamInfoBank(Bank):
         self.padding = (self.ais_type_info >> 6) & 0x3  # Top 2 bits
         self.ais_data_type = self.ais_type_info & 0x3F  # Lower 6 bits (should be 5 = unsigned short)
 
-        # Parse payload infos
-        self.payload_infos = []
+        # The AIS length counts 32-bit words; the padding tells how many
+        # trailing bytes of the last word are not payload infos
+        num_payloads = (self.ais_length * 4 - self.padding) // 2
 
-        # Number of 16-bit payloads
-        num_payloads = self.ais_length
+        # Payload infos are 16-bit values stored in data order, so reading them
+        # as shorts in the file's byte order gives them in sequence
+        raw = buffer_view(self.mm, ais_offset + 4, num_payloads, np.dtype(self.endian + 'u2'))
+        self.payload_infos = decode_payload_infos(raw)
 
-        # Calculate number of 32-bit words needed to store the payloads
-        words_needed = (num_payloads + 1) // 2
+        # Store AIS end offset for later use
+        self.ais_end_offset = ais_offset + 4 + (self.ais_length * 4)
 
-        # Read payload infos
-        for i in range(words_needed):
-            word_offset = ais_offset + 4 + (i * 4)
-            word = struct.unpack(self.endian + 'I', self.mm[word_offset:word_offset+4])[0]
 
-            # Each word contains two 16-bit payloads (unless it's the last word with odd num_payloads)
-            # Extract payloads in order (depending on endianness)
-            if self.endian == '<':
-                # Little endian: lower 16 bits first, then upper 16 bits
-                payload1 = word & 0xFFFF
-                payload2 = (word >> 16) & 0xFFFF
+# Fields of the 16-bit payload info words of the Aggregation Info Segment
+PAYLOAD_INFO_DTYPE = np.dtype([
+    ('module_id', np.uint8),  # bits 11-8
+    ('bond', np.bool_),       # bit 7
+    ('lane_id', np.uint8),    # bits 6-5
+    ('port_num', np.uint8),   # bits 4-0
+    ('raw', np.uint16),       # the whole payload info word
+])
 
-                # Add first payload
-                if i * 2 < num_payloads:
-                    self._add_payload_info(payload1)
 
-                # Add second payload
-                if i * 2 + 1 < num_payloads:
-                    self._add_payload_info(payload2)
-            else:
-                # Big endian: upper 16 bits first, then lower 16 bits
-                payload1 = (word >> 16) & 0xFFFF
-                payload2 = word & 0xFFFF
+def decode_payload_infos(raw: np.ndarray) -> np.ndarray:
+    """
+    Decode AIS payload info words.
 
-                # Add first payload
-                if i * 2 < num_payloads:
-                    self._add_payload_info(payload1)
+    Args:
+        raw: Array of 16-bit payload info words
 
-                # Add second payload
-                if i * 2 + 1 < num_payloads:
-                    self._add_payload_info(payload2)
+    Returns:
+        Structured array with PAYLOAD_INFO_DTYPE, one row per payload
+    """
+    raw = np.asarray(raw, dtype=np.uint16)
+    infos = np.empty(len(raw), dtype=PAYLOAD_INFO_DTYPE)
+    infos['module_id'] = (raw >> 8) & 0xF
+    infos['bond'] = (raw >> 7) & 0x1
+    infos['lane_id'] = (raw >> 5) & 0x3
+    infos['port_num'] = raw & 0x1F
+    infos['raw'] = raw
+    return infos
+
+
+# Columns of the time-slice table (see EvioFile.time_slice_table)
+TIME_SLICE_DTYPE = np.dtype([
+    ('event', np.int64),            # global event index
+    ('frame_number', np.uint32),
+    ('timestamp', np.uint64),
+    ('stream_status', np.uint8),
+    ('payload_count', np.uint16),
+    ('payload_offset', np.uint32),  # first payload bank, in bytes from the event start
+])
+
+
+def decode_time_slice_headers(words: np.ndarray, first: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """
+    Decode the Stream Info Bank headers of many ROC Time Slice Bank events at once.
 
-        # Store AIS end offset for later use
-        self.ais_end_offset = ais_offset + 4 + (words_needed * 4)
+    Only the fixed-position TSS and AIS header words of every event are
+    gathered; no banks are parsed. Events that are not ROC Time Slice Banks
+    are left out.
+
+    Args:
+        words: 32-bit words of the buffer holding the events, in the buffer's byte order
+        first: Word index of every event in words
+        end: Word index just past every event, at most len(words)
+
+    Returns:
+        Structured array with TIME_SLICE_DTYPE, one row per event that is a
+        ROC Time Slice Bank. The event field holds the event's position in first
+    """
+    first = np.asarray(first, dtype=np.int64)
+    end = np.asarray(end, dtype=np.int64)
+
+    # ROC bank header, SIB header and TSS (4 words) must fit before the AIS header
+    events = np.flatnonzero((first >= 0) & (end - first >= 9))
+    first = first[events]
+    roc_info = words[first + 1]
+    is_time_slice = (((roc_info >> 8) & 0x3F) == 0x10) & ((words[first + 3] >> 16) == 0xFF30) \
+        & ((words[first + 4] >> 24) == 0x31)
+
+    # The AIS follows the TSS, whose length excludes its header word
+    ais_index = first + 5 + (words[first + 4] & 0xFFFF)
+    is_time_slice &= ais_index < end[events]
+    ais = np.zeros(len(first), dtype=np.uint32)
+    ais[is_time_slice] = words[ais_index[is_time_slice]]
+    is_time_slice &= (ais >> 24) == 0x41
+
+    keep = np.flatnonzero(is_time_slice)
+    first = first[keep]
+    ais = ais[keep]
+    ais_length = (ais & 0xFFFF).astype(np.int64)
+
+    headers = np.empty(len(keep), dtype=TIME_SLICE_DTYPE)
+    headers['event'] = events[keep]
+    headers['frame_number'] = words[first + 5]
+    headers['timestamp'] = (words[first + 7].astype(np.uint64) << np.uint64(32)) | words[first + 6]
+    headers['stream_status'] = roc_info[keep] & 0xFF
+    # Payload infos are shorts; the padding bits give the unused bytes of the last word
+    headers['payload_count'] = np.maximum(ais_length * 4 - ((ais >> 22) & 0x3), 0) // 2
+    headers['payload_offset'] = (ais_index[keep] - first + 1 + ais_length) * 4
+    return headers
+
+
+class PayloadLayout:
+    """
+    Waveform layout of the 16-bit samples in a payload bank.
+
+    Samples are stored either channel by channel (all samples of channel 0,
+    then channel 1, ...) or interleaved (sample 0 of every channel, then
+    sample 1, ...).
+    """
+
+    def __init__(self, channels: int, samples: int, interleaved: bool = False):
+        """
+        Initialize a PayloadLayout.
+
+        Args:
+            channels: Number of channels
+            samples: Number of samples per channel
+            interleaved: Samples of the channels are interleaved
+
+        Raises:
+            ValueError: If channels or samples is not positive
+        """
+        if channels <= 0 or samples <= 0:
+            raise ValueError(f"Invalid payload layout: {channels} channels, {samples} samples")
+        self.channels = channels
+        self.samples = samples
+        self.interleaved = interleaved
+
+    @property
+    def size(self) -> int:
+        """Get the number of samples of all channels."""
+        return self.channels * self.samples
+
+    def sample_index(self) -> np.ndarray:
+        """
+        Get the position of every sample in the payload data.
+
+        Returns:
+            (channels, samples) array of sample positions
+        """
+        if self.interleaved:
+            return np.arange(self.size).reshape(self.samples, self.channels).T
+        return np.arange(self.size).reshape(self.channels, self.samples)
+
+    def reshape(self, data: np.ndarray) -> np.ndarray:
+        """
+        View flat payload samples as a (channels, samples) array without copying.
+
+        Args:
+            data: Flat array with at least size samples
+
+        Returns:
+            (channels, samples) view of the data
+        """
+        data = data[:self.size]
+        if self.interleaved:
+            return data.reshape(self.samples, self.channels).T
+        return data.reshape(self.channels, self.samples)
+
+    def __eq__(self, other) -> bool:
+        """Compare layouts by value."""
+        if not isinstance(other, PayloadLayout):
+            return NotImplemented
+        return (self.channels, self.samples, self.interleaved) == (other.channels, other.samples, other.interleaved)
 
-    def _add_payload_info(self, payload_info: int):
-        """Parse and add a payload info to the list."""
-        module_id = (payload_info >> 8) & 0xF  # bits 11-8
-        bond = bool((payload_info >> 7) & 0x1)  # bit 7
-        lane_id = (payload_info >> 5) & 0x3     # bits 6-5
-        port_num = payload_info & 0x1F          # bits 4-0
+    def __hash__(self) -> int:
+        """Hash layouts by value."""
+        return hash((self.channels, self.samples, self.interleaved))
 
-        self.payload_infos.append({
-            'module_id': module_id,
-            'bond': bond,
-            'lane_id': lane_id,
-            'port_num': port_num,
-            'raw_value': payload_info
-        })
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"PayloadLayout(channels={self.channels}, samples={self.samples}, interleaved={self.interleaved})"
 
 
 class PayloadBank(Bank):
-    """Parses Payload Banks within a ROC Time Slice Bank."""
+    """
+    Payload Bank within a ROC Time Slice Bank.
+
+    Creating a payload bank only reads its header. Payload lengths follow
+    EVIO: a payload bank spans its length + 1 words. The waveform layout is
+    given explicitly; without one it is guessed from the sample count the
+    first time it is needed.
+    """
+
+    # Sample counts per channel tried when guessing the layout
+    COMMON_SAMPLE_COUNTS = [100, 200, 250, 256, 512, 1000, 1024]
 
-    def __init__(self, mm: mmap.mmap, offset: int, endian: str = '<', payload_info: Dict = None):
+    def __init__(self, mm: mmap.mmap, offset: int, endian: str = '<', payload_info: Optional[np.void] = None,
+                 layout: Optional[PayloadLayout] = None):
         """
-        Initialize and parse a Payload Bank.
+        Initialize a Payload Bank.
 
         Args:
             mm: Memory-mapped buffer
             offset: Byte offset where the Payload Bank starts
             endian: Endianness ('<' for little endian, '>' for big endian)
-            payload_info: Optional payload info dictionary from AIS
+            payload_info: Optional payload info row (PAYLOAD_INFO_DTYPE) from AIS
+            layout: Waveform layout of the samples (default: guessed from the sample count)
         """
         super().__init__(mm, offset, endian)
         self.payload_info = payload_info
-
-        # For FADC250 data, we expect unsigned shorts (16-bit)
-        # But we need to know the data format to interpret correctly
-        self._analyze_data()
-
-    def _analyze_data(self):
-        """Analyze the payload data to determine its structure."""
-        # For now, assume FADC250 data is stored as 16-bit unsigned shorts
-        data_size = self.data_length
-
-        if data_size % 2 != 0:
-            # Odd number of bytes - adjust for padding
-            data_size -= (data_size % 2)
-
-        # Calculate number of samples
-        self.num_samples = data_size // 2  # 2 bytes per sample for 16-bit data
-
-        # Calculate expected channel count based on typical FADC250 configuration
-        # This is a heuristic and may need adjustment based on actual data
-        if self.num_samples > 0:
-            # Try to detect if we have multiple channels
-            # Typical sample counts per channel might be 100, 200, 250, etc.
-            common_sample_counts = [100, 200, 250, 256, 512, 1000, 1024]
-
-            # Find a channel count that gives a reasonable sample count
-            self.channels = 1  # Default to 1 channel
-            for count in common_sample_counts:
-                if self.num_samples % count == 0:
-                    self.channels = self.num_samples // count
-                    self.samples_per_channel = count
-                    break
-
-            # If no clean division, just use a default value
-            if not hasattr(self, 'samples_per_channel'):
-                # Try to make an educated guess
-                if self.num_samples < 100:
-                    self.samples_per_channel = self.num_samples
-                    self.channels = 1
-                else:
-                    self.samples_per_channel = 100  # Default arbitrary value
-                    self.channels = self.num_samples // self.samples_per_channel
-
-    def get_waveform_data(self, channel: int = None) -> List[int]:
+        self._layout = layout
+        self.layout_configured = layout is not None
+
+    @property
+    def num_samples(self) -> int:
+        """Get the number of 16-bit samples in the payload, without the padding."""
+        return max(self.data_length - self.pad, 0) // 2
+
+    @property
+    def layout(self) -> PayloadLayout:
+        """Get the waveform layout, guessing it if none was given."""
+        if self._layout is None:
+            self._layout = self._guess_layout()
+        return self._layout
+
+    @property
+    def channels(self) -> int:
+        """Get the number of channels."""
+        return self.layout.channels
+
+    @property
+    def samples_per_channel(self) -> int:
+        """Get the number of samples per channel."""
+        return self.layout.samples
+
+    def _guess_layout(self) -> PayloadLayout:
+        """Guess the layout from the sample count (a heuristic for payloads without a configured layout)."""
+        num_samples = self.num_samples
+        if num_samples == 0:
+            return PayloadLayout(1, 1)
+
+        # Find a channel count that gives a typical sample count per channel
+        for count in self.COMMON_SAMPLE_COUNTS:
+            if num_samples % count == 0:
+                return PayloadLayout(num_samples // count, count)
+
+        if num_samples < 100:
+            return PayloadLayout(1, num_samples)
+        return PayloadLayout(num_samples // 100, 100)
+
+    def get_waveform_data(self, channel: int = None) -> np.ndarray:
         """
         Get waveform data for a specific channel or all channels.
 
+        The samples are a view of the file; the samples of one channel are a
+        strided view following the payload layout. Without a configured
+        layout, channels are de-interleaved with a stride of the guessed
+        channel count, and a single-channel payload is returned whole.
+
         Args:
             channel: Channel number (None for all channels)
 
         Returns:
-            List of data samples
-        """
-        if not hasattr(self, 'num_samples') or self.num_samples == 0:
-            return []
-
-        # Read all data samples as 16-bit values
-        data = []
-        for i in range(self.num_samples):
-            sample_offset = self.data_offset + (i * 2)
-            sample = struct.unpack(self.endian + 'H', self.mm[sample_offset:sample_offset+2])[0]
-            data.append(sample)
+            NumPy array of data samples in the file's byte order
 
-        # If specific channel requested, extract only that channel
-        if channel is not None and self.channels > 1:
-            if channel >= self.channels:
-                raise ValueError(f"Channel {channel} out of range (0-{self.channels-1})")
-
-            # Extract samples for the specified channel
-            # Channels are typically interleaved
-            channel_data = []
-            for i in range(channel, len(data), self.channels):
-                channel_data.append(data[i])
-
-            return channel_data
-
-        return data
-
-    def to_numpy(self, reshape=True):
+        Raises:
+            ValueError: If the channel is out of range or the payload is too short for its layout
+        """
+        data = self.to_numpy(reshape=False)
+        if channel is None or len(data) == 0:
+            return data
+
+        layout = self.layout
+        if not self.layout_configured and layout.channels == 1:
+            return data
+        if channel < 0 or channel >= layout.channels:
+            raise ValueError(f"Channel {channel} out of range (0-{layout.channels-1})")
+        if not self.layout_configured:
+            return data[channel::layout.channels]
+        if len(data) < layout.size:
+            raise ValueError(f"Payload with {len(data)} samples too short for {layout}")
+
+        return layout.reshape(data)[channel]
+
+    def to_numpy(self, reshape=True, copy=False, native=False):
         """
         Convert payload data to NumPy array.
 
         Args:
-            reshape: If True, reshape array to (channels, samples_per_channel)
+            reshape: If True, reshape array to (channels, samples_per_channel) following the layout
                     If False, return flat array
+            copy: Return an independent, writable copy instead of a read-only view of the file
+            native: Return the samples in native byte order (swapped only when needed)
 
         Returns:
             NumPy array containing the data
         """
-        import numpy as np
-
-        # Read all data samples as 16-bit values
-        data = np.frombuffer(
-            self.mm[self.data_offset:self.data_offset + self.data_length],
-            dtype=np.uint16
-        )
-
-        # Reshape if requested and possible
-        if reshape and hasattr(self, 'channels') and hasattr(self, 'samples_per_channel'):
-            if len(data) == self.channels * self.samples_per_channel:
-                # Try to reshape into (channels, samples_per_channel)
-                return data.reshape(self.channels, self.samples_per_channel)
+        # Read all data samples as 16-bit values in the file's byte order
+        data = buffer_view(self.mm, self.data_offset, self.num_samples,
+                           evio_dtype(Bank.TYPE_UINT16, self.endian), copy)
+        if native:
+            data = to_native(data)
+
+        # Reshape into (channels, samples_per_channel). A configured layout may leave
+        # trailing padding samples; a guessed one must cover the whole payload
+        if reshape and self.num_samples > 0:
+            if len(data) == self.layout.size or (self.layout_configured and len(data) > self.layout.size):
+                return self.layout.reshape(data)
 
         return data
 
@@ -274,12 +394,16 @@ class RocTimeSliceBank(Bank):
     A ROC Time Slice Bank contains:
     1. A Stream Info Bank (SIB)
     2. Multiple Payload Banks
+
+    Only the payload bank positions are found when the bank is parsed; the
+    PayloadBank objects are created on first access.
     """
 
     # Tag value for ROC Time Slice Banks
     TAG = 0xFF30
 
-    def __init__(self, mm: mmap.mmap, offset: int, endian: str = '<'):
+    def __init__(self, mm: mmap.mmap, offset: int, endian: str = '<',
+                 layouts: Union[PayloadLayout, Dict[int, PayloadLayout], None] = None):
         """
         Initialize a RocTimeSliceBank parser.
 
@@ -287,14 +411,19 @@ class RocTimeSliceBank(Bank):
             mm: Memory-mapped buffer
             offset: Byte offset where the bank starts
             endian: Endianness ('<' for little endian, '>' for big endian)
+            layouts: Waveform layout of all payloads, or a dictionary mapping module ids
+                (from the AIS payload infos) to layouts. Payloads without a layout
+                have it guessed from their sample count
         """
         super().__init__(mm, offset, endian)
+        self.layouts = layouts
 
         # Validate ROC Time Slice Bank
         if self.data_type != 0x10:
             raise ValueError(f"Invalid ROC Time Slice Bank type: 0x{self.data_type:02X}, expected 0x10")
 
-        # Parse Stream Status
+        # Parse Stream Status (carried in the num field)
+        self.stream_status = self.num
         self.error_flag = bool((self.stream_status >> 7) & 0x1)
         self.total_streams = ((self.stream_status >> 4) & 0x7)
         self.stream_mask = self.stream_status & 0xF
@@ -302,34 +431,59 @@ class RocTimeSliceBank(Bank):
         # Parse Stream Info Bank (starts after ROC TS Bank header)
         self.sib = StreamInfoBank(mm, offset + 8, endian)
 
-        # Parse Payload Banks
-        self._parse_payload_banks()
+        # Find the Payload Banks
+        self._find_payload_banks()
+        self._payload_banks = None
 
-    def _parse_payload_banks(self):
-        """Parse all Payload Banks within the ROC Time Slice Bank."""
-        self.payload_banks = []
+    def _find_payload_banks(self):
+        """Find the offsets of the Payload Banks, reading only their length words."""
+        offsets = []
 
-        # Start after Stream Info Bank
+        # Start after Stream Info Bank; banks span their length + 1 words
         current_offset = self.sib.ais_end_offset
-        end_offset = self.offset + (self.length * 4)
+        end_offset = self.offset + (self.length + 1) * 4
 
-        # Match payload banks with payload infos
-        for i, payload_info in enumerate(self.sib.payload_infos):
-            if current_offset >= end_offset:
+        # One payload bank per payload info
+        for _ in range(len(self.sib.payload_infos)):
+            if current_offset + 8 > end_offset:
                 # Reached the end of the bank
                 break
 
-            try:
-                payload_bank = PayloadBank(self.mm, current_offset, self.endian, payload_info)
-                self.payload_banks.append(payload_bank)
+            length = struct.unpack(self.endian + 'I', self.mm[current_offset:current_offset+4])[0]
+            if length == 0 or current_offset + (length + 1) * 4 > end_offset:
+                break
+            offsets.append(current_offset)
+
+            # Move to next bank
+            current_offset += (length + 1) * 4
 
-                # Move to next bank
-                current_offset += payload_bank.length * 4
-            except Exception as e:
-                # If there's an error parsing a payload bank, log it and continue
-                if self.payload_banks:
-                    break
-                raise
+        self.payload_offsets = np.array(offsets, dtype=np.int64)
+
+    def get_payload_layout(self, payload_index: int) -> Optional[PayloadLayout]:
+        """
+        Get the configured layout of a payload.
+
+        Args:
+            payload_index: Index of the payload bank
+
+        Returns:
+            PayloadLayout, or None if no layout is configured for the payload's module
+        """
+        if self.layouts is None or isinstance(self.layouts, PayloadLayout):
+            return self.layouts
+        module_id = int(self.sib.payload_infos['module_id'][payload_index])
+        return self.layouts.get(module_id)
+
+    @property
+    def payload_banks(self) -> List[PayloadBank]:
+        """Get the Payload Banks, creating them on first access."""
+        if self._payload_banks is None:
+            self._payload_banks = [
+                PayloadBank(self.mm, int(offset), self.endian, self.sib.payload_infos[i],
+                            self.get_payload_layout(i))
+                for i, offset in enumerate(self.payload_offsets)
+            ]
+        return self._payload_banks
 
     def get_timestamp(self) -> int:
         """Get the timestamp from the Stream Info Bank."""
@@ -340,7 +494,7 @@ class RocTimeSliceBank(Bank):
         timestamp_seconds = self.sib.timestamp / 1e9  # Convert to seconds (assuming nanoseconds)
         return datetime.fromtimestamp(timestamp_seconds).strftime('%Y-%m-%d %H:%M:%S.%f')
 
-    def get_payload_data(self, payload_index: int = 0, channel: int = None) -> List[int]:
+    def get_payload_data(self, payload_index: int = 0, channel: int = None) -> np.ndarray:
         """
         Get waveform data for a specific payload and channel.
 
@@ -349,10 +503,10 @@ class RocTimeSliceBank(Bank):
             channel: Channel number (None for all channels)
 
         Returns:
-            List of data samples
+            NumPy array of data samples (see PayloadBank.get_waveform_data)
         """
-        if payload_index < 0 or payload_index >= len(self.payload_banks):
-            raise ValueError(f"Payload index {payload_index} out of range (0-{len(self.payload_banks)-1})")
+        if payload_index < 0 or payload_index >= len(self.payload_offsets):
+            raise ValueError(f"Payload index {payload_index} out of range (0-{len(self.payload_offsets)-1})")
 
         return self.payload_banks[payload_index].get_waveform_data(channel)
 
@@ -360,13 +514,33 @@ class RocTimeSliceBank(Bank):
         """
         Get all payload data as NumPy arrays.
 
-        Returns:
-            List of NumPy arrays, one per payload bank
-        """
-        import numpy as np
+        When the same layout is configured for every payload, the samples of
+        all payloads are gathered with one fancy-index copy into a single
+        preallocated array. Otherwise every payload is returned on its own.
 
-        result = []
-        for payload in self.payload_banks:
-            result.append(payload.to_numpy())
+        Returns:
+            (payloads, channels, samples) uint16 array in native byte order if all
+            payloads share a configured layout, otherwise a list of NumPy arrays,
+            one per payload bank (see PayloadBank.to_numpy)
 
-        return result
\ No newline at end of file
+        Raises:
+            ValueError: If a payload is too short for its configured layout
+        """
+        layouts = {self.get_payload_layout(i) for i in range(len(self.payload_offsets))}
+        if len(layouts) != 1 or None in layouts:
+            return [payload.to_numpy() for payload in self.payload_banks]
+        layout = layouts.pop()
+
+        # Payload data sizes from the length words, without creating PayloadBank objects
+        sample_dtype = evio_dtype(Bank.TYPE_UINT16, self.endian)
+        samples = buffer_view(self.mm, self.offset, (self.length + 1) * 2, sample_dtype)
+        words = samples.view(evio_dtype(Bank.TYPE_UINT32, self.endian))
+        header_index = (self.payload_offsets - self.offset) // 4
+        data_bytes = words[header_index].astype(np.int64) * 4 - 4 - ((words[header_index + 1] >> 14) & 0x3)
+        if np.any(data_bytes // 2 < layout.size):
+            raise ValueError(f"Payload data too short for {layout}")
+
+        starts = (self.payload_offsets - self.offset + 8) // 2
+        result = np.empty((len(starts), layout.channels, layout.samples), dtype=np.uint16)
+        np.take(samples, starts[:, None, None] + layout.sample_index(), out=result)
+        return result
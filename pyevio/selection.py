@@ -0,0 +1,91 @@
+from typing import List, Optional
+
+import numpy as np
+
+
+def parse_tag_path(path: str) -> List[Optional[np.ndarray]]:
+    """
+    Parse a tag-path expression.
+
+    A path lists one level per nesting depth, separated by '/', starting with
+    the top-level bank of the event. Each level is a '|' separated list of tags
+    (hex with 0x or decimal) or '*' for any tag, e.g. "0xFF50|0xFF60/0xFF21/*".
+
+    Args:
+        path: Tag-path expression
+
+    Returns:
+        List with, for every level, an array of accepted tags or None for any tag
+
+    Raises:
+        ValueError: If the path is empty or contains an invalid tag
+    """
+    levels = []
+    for level in path.strip().strip('/').split('/'):
+        level = level.strip()
+        if not level:
+            raise ValueError(f"Empty level in tag path {path!r}")
+        if level == '*':
+            levels.append(None)
+            continue
+        try:
+            tags = [int(tag.strip(), 0) for tag in level.split('|')]
+        except ValueError:
+            raise ValueError(f"Invalid tag in tag path {path!r}: {level!r}") from None
+        levels.append(np.array(tags, dtype=np.int64))
+    return levels
+
+
+class Selection:
+    """
+    Jagged result of a tag-path query.
+
+    The payloads of all matched banks are stored back to back in one flat
+    array, with offsets[i]:offsets[i+1] delimiting the data of match i (the
+    layout of an awkward ListOffsetArray). For every match the global event
+    index and bank tag are kept alongside.
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray, event_index: np.ndarray, tags: np.ndarray):
+        """
+        Initialize a Selection from its arrays.
+
+        Args:
+            data: Flat array with the payloads of all matched banks
+            offsets: Start of every match in data, plus the end of the last one
+            event_index: Global event index of every match
+            tags: Tag of every matched bank
+        """
+        self.data = data
+        self.offsets = offsets
+        self.event_index = event_index
+        self.tags = tags
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of data elements of every match."""
+        return np.diff(self.offsets)
+
+    def __len__(self) -> int:
+        """Get the number of matched banks."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        Get the data of one matched bank.
+
+        Args:
+            index: Match index
+
+        Returns:
+            View of the match's data in the flat array
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Match index {index} out of range (0-{len(self)-1})")
+        return self.data[self.offsets[index]:self.offsets[index + 1]]
+
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return f"Selection(matches={len(self)}, values={len(self.data)}, dtype={self.data.dtype})"
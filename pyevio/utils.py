@@ -1,7 +1,77 @@
 import struct
-from typing import Union, Optional
+from typing import Union, Optional, Tuple
 import mmap
 
+import numpy as np
+
+
+def buffer_view(buffer, offset: int, count: int, dtype, copy: bool = False) -> np.ndarray:
+    """
+    Create a NumPy array over part of a buffer without copying it.
+
+    The array is a read-only view of the buffer (e.g. the file memory map).
+    While such a view is alive, the memory map cannot be closed; EvioFile then
+    leaves it to be unmapped when the last view is released.
+
+    Args:
+        buffer: Memory-mapped file or bytes object
+        offset: Byte offset of the first element
+        count: Number of elements
+        dtype: NumPy dtype, including byte order (e.g. np.dtype('>u4'))
+        copy: Return an independent, writable copy instead of a view
+
+    Returns:
+        NumPy array with count elements
+    """
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return array.copy() if copy else array
+
+
+def buffer_bytes(buffer, start: int, end: int, copy: bool = False) -> Union[memoryview, bytes]:
+    """
+    Get a range of a buffer as a read-only memoryview, or as bytes when copy is True.
+
+    Args:
+        buffer: Memory-mapped file or bytes object
+        start: Start byte offset
+        end: End byte offset (exclusive)
+        copy: Return a bytes copy instead of a view
+
+    Returns:
+        memoryview or bytes object
+    """
+    if copy:
+        return buffer[start:end]
+    return memoryview(buffer)[start:end].toreadonly()
+
+
+def gather_ranges(array: np.ndarray, starts, counts) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Copy many ranges of an array into one flat array with a single fancy-index operation.
+
+    The index of every output element is built with NumPy (no Python loop
+    over the ranges): element j of range i comes from starts[i] + j.
+
+    Args:
+        array: 1D source array (e.g. a view over a record)
+        starts: Start index of every range in array
+        counts: Number of elements of every range
+
+    Returns:
+        Tuple of (flat, offsets) in CSR form: range i is flat[offsets[i]:offsets[i+1]]
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    # Output position plus the shift from each range's output start to its source start
+    index = np.arange(offsets[-1], dtype=np.int64)
+    index += np.repeat(starts - offsets[:-1], counts)
+    return array[index], offsets
+
+
 def make_hex_dump(data, chunk_size=4, title=None):
     """
     Create a formatted hexdump of binary data.
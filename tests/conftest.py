@@ -0,0 +1,232 @@
+import gzip
+import os
+import re
+import struct
+import tempfile
+
+import lz4.block
+import pytest
+
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Word lines of `pyevio event --hexdump` output: index, four bytes in file order, bits
+_HEX_WORD = re.compile(r"^\d+\s+((?:[0-9a-f]{2} ){3}[0-9a-f]{2})\s", re.IGNORECASE)
+
+
+def read_hex_dump(name):
+    """
+    Read the event bytes from a recorded `pyevio event --hexdump` output.
+
+    Args:
+        name: File name in the tests directory
+
+    Returns:
+        Bytes of the event in file (big endian) order
+    """
+    data = bytearray()
+    with open(os.path.join(TESTS_DIR, name)) as f:
+        for line in f:
+            match = _HEX_WORD.match(line)
+            if match:
+                data += bytes.fromhex(match.group(1).replace(" ", ""))
+    return bytes(data)
+
+
+@pytest.fixture
+def fadc250_streaming_event():
+    """Recorded streaming event with one FADC250 payload (24 words, big endian)."""
+    return read_hex_dump("hex_fadc250_streaming_event.txt")
+
+
+@pytest.fixture
+def empty_streaming_event():
+    """Recorded streaming event with an empty payload (22 words, big endian)."""
+    return read_hex_dump("hex_empty_streaming_event.txt")
+
+
+# Builders of EVIO v6 file images shared by the test modules
+MAGIC = 0xc0da0100
+
+
+def make_event(tag, payload_words, endian='<', data_type=0x10, num=0x01):
+    """
+    Create a bank-formatted event with the given tag and payload words.
+
+    Args:
+        tag: Top-level bank tag
+        payload_words: List of 32-bit payload words
+        endian: Endianness ('<' for little endian, '>' for big endian)
+        data_type: Bank data type
+        num: Bank num
+
+    Returns:
+        Bytes object with the event
+    """
+    length = len(payload_words) + 1
+    header = struct.pack(f"{endian}II", length, (tag << 16) | (data_type << 8) | num)
+    return header + struct.pack(f"{endian}{len(payload_words)}I", *payload_words)
+
+
+def make_record(events, record_number=1, endian='<', last=False, trailer=False, index_pairs=None, compression=0):
+    """
+    Create a record (or trailer) with the given events.
+
+    Args:
+        events: List of event bytes
+        record_number: Record number
+        endian: Endianness ('<' for little endian, '>' for big endian)
+        last: Set the last record bit
+        trailer: Mark this record as an evio trailer
+        index_pairs: For trailers, list of (record length in bytes, event count) pairs
+        compression: Compression type of the payload (0 none, 1 LZ4, 3 gzip)
+
+    Returns:
+        Bytes object with the record
+    """
+    if trailer:
+        index = struct.pack(f"{endian}{2 * len(index_pairs)}I", *[v for pair in index_pairs for v in pair])
+        events = []
+    else:
+        index = struct.pack(f"{endian}{len(events)}I", *[len(e) for e in events])
+
+    data = b"".join(events)
+
+    bit_info = 0
+    if last or trailer:
+        bit_info |= 1 << 1
+    if trailer:
+        bit_info |= 3 << 20
+
+    payload = index + data
+    compression_word = 0
+    if compression:
+        if compression == 3:
+            payload = gzip.compress(payload)
+        else:
+            payload = lz4.block.compress(payload, store_size=False)
+        padding = -len(payload) % 4
+        payload += b"\0" * padding
+        bit_info |= padding << 16
+        compression_word = (compression << 28) | (len(payload) // 4)
+
+    record_length = 14 + len(payload) // 4
+    header = struct.pack(f"{endian}14I",
+                         record_length, record_number, 14, len(events), len(index),
+                         (bit_info << 8) | 6, 0, MAGIC, len(data), compression_word, 0, 0, 0, 0)
+    return header + payload
+
+
+def make_file(records, endian='<', header_index=False, trailer=True, trailer_position=None):
+    """
+    Create an EVIO v6 file image from a list of (record bytes, event count) tuples.
+
+    Args:
+        records: List of (record_bytes, event_count) tuples
+        endian: Endianness ('<' for little endian, '>' for big endian)
+        header_index: Write a record length index array after the file header
+        trailer: Append a trailer with the record index
+        trailer_position: Override the trailer position written to the file header
+
+    Returns:
+        Bytes object with the file
+    """
+    pairs = [(len(r), count) for r, count in records]
+    index = b""
+    if header_index:
+        index = struct.pack(f"{endian}{2 * len(pairs)}I", *[v for pair in pairs for v in pair])
+
+    body = b"".join(r for r, _ in records)
+    position = 0
+    bit_info = 0
+    if trailer:
+        position = 56 + len(index) + len(body)
+        bit_info |= 1 << 2
+        body += make_record([], record_number=len(records) + 1, endian=endian, trailer=True, index_pairs=pairs)
+    if trailer_position is not None:
+        position = trailer_position
+
+    file_type_id = 0x4556494F
+    header = struct.pack(f"{endian}8I", file_type_id, 1, 14, len(records), len(index), (bit_info << 8) | 6, 0, MAGIC)
+    header += struct.pack(f"{endian}QQII", 0, position, 0, 0)
+    return header + index + body
+
+
+def sample_records(endian='<', compression=0):
+    """Create three records with a mix of event tags and sizes."""
+    records = []
+    for r in range(3):
+        events = [make_event(0xFF60 if i % 2 else 0xFF50, [r, i] + [0] * (i % 3), endian) for i in range(4 + r)]
+        records.append((make_record(events, record_number=r + 1, endian=endian, compression=compression),
+                        len(events)))
+    return records
+
+
+@pytest.fixture
+def write_file():
+    """Write file images to temporary files and clean them up afterwards."""
+    paths = []
+
+    def _write(data):
+        fd, path = tempfile.mkstemp(suffix=".evio")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        paths.append(path)
+        return path
+
+    yield _write
+
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def bank_words(data, endian='<'):
+    """Split bank bytes into 32-bit words to nest them in a parent bank."""
+    return list(struct.unpack(f"{endian}{len(data) // 4}I", data))
+
+
+def nested_event(endian='<'):
+    """Create an event with two levels of child banks."""
+    leaf_a = make_event(0x0001, [10, 11], endian, data_type=0x1)
+    leaf_b = make_event(0x0002, [20], endian, data_type=0x1)
+    inner = make_event(0x0010, bank_words(leaf_b, endian), endian, data_type=0x10)
+    return make_event(0xFF31, bank_words(leaf_a, endian) + bank_words(inner, endian), endian, data_type=0x10)
+
+
+def time_slice_event(frame_number, timestamp, payload_infos, endian='<', roc_id=0x0002, stream_status=0x11,
+                     samples=None):
+    """
+    Create a ROC Time Slice Bank event with one single-word payload bank per payload info.
+
+    Args:
+        frame_number: TSS frame number
+        timestamp: TSS 64 bit timestamp
+        payload_infos: List of 16-bit AIS payload info words
+        endian: Endianness ('<' for little endian, '>' for big endian)
+        roc_id: Tag of the ROC Time Slice Bank
+        stream_status: Stream status (num field)
+        samples: Optional list with the 16-bit samples of every payload
+
+    Returns:
+        Bytes object with the event
+    """
+    padding = 2 * (len(payload_infos) % 2)
+    shorts = struct.pack(f"{endian}{len(payload_infos)}H", *payload_infos) + bytes(padding)
+    ais = list(struct.unpack(f"{endian}{len(shorts) // 4}I", shorts))
+
+    sib = [0x31010003, frame_number, timestamp & 0xFFFFFFFF, timestamp >> 32,
+           (0x41 << 24) | (((padding << 6) | 0x5) << 16) | len(ais)] + ais
+    words = [len(sib) + 1, (0xFF30 << 16) | (0x20 << 8) | stream_status] + sib
+    for i, info in enumerate(payload_infos):
+        if samples is None:
+            words += [2, (info << 16) | (0x01 << 8), i]
+            continue
+        data = struct.pack(f"{endian}{len(samples[i])}H", *samples[i])
+        pad = -len(data) % 4
+        data += bytes(pad)
+        words += [len(data) // 4 + 1, (info << 16) | (pad << 14) | (0x05 << 8)] + \
+            list(struct.unpack(f"{endian}{len(data) // 4}I", data))
+    return make_event(roc_id, words, endian, data_type=0x10, num=stream_status)
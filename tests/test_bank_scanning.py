@@ -74,7 +74,7 @@ def create_mock_bank(length, tag, data_type, num, data=None, endian='<'):
     Create a mock bank with the specified parameters.
 
     Args:
-        length: Bank length in words (including header)
+        length: Bank length in words following the length word (the bank spans length + 1 words)
         tag: Bank tag
         data_type: Bank data type
         num: Bank number
@@ -93,8 +93,8 @@ def create_mock_bank(length, tag, data_type, num, data=None, endian='<'):
 
     # If data is None, create empty data of appropriate length
     if data is None:
-        # Length includes header, so subtract 2 words for data
-        data_size = max(0, (length - 2) * 4)
+        # The header word is counted in the length, the length word is not
+        data_size = max(0, (length - 1) * 4)
         data = bytes(data_size)
 
     # Combine header and data
@@ -115,8 +115,8 @@ def create_mock_event(banks, endian='<'):
     # Calculate total length of all banks in words
     total_length = sum(len(bank) for bank in banks) // 4
 
-    # Add event header (2 words) to total length
-    event_length = total_length + 2
+    # Add the event header word to the total length
+    event_length = total_length + 1
 
     # Create event header
     event_header = struct.pack(f"{endian}I", event_length)
@@ -155,11 +155,11 @@ class TestBankScanning:
     def test_basic_bank_structure(self):
         """Test parsing of a simple container bank with child banks."""
         # Create a container bank with two child banks
-        child1 = create_mock_bank(4, 0x0101, 0x01, 0x01, struct.pack("<II", 1, 2))
-        child2 = create_mock_bank(4, 0x0202, 0x02, 0x02, struct.pack("<II", 3, 4))
+        child1 = create_mock_bank(3, 0x0101, 0x01, 0x01, struct.pack("<II", 1, 2))
+        child2 = create_mock_bank(3, 0x0202, 0x02, 0x02, struct.pack("<II", 3, 4))
 
-        # Container bank length = 2 (header) + len(child1)/4 + len(child2)/4
-        container_length = 2 + len(child1)//4 + len(child2)//4
+        # Container bank length = 1 (header word) + len(child1)/4 + len(child2)/4
+        container_length = 1 + len(child1)//4 + len(child2)//4
         container_data = child1 + child2
         container = create_mock_bank(container_length, 0xFFAA, 0x10, 0x00, container_data)
 
@@ -185,25 +185,25 @@ class TestBankScanning:
         assert children[0].tag == 0x0101
         assert children[0].data_type == 0x01
         assert children[0].num == 0x01
-        assert children[0].length == 4
+        assert children[0].length == 3
 
         # Verify second child
         assert children[1].tag == 0x0202
         assert children[1].data_type == 0x02
         assert children[1].num == 0x02
-        assert children[1].length == 4
+        assert children[1].length == 3
 
     def test_minimal_length_banks(self):
         """Test parsing of banks with minimal lengths (1 and 2)."""
-        # Create a length-1 bank (just the length word)
-        bank1 = struct.pack("<I", 1)
+        # Create a length-1 bank (length word + header word, no data)
+        bank1 = create_mock_bank(1, 0x000E, 0x01, 0x01)
 
-        # Create a length-2 bank (length word + header word)
+        # Create a length-2 bank (length word + header word + one data word)
         bank2 = create_mock_bank(2, 0x000F, 0x00, 0x01)
 
         # Create a container with these banks
         container_data = bank1 + bank2
-        container_length = 2 + len(container_data)//4
+        container_length = 1 + len(container_data)//4
         container = create_mock_bank(container_length, 0xFF60, 0x10, 0x01, container_data)
 
         # Create mock memory map
@@ -221,9 +221,11 @@ class TestBankScanning:
         # Verify first child (length-1 bank)
         assert children[0].length == 1
         assert children[0].offset == 8  # After container header
+        assert children[0].data_length == 0
 
         # Verify second child (length-2 bank)
         assert children[1].length == 2
+        assert children[1].offset == 16
         assert children[1].tag == 0x000F
         assert children[1].data_type == 0x00
         assert children[1].num == 0x01
@@ -231,11 +233,11 @@ class TestBankScanning:
     def test_nonstandard_tag_patterns(self):
         """Test parsing of banks with non-standard tag patterns."""
         # Create a ROC bank with 0x0002 for ROC_ID and 0x11 for status
-        roc_bank = create_mock_bank(3, 0x0002, 0x10, 0x11, struct.pack("<I", 0))
+        roc_bank = create_mock_bank(2, 0x0002, 0x10, 0x11, struct.pack("<I", 0))
 
         # Create a container with this bank
         container_data = roc_bank
-        container_length = 2 + len(container_data)//4
+        container_length = 1 + len(container_data)//4
         container = create_mock_bank(container_length, 0xFF60, 0x10, 0x01, container_data)
 
         # Create mock memory map
@@ -254,20 +256,19 @@ class TestBankScanning:
         assert children[0].tag == 0x0002
         assert children[0].data_type == 0x10
         assert children[0].num == 0x11
-        assert children[0].length == 3
+        assert children[0].length == 2
 
     # Debug version of our data_bank creation - shows what's happening
     def test_complex_event_structure(self):
         """Test parsing of a complex event structure similar to the one analyzed."""
         # Create a segment bank (similar to the 0xFF31 bank)
         segment_data = struct.pack("<IIII", 0x32010003, 0, 0, 0x42010001)
-        segment_bank = create_mock_bank(7, 0xFF31, 0x20, 0x01, segment_data)
+        segment_bank = create_mock_bank(5, 0xFF31, 0x20, 0x01, segment_data)
 
         # Create a ROC bank (similar to the 0x0002 bank)
         stream_info_data = struct.pack("<III", 0xFF302011, 0x31010003, 0)
-        roc_bank = create_mock_bank(11, 0x0002, 0x10, 0x11, stream_info_data + bytes(20))
+        roc_bank = create_mock_bank(9, 0x0002, 0x10, 0x11, stream_info_data + bytes(20))
 
-        # FIXED: Use create_mock_bank instead of struct.pack directly
         data_bank = create_mock_bank(2, 0x000F, 0x00, 0x01, struct.pack("<I", 0x000F0001))
 
         # Enable debugging to see the raw bytes
@@ -319,15 +320,15 @@ class TestBankScanning:
     def test_edge_cases(self):
         """Test handling of edge cases (zero-length banks, boundary conditions)."""
         # Create valid banks
-        valid_bank1 = create_mock_bank(3, 0x0101, 0x01, 0x01, struct.pack("<I", 1))
-        valid_bank2 = create_mock_bank(3, 0x0202, 0x02, 0x02, struct.pack("<I", 2))
+        valid_bank1 = create_mock_bank(2, 0x0101, 0x01, 0x01, struct.pack("<I", 1))
+        valid_bank2 = create_mock_bank(2, 0x0202, 0x02, 0x02, struct.pack("<I", 2))
 
         # Create invalid data (not a proper bank)
         invalid_data = struct.pack("<II", 0, 0)  # Zero length, invalid
 
         # Create container with valid and invalid data
         container_data = valid_bank1 + invalid_data + valid_bank2
-        container_length = 2 + len(container_data)//4
+        container_length = 1 + len(container_data)//4
         container = create_mock_bank(container_length, 0xFF60, 0x10, 0x01, container_data)
 
         # Create mock memory map
@@ -336,8 +337,8 @@ class TestBankScanning:
         # Create bank object
         bank = Bank(mm, 0, '<')
 
-        # Get children - should skip invalid data
-        children = bank.get_children()
+        # Get children - recovery mode should skip invalid data
+        children = bank.get_children(recover=True)
 
         # Verify children count - should only get the valid banks
         assert len(children) == 2
@@ -353,17 +354,17 @@ class TestBankScanning:
     def test_error_recovery(self):
         """Test recovery from corrupted or invalid bank data."""
         # Create valid bank
-        valid_bank = create_mock_bank(3, 0x0101, 0x01, 0x01, struct.pack("<I", 1))
+        valid_bank = create_mock_bank(2, 0x0101, 0x01, 0x01, struct.pack("<I", 1))
 
         # Create bank with invalid length (would go beyond parent)
         invalid_bank = struct.pack("<I", 1000) + struct.pack("<I", 0x02020202)
 
         # Create another valid bank after the invalid one
-        valid_bank2 = create_mock_bank(3, 0x0303, 0x03, 0x03, struct.pack("<I", 3))
+        valid_bank2 = create_mock_bank(2, 0x0303, 0x03, 0x03, struct.pack("<I", 3))
 
         # Create container with mix of valid and invalid
         container_data = valid_bank + invalid_bank + valid_bank2
-        container_length = 2 + len(container_data)//4
+        container_length = 1 + len(container_data)//4
         container = create_mock_bank(container_length, 0xFF60, 0x10, 0x01, container_data)
 
         # Create mock memory map
@@ -372,21 +373,76 @@ class TestBankScanning:
         # Create bank object
         bank = Bank(mm, 0, '<')
 
-        # Get children - should skip invalid bank and recover
-        children = bank.get_children()
+        # Get children - recovery mode should skip the invalid bank and resynchronize
+        children = bank.get_children(recover=True)
 
-        # Verify we found at least the first valid bank
-        assert len(children) >= 1
-        assert children[0].tag == 0x0101
+        # Verify we found both valid banks
+        assert [child.tag for child in children] == [0x0101, 0x0303]
         assert children[0].data_type == 0x01
 
+        # The default walk stops at the invalid bank
+        assert [child.tag for child in bank.get_children()] == [0x0101]
+        assert bank.error["length"] == 1000
+
+
 
 
+    def test_strict_mode(self):
+        """Test that strict mode stops at the first inconsistent child and records it."""
+        valid_bank = create_mock_bank(2, 0x0101, 0x01, 0x01, struct.pack("<I", 1))
+        invalid_bank = struct.pack("<I", 1000) + struct.pack("<I", 0x02020202)
+        valid_bank2 = create_mock_bank(2, 0x0303, 0x03, 0x03, struct.pack("<I", 3))
+
+        container_data = valid_bank + invalid_bank + valid_bank2
+        container_length = 1 + len(container_data)//4
+        container = create_mock_bank(container_length, 0xFF60, 0x10, 0x01, container_data)
+        bank = Bank(MockMemoryMap(container), 0, '<')
+
+        # Strict mode (the default) does not resynchronize past the invalid bank
+        children = bank.get_children()
+        assert [child.tag for child in children] == [0x0101]
+        assert bank.error["offset"] == 8 + len(valid_bank)
+        assert bank.error["length"] == 1000
+
+        # Recovery mode is walked separately and clears the error
+        assert [child.tag for child in bank.get_children(recover=True)] == [0x0101, 0x0303]
+        assert bank.error is None
+
+    def test_strict_mode_valid_children(self):
+        """Test that both modes walk valid children back to back without errors."""
+        banks = [create_mock_bank(2, 0x0100 + i, 0x01, i, struct.pack("<I", i)) for i in range(4)]
+        container_data = b"".join(banks)
+        container = create_mock_bank(1 + len(container_data)//4, 0xFF60, 0x10, 0x01, container_data)
+
+        strict_bank = Bank(MockMemoryMap(container), 0, '<')
+        strict_children = strict_bank.get_children()
+        assert [c.offset for c in strict_children] == [8 + 12 * i for i in range(4)]
+        assert [c.tag for c in strict_children] == [0x0100 + i for i in range(4)]
+        assert strict_bank.error is None
+
+        recover_bank = Bank(MockMemoryMap(container), 0, '<')
+        recover_children = recover_bank.get_children(recover=True)
+        assert [c.offset for c in recover_children] == [c.offset for c in strict_children]
+        assert [c.size for c in recover_children] == [12] * 4
+
+    def test_strict_mode_recorded_event(self, fadc250_streaming_event):
+        """Test strict mode on a recorded streaming event."""
+        event = Bank(fadc250_streaming_event, 0, '>')
+
+        children = event.get_children()
+        assert [(c.offset, c.tag) for c in children] == [(8, 0xFF31), (40, 0x0002)]
+        assert event.error is None
+
+        roc_children = children[1].get_children()
+        assert [(c.offset, c.tag) for c in roc_children] == [(48, 0xFF30), (80, 0x000F)]
+        assert children[1].error is None
 
     def test_real_world_event_structure(self):
         """
         Test with data matching the exact structure from our discussion.
-        This simulates the 21-word event with complex nested structure.
+        This simulates the 21-word event with complex nested structure:
+        a segment bank followed by a ROC bank holding the stream info bank
+        and a data bank.
         """
         # Create a temporary file with binary data
         with tempfile.NamedTemporaryFile(delete=False) as tmp:
@@ -395,16 +451,14 @@ class TestBankScanning:
                 tmp.write(struct.pack("<I", 21))  # 0x00000015
                 tmp.write(struct.pack("<I", 0xFF601001))  # Tag 0xFF60, Type 0x10
 
-                # First bank - Segment (length 7)
+                # First bank - Bank of segments (length 7)
                 tmp.write(struct.pack("<I", 7))  # 0x00000007
                 tmp.write(struct.pack("<I", 0xFF312001))  # Tag 0xFF31, Type 0x20
-                tmp.write(struct.pack("<I", 0x32010003))  # Segment data
+                tmp.write(struct.pack("<I", 0x32010003))  # Segment with 3 data words
                 tmp.write(struct.pack("<I", 0))  # Padding
                 tmp.write(struct.pack("<I", 0))  # Padding
                 tmp.write(struct.pack("<I", 0))  # Padding
-                tmp.write(struct.pack("<I", 0x42010001))  # End of segment data
-
-                # Non-bank data / metadata
+                tmp.write(struct.pack("<I", 0x42010001))  # Segment with 1 data word
                 tmp.write(struct.pack("<I", 0x00020011))  # ROC_ID, status code
 
                 # Second bank - Bank of banks (length 11)
@@ -423,9 +477,8 @@ class TestBankScanning:
                 # Payload info
                 tmp.write(struct.pack("<I", 0))  # Module ID=0 payload info
 
-                # CRITICAL FIX: Add proper bank header for data bank
-                # This bank should have a proper bank header with tag 0x000F, type 0x00, num 0x01
-                tmp.write(struct.pack("<I", 2))  # Length 2
+                # Data bank inside second bank, header only
+                tmp.write(struct.pack("<I", 1))  # Length 1
                 tmp.write(struct.pack("<I", 0x000F0001))  # Tag 0x000F, Type 0x00, Num 0x01
 
                 # Get file size
@@ -470,8 +523,8 @@ class TestBankScanning:
                     for i, child in enumerate(children):
                         print(f"Child {i}: offset={hex(child.offset)}, tag=0x{child.tag:04X}, type=0x{child.data_type:02X}, length={child.length}")
 
-                    # Verify we found all three main components
-                    assert len(children) == 3
+                    # Verify we found both main components
+                    assert len(children) == 2
 
                     # Verify first bank (segment)
                     assert children[0].tag == 0xFF31
@@ -484,15 +537,16 @@ class TestBankScanning:
                     assert children[1].num == 0x11
                     assert children[1].length == 11
 
-                    # Verify third bank (data bank)
-                    assert children[2].tag == 0x000F
-                    assert children[2].data_type == 0x00
-                    assert children[2].num == 0x01
-                    assert children[2].length == 2
+                    # Verify the banks inside the ROC bank (stream info bank, data bank)
+                    roc_children = children[1].get_children()
+                    assert [c.tag for c in roc_children] == [0xFF30, 0x000F]
+                    assert roc_children[1].data_type == 0x00
+                    assert roc_children[1].num == 0x01
+                    assert roc_children[1].length == 1
 
                     # Check the specific offset to verify we found the right bank
-                    expected_offset = 84  # Calculate this from your file structure
-                    assert abs(children[2].offset - expected_offset) <= 4  # Allow small difference due to padding
+                    assert roc_children[1].offset == 80
+                    assert event_bank.error is None and children[1].error is None
 
                 finally:
                     # Clean up memory map
@@ -0,0 +1,127 @@
+import struct
+
+import pytest
+
+from pyevio.evio_file import EvioFile
+
+from conftest import bank_words, make_event, make_file, make_record, nested_event
+
+
+def segment_words():
+    """Payload words of a segment container with two segments."""
+    return [(0x21 << 24) | (0x1 << 16) | 2, 1, 2, (0x22 << 24) | (0x1 << 16) | 1, 3]
+
+
+def tagsegment_words():
+    """Payload words of a tagsegment container with one tagsegment."""
+    return [(0x123 << 20) | (0x1 << 16) | 1, 4]
+
+
+def segment_event(endian='<'):
+    """Create an event holding a segment container and a tagsegment container."""
+    segments = make_event(0x0020, segment_words(), endian, data_type=0x20)
+    tagsegments = make_event(0x0030, tagsegment_words(), endian, data_type=0xC)
+    return make_event(0xFF32, bank_words(segments, endian) + bank_words(tagsegments, endian), endian, data_type=0x10)
+
+
+class TestBankTable:
+    """Tests for the flat array-backed bank tree."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_event_table(self, write_file, endian):
+        """The table lists all banks depth-first with their parents."""
+        event = nested_event(endian)
+        path = write_file(make_file([(make_record([event], endian=endian), 1)], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            event = evio_file.get_record(0).get_event(0)
+            table = event.get_bank_table()
+
+            assert table.tag.tolist() == [0xFF31, 0x0001, 0x0010, 0x0002]
+            assert table.depth.tolist() == [0, 1, 1, 2]
+            assert table.parent.tolist() == [-1, 0, 0, 2]
+            assert table.children(0).tolist() == [1, 2]
+            assert table.find(0x0002).tolist() == [3]
+            assert table.offset[0] == event.offset
+            assert table.data_length[1] == 8
+            assert table.to_numpy(1).tolist() == [10, 11]
+
+            # Bank objects are created lazily and cached
+            assert not table._banks
+            assert table[1].tag == 0x0001 and table[1] is table[1]
+
+    def test_record_table_and_truncation(self, write_file):
+        """A record table has one root per event and stops at banks overrunning their parent."""
+        events = [nested_event(), nested_event()]
+        # Inflate the inner bank length so it overruns the event
+        broken = bytearray(nested_event())
+        struct.pack_into("<I", broken, 24, 50)
+        events.append(bytes(broken))
+
+        path = write_file(make_file([(make_record(events), 3)]))
+        with EvioFile(path) as evio_file:
+            table = evio_file.get_record(0).get_bank_table()
+            assert table.roots().tolist() == [0, 4, 8]
+            assert len(table) == 10
+            assert table.tag[8:].tolist() == [0xFF31, 0x0001]
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_bank_objects_match_table(self, write_file, endian):
+        """Bank objects built from the table span the same length + 1 words as the table."""
+        doubles = bank_words(struct.pack(f"{endian}2d", 1.5, 2.5), endian)
+        event = make_event(0xFF60, bank_words(make_event(0x0002, [7], endian, data_type=0x1), endian)
+                           + bank_words(make_event(0x0001, doubles, endian, data_type=0x8), endian), endian)
+        path = write_file(make_file([(make_record([event], endian=endian), 1)], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            table = evio_file.get_event(0).get_bank_table()
+            for i in (1, 2):
+                assert table[i].size == (table.length[i] + 1) * 4
+                assert table[i].data_length == table.data_length[i]
+                assert table[i].to_numpy().tolist() == table.to_numpy(i).tolist()
+            assert table[2].to_numpy().tolist() == [1.5, 2.5]
+            assert [child.offset for child in table[0].get_children()] == table.offset[1:].tolist()
+
+
+class TestSegments:
+    """Tests for decoding SEGMENT and TAGSEGMENT children."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_bank_children(self, write_file, endian):
+        """Bank.get_children decodes segment and tagsegment headers by the parent type."""
+        events = [make_event(0x0020, segment_words(), endian, data_type=0x20),
+                  make_event(0x0030, tagsegment_words(), endian, data_type=0xC)]
+        path = write_file(make_file([(make_record(events, endian=endian), 2)], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(0)
+            segments = record.get_event(0).get_bank()
+            tagsegments = record.get_event(1).get_bank()
+
+            children = segments.get_children()
+            assert [type(c).__name__ for c in children] == ["Segment", "Segment"]
+            assert [c.tag for c in children] == [0x21, 0x22]
+            assert children[0].to_numpy().tolist() == [1, 2]
+            assert children[1].to_numpy().tolist() == [3]
+
+            (tagsegment,) = tagsegments.get_children()
+            assert type(tagsegment).__name__ == "TagSegment"
+            assert tagsegment.tag == 0x123
+            assert tagsegment.to_numpy().tolist() == [4]
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_bank_table(self, write_file, endian):
+        """BankTable decodes segment and tagsegment headers with their own header sizes."""
+        path = write_file(make_file([(make_record([segment_event(endian)], endian=endian), 1)], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            table = evio_file.get_record(0).get_event(0).get_bank_table()
+
+            assert table.tag.tolist() == [0xFF32, 0x0020, 0x21, 0x22, 0x0030, 0x123]
+            assert table.kind.tolist() == [0, 0, 1, 1, 0, 2]
+            assert table.parent.tolist() == [-1, 0, 1, 1, 0, 4]
+            assert table.data_length[2:4].tolist() == [8, 4]
+            assert table.to_numpy(2).tolist() == [1, 2]
+            assert table.to_numpy(5).tolist() == [4]
+            assert type(table[5]).__name__ == "TagSegment"
+            assert table[3].to_numpy().tolist() == [3]
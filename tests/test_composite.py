@@ -0,0 +1,143 @@
+import struct
+
+import numpy as np
+import pytest
+
+from pyevio.bank import Bank
+from pyevio.composite import compile_format, decode_composite_banks
+
+
+def make_composite_bank(format_string, data, tag=0x0F01, endian='<'):
+    """
+    Create a composite (type 0xF) bank.
+
+    Args:
+        format_string: Composite format string
+        data: Packed data bytes (padded to whole words here)
+        tag: Bank tag
+        endian: Endianness ('<' for little endian, '>' for big endian)
+
+    Returns:
+        Bytes object with the bank
+    """
+    # Format tagsegment: null terminated string padded with 0x04
+    raw = format_string.encode('ascii') + b'\0'
+    raw += b'\x04' * (-len(raw) % 4)
+    format_segment = struct.pack(f"{endian}I", (0x3 << 16) | (len(raw) // 4)) + raw
+
+    # Padding bytes of the last data word go in the pad bits of the data bank
+    padding = -len(data) % 4
+    data += b'\0' * padding
+    data_bank = struct.pack(f"{endian}II", len(data) // 4 + 1, (0x0 << 16) | (padding << 14) | (0x1 << 8)) + data
+
+    payload = format_segment + data_bank
+    # Bank lengths in this repo include the header words
+    header = struct.pack(f"{endian}II", len(payload) // 4 + 2, (tag << 16) | (0xF << 8))
+    return header + payload
+
+
+class TestCompositeFormat:
+    """Tests for compiling composite format strings."""
+
+    def test_fixed_format(self):
+        """Formats without multipliers compile to a packed structured dtype."""
+        composite_format = compile_format("I,2S,F")
+        dtype = composite_format.dtype('>')
+
+        assert composite_format.is_fixed
+        assert dtype.itemsize == 12
+        assert dtype['f0'] == np.dtype('>i4')
+        assert dtype['f1'].shape == (2,)
+
+    def test_variable_format(self):
+        """Multipliers read from the data make a format variable."""
+        composite_format = compile_format("N(I,2S,F)")
+        assert not composite_format.is_fixed
+        assert composite_format.dtype() is None
+
+    def test_group_not_at_start(self):
+        """Formats repeating from a group after the start have no fixed stride."""
+        composite_format = compile_format("i,2(s,F)")
+        assert composite_format.repeat_start == 1
+        assert not composite_format.is_fixed
+        assert composite_format.dtype() is None
+
+    def test_compiled_once(self):
+        """The same format string shares one compiled program."""
+        assert compile_format("2(i,F)") is compile_format("2(i,F)")
+
+    @pytest.mark.parametrize("format_string", ["", "2(I,F", "I,X", "3"])
+    def test_invalid_format(self, format_string):
+        """Malformed format strings are rejected."""
+        with pytest.raises(ValueError):
+            compile_format(format_string)
+
+
+class TestCompositeBank:
+    """Tests for decoding composite banks."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_fixed_bank(self, endian):
+        """Fixed-stride composite data decodes into one row per repetition."""
+        data = struct.pack(f"{endian}i2hf", -1, 2, 3, 1.5) + struct.pack(f"{endian}i2hf", 4, 5, -6, 2.5)
+        bank = Bank(make_composite_bank("I,2S,F", data, endian=endian), 0, endian)
+
+        composite_format, rows = bank.get_composite()
+        assert composite_format.format_string == "I,2S,F"
+        assert rows['f0'].tolist() == [-1, 4]
+        assert rows['f1'].tolist() == [[2, 3], [5, -6]]
+        assert rows['f2'].tolist() == [1.5, 2.5]
+        assert bank.to_numpy()['f0'].tolist() == [-1, 4]
+
+    def test_variable_bank(self):
+        """Formats with multipliers decode into a flat list of values."""
+        data = struct.pack("<i", 2) + struct.pack("<i2hf", 1, 2, 3, 0.5) + struct.pack("<i2hf", 4, 5, 6, 1.0)
+        bank = Bank(make_composite_bank("N(I,2S,F)", data), 0, '<')
+
+        _, values = bank.get_composite()
+        assert values == [1, 2, 3, 0.5, 4, 5, 6, 1.0]
+        assert bank.to_numpy() is None
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_repeat_last_group(self, endian):
+        """After the first pass only the last parenthesized group is repeated."""
+        rows = b"".join(struct.pack(f"{endian}hf", i, i / 4) for i in range(6))
+        data = struct.pack(f"{endian}I", 99) + rows
+        bank = Bank(make_composite_bank("i,2(s,F)", data, endian=endian), 0, endian)
+
+        _, values = bank.get_composite()
+        assert values == [99] + [v for i in range(6) for v in (i, i / 4)]
+
+    def test_repeat_from_group_with_trailing_items(self):
+        """The repeat resumes at the last group and runs to the end of the format."""
+        data = struct.pack("<B", 7) + struct.pack("<2hb", 1, 2, 3) + struct.pack("<2hb", 4, 5, 6)
+        bank = Bank(make_composite_bank("c,2(S),C", data), 0, '<')
+
+        _, values = bank.get_composite()
+        assert values == [7, 1, 2, 3, 4, 5, 6]
+
+    def test_padding_from_pad_bits(self):
+        """Data ending inside an item is an error, padding is taken from the pad bits."""
+        bank = Bank(make_composite_bank("c,S", struct.pack("<Bh", 1, 2) + struct.pack("<B", 3)), 0, '<')
+        with pytest.raises(ValueError):
+            bank.get_composite()
+
+        bank = Bank(make_composite_bank("S", struct.pack("<3h", 1, 2, 3)), 0, '<')
+        _, rows = bank.get_composite()
+        assert rows['f0'].tolist() == [1, 2, 3]
+
+    def test_bulk_decoding(self):
+        """Banks sharing a fixed format decode into one array per format."""
+        banks = [Bank(make_composite_bank("i,F", struct.pack("<If", i, i / 2)), 0, '<') for i in range(3)]
+        banks.append(Bank(make_composite_bank("n(c)", struct.pack("<h3B", 3, 7, 8, 9)), 0, '<'))
+
+        decoded = decode_composite_banks(banks)
+        assert decoded["i,F"]['f0'].tolist() == [0, 1, 2]
+        assert decoded["i,F"]['f1'].tolist() == [0.0, 0.5, 1.0]
+        assert decoded["n(c)"] == [[7, 8, 9]]
+
+    def test_not_composite(self):
+        """Non-composite banks are rejected."""
+        bank = Bank(struct.pack("<III", 3, (0x1 << 16) | (0x1 << 8), 1), 0, '<')
+        with pytest.raises(ValueError):
+            bank.get_composite()
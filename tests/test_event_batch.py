@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pyevio.evio_file import EvioFile
+
+from conftest import make_file, sample_records
+
+
+class TestEventBatches:
+    """Tests for the columnar batch reader."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_batches_span_records(self, write_file, endian):
+        """Batches hold consecutive events across record boundaries in native byte order."""
+        path = write_file(make_file(sample_records(endian), endian=endian))
+
+        with EvioFile(path) as evio_file:
+            expected = [(record, event) for record, event in evio_file.iter_events()]
+            batches = list(evio_file.iter_event_arrays(batch_events=4))
+
+            assert len(expected) == 15
+            assert [len(batch) for batch in batches] == [4, 4, 4, 3]
+            event_index = np.concatenate([batch.event_index for batch in batches])
+            assert event_index.tolist() == list(range(len(expected)))
+
+            position = 0
+            for batch in batches:
+                assert batch.words.dtype == np.dtype(np.uint32)
+                for i in range(len(batch)):
+                    record, event = expected[position]
+                    words = np.frombuffer(event.get_data(), dtype=endian + 'u4')
+                    assert batch[i].tolist() == words.tolist()
+                    assert batch.tags[i] == event.get_bank_info()["tag"]
+                    assert batch.lengths[i] == event.length
+                    position += 1
+
+    def test_batches_by_bytes(self, write_file):
+        """A byte budget limits the batch size but every batch holds at least one event."""
+        path = write_file(make_file(sample_records(compression=1)))
+
+        with EvioFile(path) as evio_file:
+            total = evio_file.get_total_event_count()
+            batches = list(evio_file.iter_event_arrays(batch_bytes=40))
+
+            assert sum(len(batch) for batch in batches) == total
+            assert all(batch.nbytes <= 40 or len(batch) == 1 for batch in batches)
+
+            single = list(evio_file.iter_event_arrays(batch_bytes=1))
+            assert [len(batch) for batch in single] == [1] * total
@@ -0,0 +1,463 @@
+import os
+
+import numpy as np
+import pytest
+
+from pyevio.evio_file import EvioFile
+from pyevio.file_index import FileIndex
+from pyevio.bank import Bank
+from pyevio.dtypes import evio_dtype, to_native
+
+from conftest import make_event, make_file, make_record, sample_records
+
+
+class TestRecordIndex:
+    """Tests for locating records from the file header index, the trailer or a scan."""
+
+    def _scanned(self, write_file, endian='<'):
+        path = write_file(make_file(sample_records(endian), endian=endian, trailer=True, trailer_position=0))
+        with EvioFile(path) as evio_file:
+            return evio_file.index_source, list(evio_file._record_offsets), evio_file.get_total_event_count()
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_trailer_index_matches_scan(self, write_file, endian):
+        """The trailer index gives the same offsets and counts as the linear scan."""
+        source, scan_offsets, scan_total = self._scanned(write_file, endian)
+        assert source == "scan"
+
+        path = write_file(make_file(sample_records(endian), endian=endian, trailer=True))
+        with EvioFile(path) as evio_file:
+            assert evio_file.index_source == "trailer"
+            assert evio_file._record_offsets == scan_offsets
+            assert evio_file.get_total_event_count() == scan_total == 4 + 5 + 6
+            assert evio_file.record_count == 4
+            assert evio_file.get_record(3).header.is_trailer
+
+    def test_file_header_index(self, write_file):
+        """The file header index array is used when present."""
+        _, scan_offsets, scan_total = self._scanned(write_file)
+
+        path = write_file(make_file(sample_records(), header_index=True, trailer=False))
+        with EvioFile(path) as evio_file:
+            assert evio_file.index_source == "file header"
+            assert evio_file.record_count == 3
+            assert evio_file.get_total_event_count() == scan_total
+            assert evio_file.get_record(2).event_count == 6
+
+    def test_bad_trailer_position_falls_back_to_scan(self, write_file):
+        """A trailer position that does not point at a trailer is ignored."""
+        _, scan_offsets, _ = self._scanned(write_file)
+
+        path = write_file(make_file(sample_records(), trailer=True, trailer_position=56))
+        with EvioFile(path) as evio_file:
+            assert evio_file.index_source == "scan"
+            assert evio_file._record_offsets == scan_offsets
+
+
+class TestFileIndex:
+    """Tests for the persistent sidecar index."""
+
+    def test_build_and_reload(self, write_file):
+        """A saved index is used on reopen and gives the same event positions."""
+        path = write_file(make_file(sample_records()))
+
+        with EvioFile(path) as evio_file:
+            expected = [np.concatenate(record.get_event_offsets()) for record in evio_file.iter_records()]
+            file_index = evio_file.build_index()
+
+        try:
+            assert file_index.event_count == 15
+            assert list(np.unique(file_index.event_tags)) == [0xFF50, 0xFF60]
+
+            with EvioFile(path, index="auto") as evio_file:
+                assert evio_file.index_source == "sidecar"
+                for record, record_expected in zip(evio_file.iter_records(), expected):
+                    assert np.array_equal(np.concatenate(record.get_event_offsets()), record_expected)
+        finally:
+            os.unlink(FileIndex.default_path(path))
+
+    def test_stale_index_is_ignored(self, write_file):
+        """An index built for a different file state is not used."""
+        path = write_file(make_file(sample_records()))
+
+        with EvioFile(path) as evio_file:
+            evio_file.build_index()
+
+        try:
+            # Rewrite the file with different content and modification time
+            with open(path, "wb") as f:
+                f.write(make_file(sample_records()[:2]))
+            os.utime(path, ns=(0, 0))
+
+            with EvioFile(path, index="auto") as evio_file:
+                assert evio_file.index_source == "trailer"
+                assert evio_file.get_total_event_count() == 9
+        finally:
+            os.unlink(FileIndex.default_path(path))
+
+    def test_auto_index_in_cache_dir(self, write_file, tmp_path, monkeypatch):
+        """An index written to a cache directory, e.g. by `pyevio index --cache-dir`, is found by index="auto"."""
+        from click.testing import CliRunner
+        from pyevio.cli.index import index_command
+
+        path = write_file(make_file(sample_records()))
+        cache_dir = str(tmp_path / "indexes")
+
+        result = CliRunner().invoke(index_command, [path, "--cache-dir", cache_dir], obj={})
+        assert result.exit_code == 0
+        assert os.path.exists(FileIndex.default_path(path, cache_dir))
+        assert not os.path.exists(path + FileIndex.SUFFIX)
+
+        with EvioFile(path, index="auto") as evio_file:
+            assert evio_file.index_source != "sidecar"
+        with EvioFile(path, index="auto", index_dir=cache_dir) as evio_file:
+            assert evio_file.index_source == "sidecar"
+
+        monkeypatch.setenv(FileIndex.CACHE_DIR_ENV, cache_dir)
+        with EvioFile(path, index="auto") as evio_file:
+            assert evio_file.index_source == "sidecar"
+            assert evio_file.get_total_event_count() == 15
+
+    def test_cache_dir_path(self, tmp_path):
+        """Index files in a cache directory are named after the data file."""
+        path = FileIndex.default_path("/data/run_1.evio", str(tmp_path))
+        assert os.path.dirname(path) == str(tmp_path)
+        assert os.path.basename(path).startswith("run_1.evio.")
+        assert path.endswith(FileIndex.SUFFIX)
+
+
+class TestRecordEvents:
+    """Tests for the vectorized record event index."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_scan_events(self, write_file, endian):
+        """Event offsets are the cumulative sum of the index array lengths."""
+        path = write_file(make_file(sample_records(endian), endian=endian))
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(1)
+            offsets, lengths = record.scan_events()
+
+            assert offsets.dtype == np.int64 and lengths.dtype == np.int64
+            assert len(offsets) == record.event_count == 5
+            assert offsets[0] == record.data_start
+            assert np.array_equal(offsets[1:], offsets[:-1] + lengths[:-1])
+            assert [event.offset for event in record.get_events()] == offsets.tolist()
+
+            sub_offsets, sub_lengths = record.get_event_offsets(1, 3)
+            assert np.array_equal(sub_offsets, offsets[1:3])
+
+            # The trailer's index holds record lengths, not events
+            assert len(evio_file.get_record(3).scan_events()[0]) == 0
+
+    def test_lazy_event_view(self, write_file):
+        """Record.events creates Event objects only when they are accessed."""
+        path = write_file(make_file(sample_records()))
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(1)
+            offsets, lengths = record.scan_events()
+            events = record.events
+
+            assert len(events) == 5
+            assert events.offsets is offsets
+            assert events[-1].offset == offsets[-1] and events[-1].index == 4
+            assert [event.index for event in events[1:3]] == [1, 2]
+            assert [event.length for event in events[::2]] == lengths[::2].tolist()
+            assert record.get_events(2, 4)[0].index == 2
+            with pytest.raises(IndexError):
+                events[5]
+
+            # Events and headers have no per-instance __dict__
+            assert not hasattr(events[0], '__dict__')
+            assert not hasattr(record.header, '__dict__')
+            assert not hasattr(events[0].get_bank(), '__dict__')
+
+
+class TestGlobalEventLookup:
+    """Tests for looking up events by global index."""
+
+    def test_get_record_and_event(self, write_file):
+        """Global indices map to the right record and local event."""
+        path = write_file(make_file(sample_records()))
+        with EvioFile(path) as evio_file:
+            expected = [(record.index, event.offset) for record, event in evio_file.iter_events()]
+            assert len(expected) == 15
+
+            for i, (record_index, offset) in enumerate(expected):
+                record, event = evio_file.get_record_and_event(i)
+                assert (record.index, event.offset) == (record_index, offset)
+
+            assert evio_file.get_event(9).offset == expected[9][1]
+
+            with pytest.raises(IndexError):
+                evio_file.get_record_and_event(15)
+
+    def test_get_events_by_global_index(self, write_file):
+        """Batched lookup keeps the requested order and matches single lookups."""
+        path = write_file(make_file(sample_records()))
+        with EvioFile(path) as evio_file:
+            indices = [14, 0, 4, 3, 9, 4]
+            found = evio_file.get_events_by_global_index(indices)
+            assert [event.offset for _, event in found] == \
+                [evio_file.get_event(i).offset for i in indices]
+            assert [record.index for record, _ in found] == [2, 0, 1, 0, 2, 1]
+
+            assert evio_file.get_events_by_global_index([]) == []
+            with pytest.raises(IndexError):
+                evio_file.get_events_by_global_index([1, -1])
+
+    def test_dump_skips_failing_events(self, write_file, monkeypatch, capsys):
+        """Dumping by global index skips only the events that cannot be read."""
+        from pyevio.cli.dump import fetch_events
+
+        path = write_file(make_file(sample_records()))
+        with EvioFile(path) as evio_file:
+            get_event = evio_file.get_event
+
+            def failing_get_event(index):
+                if index == 5:
+                    raise ValueError("corrupt event")
+                return get_event(index)
+
+            def failing_batch(indices):
+                raise ValueError("corrupt event")
+
+            monkeypatch.setattr(evio_file, "get_event", failing_get_event)
+            monkeypatch.setattr(evio_file, "get_events_by_global_index", failing_batch)
+
+            events = fetch_events(evio_file, 4, 3, None)
+            assert [index for _, index in events] == [3, 4, 6]
+            assert capsys.readouterr().out == ""
+
+            # Skipped events are only reported in verbose mode
+            events = fetch_events(evio_file, 4, 3, None, verbose=True)
+            assert [index for _, index in events] == [3, 4, 6]
+            assert "Skipping event 5" in capsys.readouterr().out
+
+
+class TestCompressedRecords:
+    """Tests for LZ4 and gzip compressed records."""
+
+    def _event_words(self, evio_file):
+        return [bytes(event.get_data()) for _, event in evio_file.iter_events()]
+
+    @pytest.mark.parametrize("compression", [1, 2, 3])
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_compressed_matches_uncompressed(self, write_file, compression, endian):
+        """Compressed records give the same events as uncompressed ones."""
+        plain_path = write_file(make_file(sample_records(endian), endian=endian))
+        packed_path = write_file(make_file(sample_records(endian, compression), endian=endian))
+
+        with EvioFile(plain_path) as plain, EvioFile(packed_path) as packed:
+            assert packed.get_record(0).is_compressed
+            assert packed.get_total_event_count() == 15
+            assert self._event_words(packed) == self._event_words(plain)
+
+            record, event = packed.get_record_and_event(7)
+            assert record.index == 1
+            assert event.get_bank_info()["tag"] == 0xFF60
+
+    def test_cache_byte_budget(self, write_file):
+        """Decompressed records are cached within the byte budget."""
+        path = write_file(make_file(sample_records(compression=1)))
+
+        with EvioFile(path) as evio_file:
+            first = evio_file.get_record(0)
+            assert evio_file.get_record(0) is first
+            assert evio_file.record_cache.hits == 1
+            budget = max(record.memory_size for record in evio_file.iter_records())
+
+        # Budget for a single record: scanning evicts older records
+        with EvioFile(path, cache_bytes=budget) as evio_file:
+            for _ in evio_file.iter_records():
+                assert evio_file.record_cache.current_bytes <= budget
+            assert len(evio_file.record_cache) == 1
+            assert 0 not in evio_file.record_cache
+
+        # No budget: records are decompressed on every access
+        with EvioFile(path, cache_bytes=0) as evio_file:
+            assert evio_file.get_record(0) is not evio_file.get_record(0)
+            assert len(evio_file.record_cache) == 0
+
+    @pytest.mark.parametrize("compression", [0, 1])
+    def test_prefetch_iter_records(self, write_file, compression):
+        """Read-ahead iteration yields the same records in order."""
+        path = write_file(make_file(sample_records(compression=compression)))
+
+        with EvioFile(path) as evio_file:
+            expected = [(record.offset, record.event_count) for record in evio_file.iter_records()]
+
+        with EvioFile(path) as evio_file:
+            records = list(evio_file.iter_records(prefetch=2, workers=2))
+            assert [(record.offset, record.event_count) for record in records] == expected
+            assert [record.index for record in records] == [0, 1, 2, 3]
+
+            # Stopping early leaves the file usable
+            for record in evio_file.iter_records(prefetch=3):
+                break
+            assert evio_file.get_record(2).event_count == 6
+
+    @pytest.mark.parametrize("prefetch", [1, 2, 3])
+    def test_prefetch_window(self, write_file, monkeypatch, prefetch):
+        """The read-ahead window holds at most prefetch records and its lookups are not cache misses."""
+        path = write_file(make_file(sample_records(compression=1)))
+
+        with EvioFile(path) as evio_file:
+            created = []
+            create_record = evio_file._create_record
+
+            def tracking_create_record(index):
+                created.append(index)
+                return create_record(index)
+
+            monkeypatch.setattr(evio_file, "_create_record", tracking_create_record)
+            for record in evio_file.iter_records(prefetch=prefetch, workers=1):
+                assert max(created) < record.index + prefetch
+            assert sorted(created) == [0, 1, 2, 3]
+            assert evio_file.record_cache.misses == 0
+
+
+class TestHexdumps:
+    """Tests for the hex dumps of the event and debug commands."""
+
+    @pytest.mark.parametrize("command", ["event", "debug"])
+    def test_compressed_event_hexdump(self, write_file, monkeypatch, command):
+        """Event hex dumps of compressed records show the decompressed event words."""
+        from click.testing import CliRunner
+        import pyevio.cli.debug
+        import pyevio.cli.event
+
+        path = write_file(make_file(sample_records(compression=1)))
+        dumps = []
+        module = pyevio.cli.event if command == "event" else pyevio.cli.debug
+        monkeypatch.setattr(module, "print_offset_hex",
+                            lambda data, offset, words, title=None: dumps.append(bytes(data[offset:offset + 4 * words])))
+
+        args = [path, "1", "-r", "0", "--hexdump"] if command == "event" else [path, "-r", "0", "-e", "1", "--hexdump"]
+        result = CliRunner().invoke(module.event_command if command == "event" else module.debug_command,
+                                    args, obj={})
+        assert result.exit_code == 0
+
+        with EvioFile(path) as evio_file:
+            expected = bytes(evio_file.get_record(0).get_event(1).get_data())
+        assert any(dump and expected.startswith(dump) for dump in dumps)
+
+
+class TestTagCensus:
+    """Tests for the event tag and size census used by `pyevio ana`."""
+
+    def test_parallel_histograms_match_serial_analysis(self, write_file):
+        """Reduced worker histograms give the same file analysis as merged record dicts."""
+        from pyevio.cli.ana import (analyze_event_tags_safe, merge_tag_analyses,
+                                    analyze_record_range, histogram_to_analysis)
+
+        path = write_file(make_file(sample_records()))
+        with EvioFile(path) as evio_file:
+            serial = merge_tag_analyses([analyze_event_tags_safe(record, detailed=True)
+                                         for record in evio_file.iter_records()])
+
+        parts = [analyze_record_range(path, 0, 2), analyze_record_range(path, 2, 4)]
+        tags, sizes, counts = (np.concatenate([p[key] for p in parts]) for key in ("tags", "sizes", "counts"))
+        parallel = histogram_to_analysis(tags, sizes, counts)
+
+        assert parallel["total_events"] == serial["total_events"] == 15
+        assert parallel["total_size"] == serial["total_size"]
+        for tag, tag_data in serial["tags"].items():
+            for key in ("count", "uniform_size", "min_size", "max_size", "total_size", "size_distribution"):
+                assert parallel["tags"][tag][key] == tag_data[key]
+
+    def test_record_tag_census(self, write_file):
+        """tag_census counts events by (tag, size) like a per-event loop does."""
+        path = write_file(make_file(sample_records('>'), endian='>'))
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(2)
+
+            expected = {}
+            for event in record.get_events():
+                key = (event.get_bank_info()["tag"], event.length)
+                expected[key] = expected.get(key, 0) + 1
+
+            tags, sizes, counts = record.tag_census()
+            assert dict(zip(zip(tags.tolist(), sizes.tolist()), counts.tolist())) == expected
+
+            tags, _, counts = record.tag_census(1, 3)
+            assert tags.tolist() == [0xFF50, 0xFF60] and counts.sum() == 2
+
+    def test_analyze_event_tags_statistics(self, write_file):
+        """Census based statistics match NumPy statistics of the raw event sizes."""
+        from pyevio.cli.record import analyze_event_tags
+
+        path = write_file(make_file(sample_records()))
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(2)
+            analysis = analyze_event_tags(record, detailed=True)
+
+            lengths = np.array([e.length for e in record.get_events() if e.get_bank_info()["tag"] == 0xFF50])
+            tag_data = analysis["tags"]["0xFF50"]
+            assert tag_data["count"] == len(lengths)
+            assert tag_data["median_size"] == int(np.median(lengths))
+            assert tag_data["std_size"] == pytest.approx(np.std(lengths))
+            assert analysis["total_events"] == 6
+
+
+class TestZeroCopy:
+    """Tests for zero-copy NumPy views of file data."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_bank_to_numpy_view(self, write_file, endian):
+        """Bank.to_numpy returns a read-only view in the file's byte order unless copy is set."""
+        event = make_event(0xFF50, [1, 2, 0xDEADBEEF], endian, data_type=0x1)
+        path = write_file(make_file([(make_record([event], endian=endian), 1)], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            event = evio_file.get_record(0).get_event(0)
+            bank = Bank(evio_file.mm, event.offset, endian)
+
+            payload = [1, 2, 0xDEADBEEF][:bank.data_length // 4]
+            view = bank.to_numpy()
+            assert len(view) >= 2 and view.tolist() == payload
+            assert not view.flags.writeable and not view.flags.owndata
+
+            copy = bank.to_numpy(copy=True)
+            assert copy.flags.writeable and copy.flags.owndata
+            assert np.array_equal(copy, view)
+
+            data = event.get_data()
+            assert isinstance(data, memoryview) and data.readonly
+            assert bytes(data) == event.get_data(copy=True)
+
+        # Views stay valid after the file is closed
+        assert view.tolist() == payload
+
+
+class TestByteOrder:
+    """Tests for byte-order-correct typed arrays."""
+
+    def test_evio_dtype(self):
+        """The dtype factory maps EVIO types to dtypes with explicit byte order."""
+        assert evio_dtype(Bank.TYPE_UINT16, '>') == np.dtype('>u2')
+        assert evio_dtype(Bank.TYPE_FLOAT64, '<') == np.dtype('<f8')
+        assert evio_dtype(Bank.TYPE_BANK, '<') is None
+
+        swapped = np.array([1, 2], dtype='>u4' if np.little_endian else '<u4')
+        assert to_native(swapped).dtype.isnative
+        assert to_native(swapped).tolist() == [1, 2]
+        native = np.array([1, 2], dtype=np.uint32)
+        assert to_native(native) is native
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_typed_bank_and_events(self, write_file, endian):
+        """Typed bank data and event arrays decode the same in both byte orders."""
+        words = [0x00010002, 0x3F800000, 0xFFFF0000, 0x12345678]
+        event = make_event(0xFF60, words, endian, data_type=Bank.TYPE_FLOAT32)
+        path = write_file(make_file([(make_record([event], endian=endian), 1)], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(0)
+            bank = Bank(evio_file.mm, record.get_event(0).offset, endian)
+
+            values = bank.to_numpy(native=True)
+            assert values.dtype.isnative
+            assert values[1] == 1.0
+
+            result = record.events_to_numpy(0xFF60)
+            assert result[2:].tolist() == words
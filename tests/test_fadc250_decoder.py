@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from pyevio.decoders.fadc250_triggered import MAXRAW, FaDecoder, decode_fadc_words
+
+
+def header(data_type, payload):
+    """Create a type-defining word (bit 31 set) with the data type in bits 27-30."""
+    return 0x80000000 | (data_type << 27) | payload
+
+
+def sample_word(adc_1, adc_2, invalid_1=False, invalid_2=False):
+    """Create a raw sample continuation word with two ADC values."""
+    return (adc_1 << 16) | adc_2 | (0x20000000 if invalid_1 else 0) | (0x2000 if invalid_2 else 0)
+
+
+def make_bank(slot=3, event=7, time_1=0x123456, time_2=0x0000AB, chan_offset=0):
+    """Create the words of one triggered-mode FADC250 bank."""
+    return [
+        header(0, (slot << 22) | (5 << 8) | 1),                 # block header
+        header(2, (slot << 22) | event),                         # event header
+        event + 1,                                               # event header 2
+        header(3, time_1),                                       # trigger time 1
+        time_2,                                                  # trigger time 2
+        header(4, ((2 + chan_offset) << 23) | 4),                # window raw data, chan 2
+        sample_word(100, 101),
+        sample_word(102, 103, invalid_2=True),
+        header(4, ((2 + chan_offset) << 23) | 2),                # same channel continues the buffer
+        sample_word(104, 105),
+        header(4, ((5 + chan_offset) << 23) | 2),                # new channel restarts the buffer
+        sample_word(200, 201, invalid_1=True),
+        header(8, ((1 + chan_offset) << 23) | (1 << 21) | 321),  # pulse time
+        header(7, ((1 + chan_offset) << 23) | (2 << 19) | 4000),  # pulse integral
+        (1 + chan_offset) << 23 | 4100,                          # pulse integral continuation
+        header(15, 0),                                           # filler
+        header(1, (slot << 22) | 16),                            # block trailer
+    ]
+
+
+def run_decoder(words):
+    """Feed words one by one to a new FaDecoder."""
+    decoder = FaDecoder()
+    for word in words:
+        decoder.faDataDecode(int(word))
+    return decoder
+
+
+def assert_matches_decoder(words):
+    """Check that decode_fadc_words gives the values of the per-word FaDecoder."""
+    words = np.asarray(words, dtype=np.uint32)
+    decoder = run_decoder(words)
+    decoded = decode_fadc_words(words)
+
+    def last(rows, field, default=0):
+        return rows[field][-1] if len(rows) else default
+
+    block = decoded["block_headers"]
+    assert (last(block, "slot"), last(block, "blk_num"), last(block, "n_evts")) == (
+        decoder.fadc_data.slot_id_hd, decoder.fadc_data.blk_num, decoder.fadc_data.n_evts)
+    assert last(decoded["block_trailers"], "n_words") == decoder.fadc_data.n_words
+    assert last(decoded["event_headers"], "evt_num") == decoder.fadc_data.evt_num_1
+    assert last(decoded["trigger_times"], "time") == decoder.fadc_trigtime
+    assert last(decoded["window_sums"], "over", False) == decoder.fadc_data.over
+
+    # Raw samples land at the same positions of the same channel buffers
+    raw = decoded["raw_samples"]
+    for chan in range(decoder.FADC_NCHAN):
+        samples = raw[raw["chan"] == chan]
+        expected = np.zeros(decoder.MAXRAW, dtype=np.int64)
+        expected[samples["sample"]] = samples["adc"]
+        assert expected.tolist() == decoder.frawdata[chan]
+
+    integrals = decoded["pulse_integrals"]
+    times = decoded["pulse_times"]
+    for chan in range(decoder.FADC_NCHAN):
+        chan_integrals = integrals["integral"][integrals["chan"] == chan]
+        chan_times = times["time"][times["chan"] == chan]
+        assert len(chan_integrals) == decoder.fadc_nhit[chan] - np.count_nonzero(decoded["windows"]["chan"] == chan)
+        assert (chan_integrals[0] if len(chan_integrals) else 0) == decoder.fadc_int[chan]
+        assert (chan_integrals[1] if len(chan_integrals) > 1 else 0) == decoder.fadc_int_1[chan]
+        assert (chan_times[0] if len(chan_times) else 0) == decoder.fadc_time[chan]
+    return decoded
+
+
+class TestVectorizedFadcDecoder:
+    """The vectorized decoder gives the same values as the per-word FaDecoder."""
+
+    @pytest.mark.parametrize("bank_kwargs", [{}, {"slot": 9, "event": 1000, "chan_offset": 4}])
+    def test_matches_per_word_decoder(self, bank_kwargs):
+        assert_matches_decoder(make_bank(**bank_kwargs))
+
+    def test_window_sum(self):
+        """Window sums are decoded with their overflow flag."""
+        words = make_bank() + [header(5, (3 << 23) | (1 << 22) | 0x1234)]
+        sums = assert_matches_decoder(words)["window_sums"]
+        assert (sums["chan"].tolist(), sums["over"].tolist(), sums["adc_sum"].tolist()) == ([3], [True], [0x1234])
+
+    def test_raw_buffer_limit(self):
+        """Samples beyond MAXRAW positions of a channel buffer are dropped, as by FaDecoder."""
+        width = MAXRAW + 6
+        words = [header(4, (2 << 23) | width)] + [sample_word(i % 4000, (i + 1) % 4000) for i in range(width // 2)]
+        raw = assert_matches_decoder(words)["raw_samples"]
+        assert len(raw) == MAXRAW
+        assert raw["sample"].max() == MAXRAW - 1
+
+    @pytest.mark.parametrize("fixture", ["fadc250_streaming_event", "empty_streaming_event"])
+    def test_recorded_words(self, request, fixture):
+        """Both decoders agree on the words of recorded events."""
+        data = request.getfixturevalue(fixture)
+        words = np.frombuffer(data, dtype='>u4')
+        assert_matches_decoder(words)
+        # Every word after the first one, so that decoding starts at each recorded word
+        for start in range(1, len(words)):
+            assert_matches_decoder(words[start:])
+
+    def test_multiple_banks(self):
+        """With CSR offsets every bank is decoded as if by a new FaDecoder."""
+        first = make_bank()
+        second = make_bank(slot=4, event=8, time_1=0x10, time_2=0x20)
+        # A bank starting with a continuation word must not continue the previous bank
+        third = [sample_word(1, 2)] + make_bank(slot=5)
+        words = np.array(first + second + third, dtype=np.uint32)
+        offsets = np.cumsum([0, len(first), len(second), len(third)])
+
+        decoded = decode_fadc_words(words, offsets)
+        assert decoded["block_headers"]["bank"].tolist() == [0, 1, 2]
+        assert decoded["trigger_times"]["time"][1] == run_decoder(second).fadc_trigtime
+
+        # Channel buffers restart in every bank
+        raw = decoded["raw_samples"]
+        assert raw["sample"][raw["bank"] == 1].tolist() == raw["sample"][raw["bank"] == 0].tolist()
+        assert len(raw[raw["bank"] == 2]) == len(raw[raw["bank"] == 0])
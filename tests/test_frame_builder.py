@@ -0,0 +1,63 @@
+from pyevio.evio_file import EvioFile
+from pyevio.frame_builder import FrameBuilder
+
+from conftest import make_file, make_record, time_slice_event
+
+
+class TestFrameBuilder:
+    """Tests for grouping time-slice banks of several ROCs by frame number."""
+
+    def interleaved_file(self, write_file, frames):
+        """Write a file with one record per ROC group, banks given as (roc_id, frame_number)."""
+        events = [time_slice_event(frame, 1000 + frame, [roc], roc_id=roc) for roc, frame in frames]
+        return write_file(make_file([(make_record(events[i:i + 3], record_number=i // 3 + 1), len(events[i:i + 3]))
+                                     for i in range(0, len(events), 3)]))
+
+    def test_complete_frames(self, write_file):
+        """Frames are emitted once every expected ROC arrived, across records."""
+        path = self.interleaved_file(write_file, [(1, 0), (2, 0), (1, 1), (3, 0), (2, 1), (3, 1)])
+
+        with EvioFile(path) as evio_file:
+            builder = FrameBuilder(rocs=[1, 2, 3])
+            frames = list(builder.iter_frames(evio_file))
+
+            assert [frame.frame_number for frame in frames] == [0, 1]
+            assert all(frame.complete for frame in frames)
+            assert sorted(frames[1].banks) == [1, 2, 3]
+            assert frames[0].event_index == {1: 0, 2: 1, 3: 3}
+            assert frames[1].timestamp == 1001
+            assert len(frames[0].payloads()[2]) == 1
+            assert builder.complete_count == 2 and builder.incomplete_count == 0
+
+    def test_missing_and_late(self, write_file):
+        """Timed-out frames report missing ROCs and later banks for them are late."""
+        path = self.interleaved_file(write_file, [(1, 0), (2, 0), (1, 1), (2, 1), (1, 2), (2, 2), (3, 0)])
+
+        with EvioFile(path) as evio_file:
+            builder = FrameBuilder(rocs=[1, 2, 3], timeout=1)
+            frames = list(builder.iter_frames(evio_file))
+
+            assert [(frame.frame_number, frame.missing) for frame in frames] == [(0, [3]), (1, [3]), (2, [3])]
+            assert builder.missing == {3: 3}
+            assert builder.late == {3: 1}
+
+    def test_window(self):
+        """No more than window frames are kept open."""
+        builder = FrameBuilder(rocs=[1, 2], window=2, emit_incomplete=False)
+        closed = []
+        for frame_number in range(5):
+            closed += builder.add(1, frame_number, None)
+
+        assert closed == []
+        assert builder.incomplete_count == 3
+        assert len(builder.add(2, 4, None)) == 1
+        assert builder.add(2, 0, None) == [] and builder.late == {2: 1}
+
+    def test_learned_rocs(self):
+        """Without expected ROCs, frames close on flush against all ROCs seen."""
+        builder = FrameBuilder()
+        assert builder.add(1, 0, None) == []
+        assert builder.add(2, 1, None) == []
+
+        frames = builder.flush()
+        assert [(frame.frame_number, frame.missing) for frame in frames] == [(0, [2]), (1, [1])]
@@ -0,0 +1,77 @@
+import struct
+
+import numpy as np
+import pytest
+
+from pyevio.evio_file import EvioFile
+
+from conftest import make_event, make_file, make_record
+
+
+class TestUniformRuns:
+    """Tests for the fixed-stride views of uniform event runs."""
+
+    def test_runs_and_views(self, write_file):
+        """Back to back events of equal size are viewed as 2D blocks without copying."""
+        events = [make_event(0xFF60, [i, i]) for i in range(3)]
+        events.append(make_event(0xFF50, [9]))
+        events += [make_event(0xFF60, [i, i]) for i in range(3, 5)]
+        events.append(make_event(0xFF60, [5, 5, 5]))
+        path = write_file(make_file([(make_record(events), len(events))]))
+
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(0)
+            offsets, lengths = record.scan_events()
+            starts, ends = record.get_uniform_runs(offsets, lengths)
+            assert list(zip(starts.tolist(), ends.tolist())) == [(0, 3), (3, 4), (4, 6), (6, 7)]
+
+            views = record.events_to_numpy(0xFF60, runs=True)
+            assert [view.shape for view in views] == [(3, 4), (2, 4), (1, 5)]
+            assert all(not view.flags.owndata for view in views)
+            assert views[1][:, 2:].tolist() == [[3, 3], [4, 4]]
+
+            flat = record.events_to_numpy(0xFF60)
+            assert flat.tolist() == np.concatenate([view.reshape(-1) for view in views]).tolist()
+
+            # A single run is returned as a view
+            single = record.events_to_numpy(0xFF60, end_event=3)
+            assert not single.flags.owndata and len(single) == 12
+
+            direct = record.events_to_numpy_direct(0, 3)
+            assert direct.shape == (3, 4) and not direct.flags.owndata
+            assert record.events_to_numpy_direct(signature=0xFF60, event_size_words=4).shape == (6, 4)
+
+            # Rows running past the end of the data section are zero-filled
+            rows = record.events_to_numpy_direct(5, 7, event_size_words=6)
+            last = list(struct.unpack("<5I", events[6]))
+            assert rows[0].tolist() == list(struct.unpack("<4I", events[5])) + last[:2]
+            assert rows[1].tolist() == last + [0]
+            assert record.events_to_numpy(0xFF40).tolist() == []
+
+
+class TestGather:
+    """Tests for the vectorized gather of variable-length events."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_gather_mixed_events(self, write_file, endian):
+        """Mixed-size events are gathered into CSR form matching their raw words."""
+        events = [make_event(0xFF60 if i % 3 else 0xFF50, list(range(i + 1)), endian) for i in range(7)]
+        path = write_file(make_file([(make_record(events, endian=endian), len(events))], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            record = evio_file.get_record(0)
+            offsets, lengths = record.scan_events()
+            flat, event_offsets = record.gather_events(offsets, lengths)
+
+            assert event_offsets.tolist() == [0] + np.cumsum(lengths // 4).tolist()
+            for i, event in enumerate(record.events):
+                expected = np.frombuffer(event.get_data(), dtype=endian + 'u4')
+                assert flat[event_offsets[i]:event_offsets[i + 1]].tolist() == expected.tolist()
+
+            # Signature selection over a mixed stream
+            ff60 = [e for e in record.events if e.get_bank_info()["tag"] == 0xFF60]
+            expected = np.concatenate([np.frombuffer(e.get_data(), dtype=endian + 'u4') for e in ff60])
+            assert record.events_to_numpy(0xFF60).tolist() == expected.tolist()
+
+            rows = record.events_to_numpy_direct()
+            assert rows.dtype == object and [len(row) for row in rows] == (lengths // 4).tolist()
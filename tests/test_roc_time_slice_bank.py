@@ -0,0 +1,191 @@
+import struct
+
+import numpy as np
+import pytest
+
+from pyevio.roc_time_slice_bank import (PayloadLayout, RocTimeSliceBank, StreamInfoBank, decode_payload_infos,
+                                        decode_time_slice_headers)
+
+
+def make_roc_time_slice_bank(payload_infos, frame_number=0x34490, timestamp=0x0000000344900000,
+                             roc_id=0x0002, stream_status=0x11, endian='>', samples=None):
+    """
+    Create a ROC Time Slice Bank with one payload bank per payload info.
+
+    Args:
+        payload_infos: List of 16-bit AIS payload info words
+        frame_number: TSS frame number
+        timestamp: TSS 64 bit timestamp
+        roc_id: Tag of the ROC Time Slice Bank
+        stream_status: Stream status (num field)
+        endian: Endianness ('<' for little endian, '>' for big endian)
+        samples: Optional list with the 16-bit samples of every payload
+            (default: one data word holding the payload index)
+
+    Returns:
+        Bytes object with the bank
+    """
+    # TSS: header, frame number and timestamp (low word first)
+    tss = struct.pack(f"{endian}IIII", 0x31010003, frame_number,
+                      timestamp & 0xFFFFFFFF, timestamp >> 32)
+
+    # AIS: payload infos as shorts, padded to whole words
+    padding = 2 * (len(payload_infos) % 2)
+    ais_words = (len(payload_infos) * 2 + padding) // 4
+    ais = struct.pack(f"{endian}I", (0x41 << 24) | (((padding << 6) | 0x5) << 16) | ais_words)
+    ais += struct.pack(f"{endian}{len(payload_infos)}H", *payload_infos) + bytes(padding)
+
+    sib_payload = tss + ais
+    sib = struct.pack(f"{endian}II", len(sib_payload) // 4 + 1,
+                      (0xFF30 << 16) | (0x20 << 8) | stream_status) + sib_payload
+
+    if samples is None:
+        payloads = b''.join(
+            struct.pack(f"{endian}III", 2, (info << 16) | (0x01 << 8), i) for i, info in enumerate(payload_infos))
+    else:
+        payloads = b''
+        for info, payload_samples in zip(payload_infos, samples):
+            data = struct.pack(f"{endian}{len(payload_samples)}H", *payload_samples)
+            pad = -len(data) % 4
+            data += bytes(pad)
+            payloads += struct.pack(f"{endian}II", len(data) // 4 + 1, (info << 16) | (pad << 14) | (0x05 << 8)) + data
+
+    body = sib + payloads
+    header = struct.pack(f"{endian}II", len(body) // 4 + 1, (roc_id << 16) | (0x10 << 8) | stream_status)
+    return header + body
+
+
+class TestStreamInfoBank:
+    """Tests for parsing the Stream Info Bank of a ROC Time Slice Bank."""
+
+    def test_recorded_event(self, fadc250_streaming_event):
+        """The ROC Time Slice Bank of a recorded streaming event parses."""
+        bank = RocTimeSliceBank(fadc250_streaming_event, 40, '>')
+        assert bank.stream_status == 0x11
+        assert bank.sib.frame_number == 0x34490
+        assert bank.sib.timestamp == 0x0000000344900000
+        assert bank.sib.payload_infos['raw'].tolist() == [0]
+
+        # The payload spans its length + 1 words and keeps its last data word
+        assert bank.payload_offsets.tolist() == [80]
+        payload = bank.payload_banks[0]
+        assert payload.num_samples == 4
+        assert struct.unpack(">2I", payload.get_data()) == (0x4d1e0b51, 0x4d2d2cb4)
+        assert bank.get_payload_data(0).view('>u4').tolist() == [0x4d1e0b51, 0x4d2d2cb4]
+
+    def test_decode_time_slice_headers(self, fadc250_streaming_event):
+        """The vectorized header decoding matches the parsed Stream Info Bank."""
+        words = np.frombuffer(fadc250_streaming_event, dtype='>u4')
+        # Only the ROC bank (word 10) is a time slice, the event itself (word 0) is not
+        headers = decode_time_slice_headers(words, np.array([0, 10]), np.array([24, 24]))
+        bank = RocTimeSliceBank(fadc250_streaming_event, 40, '>')
+
+        assert headers['event'].tolist() == [1]
+        assert headers['frame_number'][0] == bank.sib.frame_number
+        assert headers['timestamp'][0] == bank.sib.timestamp
+        assert headers['stream_status'][0] == bank.stream_status
+        assert headers['payload_count'][0] == len(bank.sib.payload_infos)
+        assert headers['payload_offset'][0] == bank.payload_offsets[0] - 40
+
+    def test_empty_payload(self, empty_streaming_event):
+        """A payload bank without data words has no samples."""
+        bank = RocTimeSliceBank(empty_streaming_event, 40, '>')
+        assert bank.sib.frame_number == 0x34491
+        assert len(bank.payload_banks) == 1
+        assert bank.payload_banks[0].num_samples == 0
+        assert len(bank.get_payload_data(0)) == 0
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    @pytest.mark.parametrize("count", [0, 1, 3, 4])
+    def test_payload_infos(self, endian, count):
+        """Payload infos decode in data order into a structured array."""
+        infos = [(0x0A << 8) | 0x80 | (2 << 5) | i for i in range(count)]
+        data = make_roc_time_slice_bank(infos, endian=endian)
+
+        sib = StreamInfoBank(data, 8, endian)
+        assert sib.payload_infos['raw'].tolist() == infos
+        assert sib.payload_infos['port_num'].tolist() == list(range(count))
+        assert np.all(sib.payload_infos['module_id'] == 0x0A)
+        assert np.all(sib.payload_infos['bond'])
+        assert np.all(sib.payload_infos['lane_id'] == 2)
+
+        bank = RocTimeSliceBank(data, 0, endian)
+        assert len(bank.payload_banks) == count
+        assert [payload.tag for payload in bank.payload_banks] == infos
+
+    def test_decode_payload_infos(self):
+        """Payload info fields are extracted from every word."""
+        infos = decode_payload_infos(np.array([0x0F7F, 0x0123], dtype=np.uint16))
+        assert infos['module_id'].tolist() == [0xF, 0x1]
+        assert infos['bond'].tolist() == [False, False]
+        assert infos['lane_id'].tolist() == [3, 1]
+        assert infos['port_num'].tolist() == [0x1F, 0x03]
+
+
+class TestPayloadLayout:
+    """Tests for payload banks with an explicit waveform layout."""
+
+    def test_payloads_are_lazy(self):
+        """Payload banks are only located when the ROC bank is parsed."""
+        bank = RocTimeSliceBank(make_roc_time_slice_bank([1, 2, 3]), 0, '>')
+        assert len(bank.payload_offsets) == 3
+        assert bank._payload_banks is None
+
+        assert [payload.offset for payload in bank.payload_banks] == bank.payload_offsets.tolist()
+        assert bank.payload_banks[2].payload_info['raw'] == 3
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    @pytest.mark.parametrize("interleaved", [False, True])
+    def test_gathered_payloads(self, endian, interleaved):
+        """Payloads sharing a layout are gathered into one (payloads, channels, samples) array."""
+        # Sample value = 1000 * payload + 100 * channel + sample
+        expected = np.array([[[1000 * p + 100 * c + s for s in range(5)] for c in range(3)] for p in range(4)])
+        stored = expected.transpose(0, 2, 1) if interleaved else expected
+        samples = [payload.ravel().tolist() for payload in stored]
+        # Module 0xA for all payloads
+        data = make_roc_time_slice_bank([0x0A00 | i for i in range(4)], endian=endian, samples=samples)
+
+        layout = PayloadLayout(3, 5, interleaved)
+        for layouts in (layout, {0xA: layout}):
+            bank = RocTimeSliceBank(data, 0, endian, layouts)
+            waveforms = bank.get_all_data_numpy()
+            assert waveforms.shape == (4, 3, 5) and waveforms.dtype == np.uint16
+            assert waveforms.tolist() == expected.tolist()
+            assert bank.payload_banks[1].to_numpy().tolist() == expected[1].tolist()
+
+    def test_unconfigured_modules(self):
+        """Payloads without a configured layout are returned one by one with a guessed layout."""
+        samples = [list(range(200)), list(range(4))]
+        data = make_roc_time_slice_bank([0x0100, 0x0200], samples=samples)
+
+        bank = RocTimeSliceBank(data, 0, '>', {0x1: PayloadLayout(2, 100)})
+        payloads = bank.get_all_data_numpy()
+        assert isinstance(payloads, list)
+        assert payloads[0].shape == (2, 100)
+        assert bank.payload_banks[1].layout == PayloadLayout(1, 4)
+
+    def test_payload_too_short(self):
+        """A layout larger than the payload is rejected."""
+        data = make_roc_time_slice_bank([0x0100], samples=[list(range(4))])
+        bank = RocTimeSliceBank(data, 0, '>', PayloadLayout(2, 4))
+        with pytest.raises(ValueError):
+            bank.get_all_data_numpy()
+
+    @pytest.mark.parametrize("interleaved", [False, True])
+    def test_waveform_data(self, interleaved):
+        """Channel waveforms are strided views following the layout."""
+        waveforms = np.arange(12).reshape(3, 4)
+        stored = waveforms.T if interleaved else waveforms
+        data = make_roc_time_slice_bank([0x0100], samples=[stored.ravel().tolist()])
+        bank = RocTimeSliceBank(data, 0, '>', PayloadLayout(3, 4, interleaved))
+
+        assert bank.get_payload_data(0).tolist() == stored.ravel().tolist()
+        assert bank.get_payload_data(0, channel=2).tolist() == [8, 9, 10, 11]
+        with pytest.raises(ValueError):
+            bank.get_payload_data(0, channel=3)
+
+    def test_guessed_layout_keeps_stride(self):
+        """Without a configured layout, a channel is de-interleaved with the guessed channel count."""
+        data = make_roc_time_slice_bank([0x0100], samples=[list(range(200))])
+        payload = RocTimeSliceBank(data, 0, '>').payload_banks[0]
+        assert payload.get_waveform_data(1).tolist() == list(range(1, 200, 2))
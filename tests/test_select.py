@@ -0,0 +1,79 @@
+import struct
+
+import numpy as np
+import pytest
+
+from pyevio.evio_file import EvioFile
+
+from conftest import bank_words, make_event, make_file, make_record, nested_event
+
+
+class TestSelect:
+    """Tests for tag-path queries across a file."""
+
+    def test_select_leaf_banks(self, write_file):
+        """Matching leaf payloads are gathered into a jagged result in file order."""
+        other = make_event(0xFF50, bank_words(make_event(0x0001, [99], data_type=0x1)))
+        records = [
+            (make_record([nested_event(), other]), 2),
+            (make_record([nested_event(), nested_event()], compression=1), 2),
+        ]
+        path = write_file(make_file(records))
+
+        with EvioFile(path) as evio_file:
+            selection = evio_file.select("0xFF31/0x0001")
+            assert len(selection) == 3
+            assert selection.event_index.tolist() == [0, 2, 3]
+            assert selection.counts.tolist() == [2, 2, 2]
+            assert selection[1].tolist() == [10, 11]
+            assert selection.data.tolist() == [10, 11] * 3
+
+            # Alternatives and wildcards at each level
+            selection = evio_file.select("0xFF31|0xFF50/*/2")
+            assert selection.event_index.tolist() == [0, 2, 3]
+            assert selection.tags.tolist() == [0x0002] * 3
+            assert selection.data.tolist() == [20] * 3
+
+            selection = evio_file.select("0xFF50|0xFF31/0x0001")
+            assert selection.event_index.tolist() == [0, 1, 2, 3]
+            assert selection[1].tolist() == [99]
+
+    def test_select_no_match_and_mixed_types(self, write_file):
+        """Queries without matches are empty, mixed data types need an explicit dtype."""
+        path = write_file(make_file([(make_record([nested_event()]), 1)]))
+
+        with EvioFile(path) as evio_file:
+            assert len(evio_file.select("0xFF60/*")) == 0
+            with pytest.raises(ValueError):
+                evio_file.select("0xFF31/*")
+            assert evio_file.select("0xFF31/*", dtype=np.uint32).counts.tolist() == [2, 3]
+            with pytest.raises(ValueError):
+                evio_file.select("0xFF31//1")
+
+    def test_select_types_differ_between_records(self, write_file):
+        """The data type of the matched banks is checked in every record, not only the first."""
+        records = [
+            (make_record([make_event(0xFF50, bank_words(make_event(0x0001, [1], data_type=0x1)))]), 1),
+            (make_record([make_event(0xFF50, bank_words(make_event(0x0001, [2], data_type=0xb)))]), 1),
+        ]
+        path = write_file(make_file(records))
+
+        with EvioFile(path) as evio_file:
+            with pytest.raises(ValueError):
+                evio_file.select("0xFF50/0x0001")
+            assert evio_file.select("0xFF50/0x0001", dtype=np.uint32).data.tolist() == [1, 2]
+
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_select_misaligned_doubles(self, write_file, endian):
+        """8-byte payloads that are only 4-byte aligned in the record are read from the right bytes."""
+        doubles = bank_words(struct.pack(f"{endian}2d", 1.5, 2.5), endian)
+        event = make_event(0xFF60, bank_words(make_event(0x0002, [7], endian, data_type=0x1), endian)
+                           + bank_words(make_event(0x0001, doubles, endian, data_type=0x8), endian), endian)
+        path = write_file(make_file([(make_record([event, event], endian=endian), 2)], endian=endian))
+
+        with EvioFile(path) as evio_file:
+            selection = evio_file.select("0xFF60/1")
+            assert selection.data.tolist() == [1.5, 2.5, 1.5, 2.5]
+            table = evio_file.get_event(0).get_bank_table()
+            assert selection[0].tolist() == table.to_numpy(2).tolist()
@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+import pytest
+
+from pyevio.evio_file import EvioFile
+from pyevio.file_index import FileIndex
+from pyevio.roc_time_slice_bank import PayloadLayout, RocTimeSliceBank
+
+from conftest import make_event, make_file, make_record, time_slice_event
+
+
+class TestTimeSliceTable:
+    """Tests for the columnar time-slice table."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    def test_time_slice_table(self, write_file, endian):
+        """Only ROC Time Slice Bank events get a row, with their TSS and AIS fields."""
+        records = []
+        for r in range(2):
+            events = [time_slice_event(10 * r + i, (1 << 40) + 1000 * i, list(range(i + 1)), endian)
+                      for i in range(3)]
+            events.insert(1, make_event(0xFF50, [r, 0, 0], endian))
+            records.append((make_record(events, record_number=r + 1, endian=endian), len(events)))
+        path = write_file(make_file(records, endian=endian))
+
+        with EvioFile(path) as evio_file:
+            table = evio_file.time_slice_table()
+
+            assert table['event'].tolist() == [0, 2, 3, 4, 6, 7]
+            assert table['frame_number'].tolist() == [0, 1, 2, 10, 11, 12]
+            assert table['timestamp'].tolist() == [(1 << 40) + 1000 * i for i in range(3)] * 2
+            assert table['stream_status'].tolist() == [0x11] * 6
+            assert table['payload_count'].tolist() == [1, 2, 3] * 2
+
+            # Agrees with the fully parsed banks
+            for row in table:
+                bank = evio_file.get_event(int(row['event'])).get_bank()
+                assert bank.sib.frame_number == row['frame_number']
+                assert bank.sib.timestamp == row['timestamp']
+                assert len(bank.sib.payload_infos) == row['payload_count']
+                assert bank.payload_banks[0].offset - bank.offset == row['payload_offset']
+
+    def test_sidecar_cache(self, write_file):
+        """The table is stored in the sidecar index and used on reopen."""
+        events = [time_slice_event(i, i, [1, 2]) for i in range(4)]
+        path = write_file(make_file([(make_record(events), len(events))]))
+
+        with EvioFile(path) as evio_file:
+            expected = evio_file.build_index(time_slices=True).time_slices
+
+        try:
+            with EvioFile(path, index="auto") as evio_file:
+                assert evio_file.file_index.time_slices is not None
+                assert np.array_equal(evio_file.time_slice_table(), expected)
+                assert evio_file.time_slice_table()['frame_number'].tolist() == [0, 1, 2, 3]
+        finally:
+            os.unlink(FileIndex.default_path(path))
+
+
+class TestExtractWaveforms:
+    """Tests for extracting one channel's waveforms from many time slices."""
+
+    @pytest.mark.parametrize("endian", ['<', '>'])
+    @pytest.mark.parametrize("interleaved", [False, True])
+    def test_extract_waveforms(self, write_file, endian, interleaved):
+        """Waveforms of one module and channel are gathered across records."""
+        layout = PayloadLayout(2, 6, interleaved)
+
+        def payload_samples(event, module):
+            # Sample value = 100 * event + 10 * module + channel, plus the sample index in the high byte
+            waveforms = np.array([[100 * event + 10 * module + c + (s << 8) for s in range(6)] for c in range(2)])
+            return (waveforms.T if interleaved else waveforms).ravel().tolist()
+
+        records = []
+        for r in range(3):
+            events = []
+            for i in range(2):
+                event = 3 * r + len(events)
+                modules = [1, 2] if event % 4 else [2]
+                events.append(time_slice_event(event, event, [m << 8 for m in modules], endian,
+                                               samples=[payload_samples(event, m) for m in modules]))
+            events.append(make_event(0xFF50, [r], endian))
+            records.append((make_record(events, record_number=r + 1, endian=endian), len(events)))
+        path = write_file(make_file(records, endian=endian))
+
+        with EvioFile(path) as evio_file:
+            waveforms, event_index = evio_file.extract_waveforms(module_id=1, channel=1, layout=layout,
+                                                                 return_index=True)
+            assert event_index.tolist() == [1, 3, 6, 7]
+            assert waveforms.dtype == np.uint16
+            assert waveforms.tolist() == [[100 * e + 11 + (s << 8) for s in range(6)] for e in [1, 3, 6, 7]]
+
+            # The same rows as the per-payload views
+            bank = RocTimeSliceBank(evio_file.mm, evio_file.get_event(3).offset, endian, layout)
+            assert bank.payload_banks[0].get_waveform_data(1).tolist() == waveforms[1].tolist()
+
+            selected = evio_file.extract_waveforms(module_id=2, channel=0, layout=layout, events=[0, 4, 5])
+            assert selected[:, 0].tolist() == [20, 420]
+
+            assert evio_file.extract_waveforms(module_id=7, channel=0, layout=layout).shape == (0, 6)
+            with pytest.raises(ValueError):
+                evio_file.extract_waveforms(module_id=1, channel=2, layout=layout)
+
+    def test_recorded_payload(self, write_file, fadc250_streaming_event):
+        """The samples of a recorded payload are extracted up to its last data word."""
+        # The ROC Time Slice Bank of the recorded event, as an event of its own
+        roc_bank = fadc250_streaming_event[40:]
+        path = write_file(make_file([(make_record([roc_bank], endian='>'), 1)], endian='>'))
+
+        with EvioFile(path) as evio_file:
+            waveforms = evio_file.extract_waveforms(module_id=0, channel=0)
+            assert waveforms.tolist() == [[0x4d1e, 0x0b51, 0x4d2d, 0x2cb4]]
+            assert len(evio_file.extract_waveforms(module_id=0, channel=0, port_num=1)) == 0